@@ -14,6 +14,7 @@ The application includes:
 - Graceful startup and shutdown handling
 """
 
+import functools
 import logging
 import os
 import sys
@@ -93,10 +94,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             logger.error(f"Error during shutdown: {e}")
 
 
+@functools.lru_cache(maxsize=1)
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application.
 
+    The app is built once per process: the lifespan handler starts the global
+    runtime, so a second build would replace that runtime under the app already
+    being served. Later calls return the same instance; use
+    ``create_app.cache_clear()`` to force a rebuild.
+
     Returns:
         Configured FastAPI application instance.
     """
@@ -46,8 +46,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
         request.state.request_id = request_id
 
-        # Record request start time
-        start_time = time.time()
+        # Record request start time (monotonic, unaffected by wall-clock adjustments)
+        start_time = time.perf_counter()
 
         # Get request details
         client_ip = self._get_client_ip(request)
@@ -109,7 +109,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             )
 
         # Calculate request duration
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         # Add response headers
         if response:
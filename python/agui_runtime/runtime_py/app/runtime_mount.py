@@ -8,24 +8,33 @@ middleware integration, and development tooling.
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
 from typing import TYPE_CHECKING, Any
 
+# Request and Response are resolved at runtime by FastAPI's dependency injection
+# of the GraphQL context_getter, so they cannot be TYPE_CHECKING-only imports
+from fastapi import Request, Response  # noqa: TC002
 from fastapi.responses import HTMLResponse
 from strawberry.fastapi import BaseContext, GraphQLRouter
 
+from agui_runtime.runtime_py.graphql.context import GraphQLExecutionContext
 from agui_runtime.runtime_py.graphql.schema import schema
 
 if TYPE_CHECKING:
-    from fastapi import FastAPI, Request, Response
+    from fastapi import FastAPI
 
     from agui_runtime.runtime_py.core.runtime import CopilotRuntime
 
 
-class GraphQLContext(BaseContext):
+class GraphQLContext(BaseContext, GraphQLExecutionContext):
     """
     GraphQL execution context containing runtime and request information.
 
+    Extends GraphQLExecutionContext so the schema resolvers get correlation
+    IDs and performance timers when served through the FastAPI router.
+
     This context is injected into all GraphQL resolvers, providing access to:
     - CopilotRuntime instance for agent operations
     - FastAPI Request object for HTTP context
@@ -47,14 +56,19 @@ class GraphQLContext(BaseContext):
             request: FastAPI Request object
             response: FastAPI Response object
         """
-        super().__init__()
-        self.runtime = runtime
-        self.request = request
+        BaseContext.__init__(self)
+        request_id = getattr(request.state, "request_id", None)
+        GraphQLExecutionContext.__init__(
+            self,
+            runtime,
+            request,
+            correlation_id=request_id if isinstance(request_id, str) else None,
+        )
         self.response = response
         self.logger = logging.getLogger(f"{__name__}.GraphQLContext")
 
         # Request metadata
-        self.request_id = getattr(request.state, "request_id", None)
+        self.request_id = request_id
         self.user_id = None  # Will be populated by auth middleware in later phases
         self.trace_id = None  # Will be populated by tracing middleware
 
@@ -69,7 +83,12 @@ class GraphQLContext(BaseContext):
         """Get the User-Agent header from the request."""
         return self.request.headers.get("User-Agent", "unknown")
 
-    def log_operation(self, operation_name: str, operation_type: str) -> None:
+    def log_operation(
+        self,
+        operation_name: str,
+        operation_type: str,
+        details: dict[str, Any] | None = None,
+    ) -> None:
         """Log GraphQL operation execution."""
         # Get logger fresh each time to support test mocking
         logger = logging.getLogger(f"{__name__}.GraphQLContext")
@@ -82,6 +101,7 @@ class GraphQLContext(BaseContext):
                 "user_agent": self.get_user_agent(),
                 "request_id": self.request_id,
                 "user_id": self.user_id,
+                "operation_details": details,
             },
         )
 
@@ -152,10 +172,13 @@ def create_graphql_router(
     return graphql_router
 
 
+@functools.lru_cache(maxsize=32)
 def get_playground_html(graphql_path: str) -> str:
     """
     Generate custom GraphQL Playground HTML.
 
+    The page only depends on the endpoint path, so it is rendered once per path.
+
     Args:
         graphql_path: The GraphQL endpoint path
 
@@ -357,13 +380,20 @@ def mount_graphql_to_fastapi(
                     "endpoint": path,
                 }
 
-        @app.get(f"{path}/schema")
-        async def graphql_schema() -> dict[str, str]:
+        # The schema never changes after import, so the JSON body is encoded on the
+        # first request and served as-is afterwards
+        schema_body: bytes | None = None
+
+        @app.get(f"{path}/schema", response_model=None)
+        async def graphql_schema() -> Response | dict[str, str]:
             """Get the GraphQL schema SDL."""
+            nonlocal schema_body
             try:
-                from agui_runtime.runtime_py.graphql.schema import get_schema_sdl
+                if schema_body is None:
+                    from agui_runtime.runtime_py.graphql.schema import get_schema_sdl
 
-                return {"schema": get_schema_sdl(), "format": "SDL"}
+                    schema_body = json.dumps({"schema": get_schema_sdl(), "format": "SDL"}).encode()
+                return Response(content=schema_body, media_type="application/json")
             except Exception as e:
                 logger.error(f"Error getting GraphQL schema: {e}")
                 return {"error": str(e), "schema": "", "format": "error"}
@@ -21,7 +21,7 @@ from agui_runtime.runtime_py.core.types import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Sequence
 
 
 class AgentProvider(ABC):
@@ -87,7 +87,7 @@ class AgentProvider(ABC):
         return f"Agent provider for {self.name}"
 
     @abstractmethod
-    async def list_agents(self) -> list[AgentDescriptor]:
+    async def list_agents(self) -> Sequence[AgentDescriptor]:
         """
         List all available agents from this provider.
 
@@ -95,8 +95,11 @@ class AgentProvider(ABC):
         that this provider can execute. The runtime will call this during
         agent discovery to populate the available agents list.
 
+        Callers only iterate the result, so providers with a fixed agent set
+        can return a prebuilt tuple instead of copying it on every call.
+
         Returns:
-            List of agent descriptors available from this provider.
+            Sequence of agent descriptors available from this provider.
 
         Raises:
             ProviderError: If agent discovery fails.
@@ -8,6 +8,7 @@ runtime system via GraphQL.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from typing import Any
@@ -189,24 +190,33 @@ class CopilotRuntime:
         discovered_agents = []
         errors = []
 
-        # Discover agents from all providers
-        for provider_name, provider in self._providers.items():
-            try:
-                provider_agents = await provider.list_agents()
-                for agent in provider_agents:
-                    # Add provider context to agent
-                    agent_key = f"{provider_name}:{agent.name}"
-                    self._agents_cache[agent_key] = agent
-                    discovered_agents.append(agent)
-
-                self.logger.debug(
-                    f"Provider '{provider_name}' contributed {len(provider_agents)} agents"
-                )
+        # Query all providers concurrently; a failing provider doesn't affect the others
+        providers = list(self._providers.items())
+        results = await asyncio.gather(
+            *(provider.list_agents() for _, provider in providers), return_exceptions=True
+        )
 
-            except Exception as e:
-                error_msg = f"Error discovering agents from provider '{provider_name}': {e}"
+        for (provider_name, _), provider_agents in zip(providers, results, strict=True):
+            if isinstance(provider_agents, Exception):
+                error_msg = (
+                    f"Error discovering agents from provider '{provider_name}': {provider_agents}"
+                )
                 self.logger.error(error_msg)
                 errors.append(error_msg)
+                continue
+            if isinstance(provider_agents, BaseException):
+                # Cancellation and interpreter exits are not provider errors
+                raise provider_agents
+
+            for agent in provider_agents:
+                # Add provider context to agent
+                agent_key = f"{provider_name}:{agent.name}"
+                self._agents_cache[agent_key] = agent
+                discovered_agents.append(agent)
+
+            self.logger.debug(
+                f"Provider '{provider_name}' contributed {len(provider_agents)} agents"
+            )
 
         self._cache_dirty = False
 
@@ -222,6 +232,8 @@ class CopilotRuntime:
         app: FastAPI,
         path: str = "/api/copilotkit",
         include_graphql_playground: bool = True,
+        *,
+        minimal: bool = False,
     ) -> None:
         """
         Mount the CopilotRuntime to an existing FastAPI application.
@@ -230,6 +242,9 @@ class CopilotRuntime:
             app: The FastAPI application to mount to.
             path: The path prefix for mounting (default: "/api/copilotkit").
             include_graphql_playground: Whether to include GraphQL playground.
+            minimal: Only mount the health endpoint, skipping the middleware
+                stack, the info endpoint and GraphQL. Intended for tests and
+                liveness-only deployments; serving code should keep the default.
         """
         if self._mounted_app is not None:
             raise RuntimeError("Runtime is already mounted to a FastAPI app")
@@ -238,7 +253,8 @@ class CopilotRuntime:
         self._mount_path = path.rstrip("/")
 
         # Setup comprehensive middleware stack
-        self._setup_middleware_stack(app)
+        if not minimal:
+            self._setup_middleware_stack(app)
 
         # Add health check endpoint
         @app.get(f"{self._mount_path}/health")
@@ -254,6 +270,12 @@ class CopilotRuntime:
                 },
             }
 
+        if minimal:
+            self.logger.info(
+                f"Runtime mounted to FastAPI app at path: {self._mount_path} (minimal)"
+            )
+            return
+
         # Add basic info endpoint
         @app.get(f"{self._mount_path}/info")
         async def runtime_info() -> dict[str, Any]:
@@ -471,9 +493,9 @@ class CopilotRuntime:
         Returns:
             Stored state with metadata
         """
-        await self._ensure_state_store()
+        state_store_manager = await self._ensure_state_store()
 
-        return await self._state_store_manager.save_agent_state(
+        return await state_store_manager.save_agent_state(
             thread_id, agent_name, state_data, merge_with_existing
         )
 
@@ -492,9 +514,26 @@ class CopilotRuntime:
         Returns:
             Stored state or None if not found
         """
-        await self._ensure_state_store()
+        state_store_manager = await self._ensure_state_store()
 
-        return await self._state_store_manager.load_agent_state(thread_id, agent_name)
+        return await state_store_manager.load_agent_state(thread_id, agent_name)
+
+    async def load_agent_states(
+        self,
+        requests: list[tuple[ThreadId, AgentName]],
+    ) -> list[StoredState | None]:
+        """
+        Load several agent states in one state store call.
+
+        Args:
+            requests: (thread_id, agent_name) tuples
+
+        Returns:
+            Stored state or None for each request, in order
+        """
+        state_store_manager = await self._ensure_state_store()
+
+        return await state_store_manager.bulk_load_states(requests)
 
     async def delete_agent_state(
         self,
@@ -511,9 +550,9 @@ class CopilotRuntime:
         Returns:
             True if state was deleted, False if not found
         """
-        await self._ensure_state_store()
+        state_store_manager = await self._ensure_state_store()
 
-        return await self._state_store_manager.delete_agent_state(thread_id, agent_name)
+        return await state_store_manager.delete_agent_state(thread_id, agent_name)
 
     async def clear_thread_state(self, thread_id: ThreadId) -> int:
         """
@@ -525,9 +564,9 @@ class CopilotRuntime:
         Returns:
             Number of state entries deleted
         """
-        await self._ensure_state_store()
+        state_store_manager = await self._ensure_state_store()
 
-        return await self._state_store_manager.clear_thread_state(thread_id)
+        return await state_store_manager.clear_thread_state(thread_id)
 
     # Request Lifecycle Management
 
@@ -656,6 +695,8 @@ class CopilotRuntime:
                     connection_string=self.config.redis_url or self.config.database_url,
                     max_size_mb=100,  # Default 100MB
                     default_ttl_seconds=3600,  # 1 hour default
+                    codec=self.config.state_codec,
+                    trust_pickle=self.config.trust_pickle,
                 )
 
                 self._state_store_manager = StateStoreManager(config=state_config)
@@ -679,10 +720,12 @@ class CopilotRuntime:
             except Exception as fallback_error:
                 self.logger.error(f"Failed to initialize fallback state store: {fallback_error}")
 
-    async def _ensure_state_store(self) -> None:
-        """Ensure state store is initialized."""
+    async def _ensure_state_store(self) -> StateStoreManager:
+        """Ensure state store is initialized and return its manager."""
         if not self._state_store_initialized:
             await self._initialize_state_store()
 
         if not self._state_store_manager:
             raise RuntimeError("State store manager is not available")
+
+        return self._state_store_manager
@@ -205,6 +205,13 @@ class RuntimeConfig(BaseModel):
     cors_origins: list[str] = Field(
         default_factory=lambda: ["*"], description="CORS allowed origins"
     )
+    state_codec: str | None = Field(
+        default=None, description="Agent state codec (json, msgpack, msgpack-zstd, pickle)"
+    )
+    trust_pickle: bool = Field(
+        default=False,
+        description="Allow the pickle state codec; only enable when all workers are trusted",
+    )
 
     # Performance settings
     max_concurrent_requests: int = Field(default=100, description="Maximum concurrent requests")
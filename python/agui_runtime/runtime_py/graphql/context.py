@@ -13,8 +13,13 @@ import logging
 import uuid
 from typing import TYPE_CHECKING, Any
 
+from strawberry.dataloader import DataLoader
+
+from agui_runtime.runtime_py.storage import StorageError, validate_agent_name, validate_thread_id
+
 if TYPE_CHECKING:
     from agui_runtime.runtime_py.core.runtime import CopilotRuntime
+    from agui_runtime.runtime_py.storage import StoredState
 
 
 class GraphQLExecutionContext:
@@ -70,6 +75,50 @@ class GraphQLExecutionContext:
         self.is_authenticated = user_id is not None
         self.request_metadata: dict[str, Any] = {}
 
+        # Per-request loaders, created on first use
+        self._state_loader: DataLoader[tuple[str, str], StoredState | None] | None = None
+
+    @property
+    def state_loader(self) -> DataLoader[tuple[str, str], StoredState | None]:
+        """
+        Loader batching agent state reads for this request.
+
+        Keys are (thread_id, agent_name) tuples. Loads issued while resolving
+        the same request, such as several aliased loadAgentState fields, are
+        fetched with one runtime.load_agent_states call. Results are not
+        cached, so a load after a save in the same request sees the new state.
+        """
+        if self._state_loader is None:
+            self._state_loader = DataLoader(load_fn=self._load_states, cache=False)
+        return self._state_loader
+
+    async def _load_states(
+        self, keys: list[tuple[str, str]]
+    ) -> list[StoredState | None | BaseException]:
+        """
+        Batch function for state_loader.
+
+        Keys are validated one by one so an invalid key fails only its own
+        load; the valid ones are fetched together.
+        """
+        results: list[StoredState | None | BaseException] = []
+        valid_indexes = []
+        for index, (thread_id, agent_name) in enumerate(keys):
+            if not validate_thread_id(thread_id):
+                results.append(StorageError(f"Invalid thread ID: {thread_id}"))
+            elif not validate_agent_name(agent_name):
+                results.append(StorageError(f"Invalid agent name: {agent_name}"))
+            else:
+                results.append(None)
+                valid_indexes.append(index)
+
+        if valid_indexes:
+            loaded = await self.runtime.load_agent_states([keys[i] for i in valid_indexes])
+            for index, stored_state in zip(valid_indexes, loaded, strict=True):
+                results[index] = stored_state
+
+        return results
+
     def log_operation(
         self,
         operation_name: str,
@@ -9,11 +9,14 @@ all types, enums, queries, and mutations required for frontend integration.
 from __future__ import annotations
 
 import datetime
+import functools
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 import strawberry
 from strawberry import printer
+from strawberry.extensions import ParserCache, ValidationCache
+from strawberry.schema.config import StrawberryConfig
 from strawberry.types import Info
 
 if TYPE_CHECKING:
@@ -26,7 +29,7 @@ from agui_runtime.runtime_py.graphql.errors import (
     create_error_response,
     handle_resolver_exception,
 )
-from agui_runtime.runtime_py.storage import serialize_state
+from agui_runtime.runtime_py.storage import deserialize_state, serialize_state
 
 
 # GraphQL Enums (matching TypeScript schema exactly)
@@ -469,8 +472,8 @@ class Query:
                 },
             )
 
-            # Load state from runtime
-            stored_state = await context.runtime.load_agent_state(data.thread_id, data.agent_name)
+            # Load state through the request's batching loader
+            stored_state = await context.state_loader.load((data.thread_id, data.agent_name))
 
             if stored_state:
                 return LoadAgentStateResponse(
@@ -663,12 +666,10 @@ class Mutation:
                 },
             )
 
-            # Parse state data from JSON
-            import json
-
+            # Parse state data from JSON (must be an object)
             try:
-                state_data = json.loads(data.state_data)
-            except json.JSONDecodeError as e:
+                state_data = deserialize_state(data.state_data)
+            except ValueError as e:
                 return SaveAgentStateResponse(
                     thread_id=data.thread_id,
                     agent_name=data.agent_name,
@@ -708,18 +709,43 @@ class Mutation:
             context.end_performance_timer("save_agent_state")
 
 
+# Number of distinct query documents whose parse/validation results are cached
+DOCUMENT_CACHE_SIZE = 256
+
+# Upper bound on operations accepted in one batched (JSON array) request
+MAX_BATCH_OPERATIONS = 10
+
+# Batched requests run their operations concurrently behind a single pass through
+# the HTTP middleware stack. Strawberry releases without batching_config reject the
+# option, so those fall back to serving single operations only.
+try:
+    _schema_config = StrawberryConfig(batching_config={"max_operations": MAX_BATCH_OPERATIONS})
+except TypeError:
+    _schema_config = StrawberryConfig()
+
 # Create the GraphQL Schema
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
+    config=_schema_config,
+    # Clients send the same few query strings repeatedly; parse and validate
+    # each distinct document once instead of on every request
+    extensions=[
+        ParserCache(maxsize=DOCUMENT_CACHE_SIZE),
+        ValidationCache(maxsize=DOCUMENT_CACHE_SIZE),
+    ],
 )
 
 
 # Schema introspection helpers
+@functools.lru_cache(maxsize=1)
 def get_schema_sdl() -> str:
     """
     Get the Schema Definition Language (SDL) representation of the schema.
 
+    The schema is built once at import and never changes, so the SDL is
+    printed on first use and cached.
+
     Returns:
         SDL string representation of the GraphQL schema.
     """
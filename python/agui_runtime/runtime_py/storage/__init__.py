@@ -11,7 +11,7 @@ Supported Backends:
 - PostgreSQL: Persistent relational database storage
 
 Key Components:
-- StorageBackend: Abstract interface for storage implementations
+- StorageBackend: Protocol describing storage implementations
 - MemoryStorage: In-memory storage backend
 - RedisStorage: Redis-based distributed storage
 - PostgreSQLStorage: Database-backed persistent storage
@@ -43,8 +43,36 @@ Configuration:
 """
 
 import json
+import math
+import pickle
+import struct
+import sys
+import threading
+from collections.abc import Callable, Sequence
+from importlib import import_module
 from typing import Any
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _HAS_ORJSON = False
+
+try:
+    import msgspec
+
+    _HAS_MSGSPEC = True
+except ImportError:  # pragma: no cover - msgspec is an optional speedup
+    _HAS_MSGSPEC = False
+
+try:
+    import zstandard
+
+    _HAS_ZSTD = True
+except ImportError:  # pragma: no cover - zstandard is an optional speedup
+    _HAS_ZSTD = False
+
 # Import all base interfaces and implementations
 from .base import (
     AgentName,
@@ -77,6 +105,32 @@ from .memory import (
 
 __version__ = "0.1.0"
 
+# Storage key prefixes
+_STATE_PREFIX = "copilotkit:state:"
+_THREAD_PREFIX = "copilotkit:thread:"
+
+# MessagePack framing: 4-byte big-endian payload length followed by the payload
+_MSGPACK_HEADER = struct.Struct(">I")
+if _HAS_MSGSPEC:
+    # Typed decoder: parses and checks the top-level object shape in one pass
+    _STATE_JSON_DECODER = msgspec.json.Decoder(dict[str, Any])
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder(enc_hook=str)
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder(dict)
+
+# Compressed msgpack framing: a 1-byte flag followed by a msgpack frame that is
+# zstd-compressed only when it is larger than the threshold
+COMPRESSION_THRESHOLD_BYTES = 4096
+_FLAG_MSGPACK_RAW = 0x00
+_FLAG_MSGPACK_ZSTD = 0x01
+_ZSTD_LEVEL = 3
+
+# zstd (de)compressor instances must not be shared between threads
+_zstd_local = threading.local()
+
+# Pickle framing: buffer count, per-buffer lengths, buffers, then the main stream
+_PICKLE_COUNT = struct.Struct(">I")
+_PICKLE_LENGTH = struct.Struct(">Q")
+
 # Storage backend registry for dynamic loading
 STORAGE_BACKENDS: dict[str, str] = {
     "memory": "agui_runtime.runtime_py.storage.memory:MemoryStateStore",
@@ -85,6 +139,52 @@ STORAGE_BACKENDS: dict[str, str] = {
     # "postgresql": "agui_runtime.runtime_py.storage.postgresql:PostgreSQLStateStore",
 }
 
+# Resolved backend classes keyed by import path
+_BACKEND_CACHE: dict[str, type[StateStore]] = {}
+
+
+def _cached_import(module_name: str, class_name: str) -> Any:
+    """
+    Resolve an attribute from a module, importing the module only if needed.
+
+    Args:
+        module_name: Dotted module path
+        class_name: Attribute name to fetch from the module
+
+    Returns:
+        The requested attribute
+    """
+    modules = sys.modules
+    if module_name not in modules:
+        import_module(module_name)
+    return getattr(modules[module_name], class_name)
+
+
+# Exports resolved on first attribute access (PEP 562) so optional backend
+# drivers are only imported by consumers that actually use them
+_LAZY_EXPORTS: dict[str, str] = {
+    # Backends with heavy optional dependencies will be added here
+    # "RedisStateStore": "agui_runtime.runtime_py.storage.redis:RedisStateStore",
+    # "PostgreSQLStateStore": "agui_runtime.runtime_py.storage.postgresql:PostgreSQLStateStore",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily exported names and cache them in the module globals."""
+    import_path = _LAZY_EXPORTS.get(name)
+    if import_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_path, attr_name = import_path.split(":")
+    value = _cached_import(module_path, attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List eagerly and lazily exported names."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 def get_available_backends() -> dict[str, str]:
     """
@@ -96,36 +196,72 @@ def get_available_backends() -> dict[str, str]:
     return STORAGE_BACKENDS.copy()
 
 
-def create_storage_backend(backend_name: str, **config: Any) -> StateStore:
+def get_state_codec(
+    codec_name: str, trust_pickle: bool = False
+) -> tuple[Callable[[dict], bytes], Callable[[bytes], dict[str, Any]]]:
+    """
+    Look up a state codec by name, enforcing the trust_pickle gate.
+
+    Args:
+        codec_name: State codec name (see STATE_CODECS)
+        trust_pickle: Allow codecs in UNSAFE_STATE_CODECS
+
+    Returns:
+        The codec's (serializer, deserializer) pair
+
+    Raises:
+        ValueError: If the codec is unknown or requires trust_pickle
+    """
+    if codec_name not in STATE_CODECS:
+        available = list(STATE_CODECS.keys())
+        raise ValueError(f"State codec '{codec_name}' not available. Available: {available}")
+    if codec_name in UNSAFE_STATE_CODECS and not trust_pickle:
+        raise ValueError(f"State codec '{codec_name}' requires trust_pickle=True")
+    return STATE_CODECS[codec_name]
+
+
+def create_storage_backend(
+    backend_name: str, codec: str | None = None, trust_pickle: bool = False, **config: Any
+) -> StateStore:
     """
     Create a state store backend instance by name.
 
     Args:
         backend_name: Name of the storage backend to create
+        codec: State codec name (see STATE_CODECS); defaults to msgpack
+            for network backends and json otherwise
+        trust_pickle: Allow codecs in UNSAFE_STATE_CODECS; only enable when
+            every reader and writer of the store is trusted
         **config: Configuration parameters for the backend
 
     Returns:
         Initialized state store instance
 
     Raises:
-        ValueError: If backend is not available
+        ValueError: If backend or codec is not available
         ImportError: If backend cannot be imported
     """
     if backend_name not in STORAGE_BACKENDS:
         available = list(STORAGE_BACKENDS.keys())
         raise ValueError(f"Storage backend '{backend_name}' not available. Available: {available}")
 
-    import_path = STORAGE_BACKENDS[backend_name]
-    module_path, class_name = import_path.split(":")
+    codec_name = codec or DEFAULT_BACKEND_CODECS.get(backend_name, "json")
+    state_codec = get_state_codec(codec_name, trust_pickle)
 
-    try:
-        import importlib
+    import_path = STORAGE_BACKENDS[backend_name]
+    backend_class = _BACKEND_CACHE.get(import_path)
+    if backend_class is None:
+        module_path, class_name = import_path.split(":")
+        try:
+            backend_class = _cached_import(module_path, class_name)
+        except (ImportError, AttributeError) as e:
+            raise ImportError(f"Failed to import storage backend '{backend_name}': {e}") from e
+        _BACKEND_CACHE[import_path] = backend_class
 
-        module = importlib.import_module(module_path)
-        backend_class = getattr(module, class_name)
-        return backend_class(**config)  # type: ignore[no-any-return]
-    except (ImportError, AttributeError) as e:
-        raise ImportError(f"Failed to import storage backend '{backend_name}': {e}") from e
+    store: StateStore = backend_class(**config)
+    if codec_name != "json":
+        store.use_codec(*state_codec)
+    return store
 
 
 def create_state_store_manager(backend_type: str = "memory", **config: Any) -> StateStoreManager:
@@ -150,6 +286,84 @@ def create_state_store_manager(backend_type: str = "memory", **config: Any) -> S
 
 
 # Storage utility functions
+def _contains_non_finite(value: Any) -> bool:
+    """Check whether value holds a NaN or infinite float, at any depth."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(
+            _contains_non_finite(key) or _contains_non_finite(item) for key, item in value.items()
+        )
+    if isinstance(value, list | tuple):
+        return any(_contains_non_finite(item) for item in value)
+    return False
+
+
+def serialize_state_bytes(state_data: dict) -> bytes:
+    """
+    Serialize state data to UTF-8 encoded JSON bytes.
+
+    Uses orjson when available and falls back to the stdlib json module for
+    anything orjson would reject or encode differently: integers wider than
+    64 bits and NaN/Infinity, which orjson would silently write as null.
+    Datetimes go through str() either way.
+
+    Args:
+        state_data: Dictionary containing state data
+
+    Returns:
+        Serialized state as UTF-8 JSON bytes
+    """
+    if _HAS_ORJSON:
+        try:
+            state_bytes = orjson.dumps(
+                state_data,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            pass
+        else:
+            # Non-finite floats are the only values orjson turns into null
+            if b"null" not in state_bytes or not _contains_non_finite(state_data):
+                return state_bytes
+    return json.dumps(state_data, default=str, ensure_ascii=False).encode("utf-8")
+
+
+def deserialize_state_bytes(state_bytes: bytes | str) -> dict[str, Any]:
+    """
+    Deserialize state data from UTF-8 encoded JSON bytes.
+
+    Uses msgspec's typed decoder when available. Payloads it rejects are
+    retried with the stdlib json module, which also reads the NaN/Infinity
+    literals and integers wider than 64 bits that serialize_state_bytes can
+    write. orjson is not used here because it reads wide integers as floats.
+
+    Args:
+        state_bytes: Serialized state as bytes or string
+
+    Returns:
+        Deserialized state dictionary
+
+    Raises:
+        ValueError: If JSON is invalid or is not an object
+    """
+    if _HAS_MSGSPEC:
+        try:
+            return _STATE_JSON_DECODER.decode(state_bytes)
+        except msgspec.DecodeError:
+            pass
+
+    try:
+        state_data = json.loads(state_bytes)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid state JSON: {e}") from e
+
+    if not isinstance(state_data, dict):
+        raise ValueError(f"Invalid state JSON: expected object, got {type(state_data).__name__}")
+    return state_data
+
+
 def serialize_state(state_data: dict) -> str:
     """
     Serialize state data for storage.
@@ -160,6 +374,8 @@ def serialize_state(state_data: dict) -> str:
     Returns:
         Serialized state as JSON string
     """
+    if _HAS_ORJSON:
+        return serialize_state_bytes(state_data).decode("utf-8")
     return json.dumps(state_data, default=str, ensure_ascii=False)
 
 
@@ -174,12 +390,260 @@ def deserialize_state(state_json: str) -> dict[str, Any]:
         Deserialized state dictionary
 
     Raises:
-        ValueError: If JSON is invalid
+        ValueError: If JSON is invalid or is not an object
+    """
+    return deserialize_state_bytes(state_json)
+
+
+def serialize_state_msgpack(state_data: dict) -> bytes:
+    """
+    Serialize state data to a length-prefixed MessagePack frame.
+
+    The frame starts with a 4-byte big-endian payload length so the same
+    encoding can be used over a stream or stored as a single blob.
+
+    Args:
+        state_data: Dictionary containing state data
+
+    Returns:
+        Length-prefixed MessagePack bytes
+
+    Raises:
+        ImportError: If msgspec is not installed
+        ValueError: If the state cannot be encoded
     """
+    if not _HAS_MSGSPEC:
+        raise ImportError("msgspec is required for the msgpack state codec")
+
     try:
-        return json.loads(state_json)  # type: ignore[no-any-return]
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid state JSON: {e}") from e
+        payload = _MSGPACK_ENCODER.encode(state_data)
+    except (TypeError, msgspec.EncodeError) as e:
+        raise ValueError(f"Failed to encode state as msgpack: {e}") from e
+    return _MSGPACK_HEADER.pack(len(payload)) + payload
+
+
+def deserialize_state_msgpack(state_bytes: bytes) -> dict[str, Any]:
+    """
+    Deserialize state data from a length-prefixed MessagePack frame.
+
+    Args:
+        state_bytes: Frame produced by serialize_state_msgpack
+
+    Returns:
+        Deserialized state dictionary
+
+    Raises:
+        ImportError: If msgspec is not installed
+        ValueError: If the frame is truncated or the payload is invalid
+    """
+    if not _HAS_MSGSPEC:
+        raise ImportError("msgspec is required for the msgpack state codec")
+
+    header_size = _MSGPACK_HEADER.size
+    if len(state_bytes) < header_size:
+        raise ValueError("Invalid state msgpack: missing length header")
+
+    (length,) = _MSGPACK_HEADER.unpack_from(state_bytes)
+    if len(state_bytes) - header_size != length:
+        raise ValueError(
+            f"Invalid state msgpack: expected {length} payload bytes, "
+            f"got {len(state_bytes) - header_size}"
+        )
+
+    try:
+        return _MSGPACK_DECODER.decode(memoryview(state_bytes)[header_size:])
+    except msgspec.DecodeError as e:
+        raise ValueError(f"Invalid state msgpack: {e}") from e
+
+
+def _get_zstd_compressor() -> Any:
+    """Return this thread's reusable zstd compressor."""
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+    return compressor
+
+
+def _get_zstd_decompressor() -> Any:
+    """Return this thread's reusable zstd decompressor."""
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor
+
+
+def serialize_state_compressed(state_data: dict) -> bytes:
+    """
+    Serialize state data to a msgpack frame, zstd-compressing large payloads.
+
+    The first byte records whether the rest of the blob is a raw msgpack
+    frame or a zstd-compressed one. Frames up to COMPRESSION_THRESHOLD_BYTES
+    are stored raw since compression headers would dominate.
+
+    Args:
+        state_data: Dictionary containing state data
+
+    Returns:
+        Flag byte followed by the (optionally compressed) msgpack frame
+
+    Raises:
+        ImportError: If msgspec or zstandard is not installed
+        ValueError: If the state cannot be encoded
+    """
+    if not _HAS_ZSTD:
+        raise ImportError("zstandard is required for the msgpack-zstd state codec")
+
+    frame = serialize_state_msgpack(state_data)
+    if len(frame) <= COMPRESSION_THRESHOLD_BYTES:
+        return bytes((_FLAG_MSGPACK_RAW,)) + frame
+    compressed: bytes = _get_zstd_compressor().compress(frame)
+    return bytes((_FLAG_MSGPACK_ZSTD,)) + compressed
+
+
+def deserialize_state_compressed(state_bytes: bytes) -> dict[str, Any]:
+    """
+    Deserialize state data produced by serialize_state_compressed.
+
+    Args:
+        state_bytes: Flag byte followed by the (optionally compressed) msgpack frame
+
+    Returns:
+        Deserialized state dictionary
+
+    Raises:
+        ImportError: If msgspec or zstandard is not installed
+        ValueError: If the flag is unknown or the payload is invalid
+    """
+    if not _HAS_ZSTD:
+        raise ImportError("zstandard is required for the msgpack-zstd state codec")
+
+    if not state_bytes:
+        raise ValueError("Invalid compressed state: empty payload")
+
+    flag = state_bytes[0]
+    if flag == _FLAG_MSGPACK_RAW:
+        return deserialize_state_msgpack(state_bytes[1:])
+    if flag == _FLAG_MSGPACK_ZSTD:
+        try:
+            frame = _get_zstd_decompressor().decompress(state_bytes[1:])
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Invalid compressed state: {e}") from e
+        return deserialize_state_msgpack(frame)
+    raise ValueError(f"Invalid compressed state: unknown flag {flag:#04x}")
+
+
+def serialize_state_pickle(state_data: dict) -> tuple[bytes, list[memoryview]]:
+    """
+    Serialize state data with pickle protocol 5 and out-of-band buffers.
+
+    Objects that support out-of-band pickling (such as contiguous numpy
+    arrays) are handed back as separate zero-copy buffers instead of being
+    copied into the main pickle stream.
+
+    Pickle can execute arbitrary code on load, so this must only be used
+    between trusted peers (see RuntimeConfig.trust_pickle).
+
+    Args:
+        state_data: Dictionary containing state data
+
+    Returns:
+        Tuple of the main pickle stream and its out-of-band buffers
+
+    Raises:
+        ValueError: If the state cannot be pickled
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    try:
+        main = pickle.dumps(state_data, protocol=5, buffer_callback=buffers.append)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        raise ValueError(f"Failed to pickle state: {e}") from e
+    return main, [buffer.raw() for buffer in buffers]
+
+
+def deserialize_state_pickle(
+    main: bytes | memoryview, buffers: Sequence[bytes | memoryview] = ()
+) -> dict[str, Any]:
+    """
+    Deserialize state data produced by serialize_state_pickle.
+
+    Args:
+        main: Main pickle stream
+        buffers: Out-of-band buffers, in the order they were produced
+
+    Returns:
+        Deserialized state dictionary
+
+    Raises:
+        ValueError: If the payload is invalid or is not a dictionary
+    """
+    try:
+        state_data = pickle.loads(main, buffers=buffers)  # noqa: S301 - trusted peers only
+    except (pickle.UnpicklingError, EOFError, TypeError, AttributeError, ImportError) as e:
+        raise ValueError(f"Invalid state pickle: {e}") from e
+    if not isinstance(state_data, dict):
+        raise ValueError(f"Invalid state pickle: expected dict, got {type(state_data).__name__}")
+    return state_data
+
+
+def serialize_state_pickle_frame(state_data: dict) -> bytes:
+    """
+    Serialize state data to a single pickle frame for blob storage.
+
+    Layout: 4-byte big-endian buffer count, one 8-byte big-endian length per
+    out-of-band buffer, the buffers themselves, then the main pickle stream.
+    Buffers are stored as raw bytes, so no base64 pass is needed.
+
+    Args:
+        state_data: Dictionary containing state data
+
+    Returns:
+        Framed pickle bytes
+
+    Raises:
+        ValueError: If the state cannot be pickled
+    """
+    main, buffers = serialize_state_pickle(state_data)
+    header = [_PICKLE_COUNT.pack(len(buffers))]
+    header.extend(_PICKLE_LENGTH.pack(buffer.nbytes) for buffer in buffers)
+    return b"".join((*header, *buffers, main))
+
+
+def deserialize_state_pickle_frame(state_bytes: bytes) -> dict[str, Any]:
+    """
+    Deserialize state data produced by serialize_state_pickle_frame.
+
+    Buffers are passed to pickle as views over state_bytes, so large binary
+    fields are not copied again.
+
+    Args:
+        state_bytes: Framed pickle bytes
+
+    Returns:
+        Deserialized state dictionary
+
+    Raises:
+        ValueError: If the frame is truncated or the payload is invalid
+    """
+    view = memoryview(state_bytes)
+    if len(view) < _PICKLE_COUNT.size:
+        raise ValueError("Invalid state pickle: missing buffer count")
+
+    (count,) = _PICKLE_COUNT.unpack_from(view)
+    offset = _PICKLE_COUNT.size
+    if len(view) < offset + count * _PICKLE_LENGTH.size:
+        raise ValueError("Invalid state pickle: truncated buffer table")
+
+    lengths = [
+        _PICKLE_LENGTH.unpack_from(view, offset + i * _PICKLE_LENGTH.size)[0] for i in range(count)
+    ]
+    offset += count * _PICKLE_LENGTH.size
+    buffers: list[memoryview] = []
+    for length in lengths:
+        if len(view) < offset + length:
+            raise ValueError("Invalid state pickle: truncated buffer")
+        buffers.append(view[offset : offset + length])
+        offset += length
+    return deserialize_state_pickle(view[offset:], buffers)
 
 
 def generate_state_key(thread_id: str, agent_name: str) -> str:
@@ -193,7 +657,7 @@ def generate_state_key(thread_id: str, agent_name: str) -> str:
     Returns:
         Standardized storage key
     """
-    return f"copilotkit:state:{thread_id}:{agent_name}"
+    return "".join((_STATE_PREFIX, thread_id, ":", agent_name))
 
 
 def generate_thread_key(thread_id: str) -> str:
@@ -206,7 +670,25 @@ def generate_thread_key(thread_id: str) -> str:
     Returns:
         Standardized storage key for thread data
     """
-    return f"copilotkit:thread:{thread_id}"
+    return _THREAD_PREFIX + thread_id
+
+
+# State codec registry: name -> (serializer, deserializer) operating on bytes
+STATE_CODECS: dict[str, tuple[Callable[[dict], bytes], Callable[[bytes], dict[str, Any]]]] = {
+    "json": (serialize_state_bytes, deserialize_state_bytes),
+    "msgpack": (serialize_state_msgpack, deserialize_state_msgpack),
+    "msgpack-zstd": (serialize_state_compressed, deserialize_state_compressed),
+    "pickle": (serialize_state_pickle_frame, deserialize_state_pickle_frame),
+}
+
+# Codecs that can execute code on load; only usable with trust_pickle=True
+UNSAFE_STATE_CODECS: frozenset[str] = frozenset({"pickle"})
+
+# Default codec per storage backend; backends not listed use "json"
+DEFAULT_BACKEND_CODECS: dict[str, str] = {
+    "redis": "msgpack",
+    "postgresql": "msgpack",
+}
 
 
 # Public API
@@ -238,14 +720,28 @@ __all__ = [
     "StorageBackendType",
     # Utility functions
     "get_available_backends",
+    "get_state_codec",
     "create_storage_backend",
     "create_state_store_manager",
     "serialize_state",
     "deserialize_state",
+    "serialize_state_bytes",
+    "deserialize_state_bytes",
+    "serialize_state_msgpack",
+    "deserialize_state_msgpack",
+    "serialize_state_compressed",
+    "deserialize_state_compressed",
+    "serialize_state_pickle",
+    "deserialize_state_pickle",
+    "serialize_state_pickle_frame",
+    "deserialize_state_pickle_frame",
     "generate_state_key",
     "generate_thread_key",
     "validate_thread_id",
     "validate_agent_name",
-    # Backend registry
+    # Backend and codec registries
     "STORAGE_BACKENDS",
+    "STATE_CODECS",
+    "UNSAFE_STATE_CODECS",
+    "DEFAULT_BACKEND_CODECS",
 ]
@@ -10,8 +10,11 @@ from __future__ import annotations
 
 import abc
 import datetime
-import json
-from typing import Any
+import re
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
 
 # Type aliases for better readability
 StateData = dict[str, Any]
@@ -74,6 +77,8 @@ class StorageBackendUnavailableError(StorageError):
 class StateMetadata:
     """Metadata associated with stored state."""
 
+    __slots__ = ("created_at", "updated_at", "version", "size_bytes", "checksum", "tags")
+
     def __init__(
         self,
         created_at: datetime.datetime,
@@ -117,6 +122,8 @@ class StateMetadata:
 class StoredState:
     """Container for state data with metadata."""
 
+    __slots__ = ("state_key", "data", "metadata")
+
     def __init__(
         self,
         state_key: str,
@@ -145,15 +152,20 @@ class StoredState:
         )
 
 
-class StorageBackend(abc.ABC):
+class StorageBackend(Protocol):
     """
-    Abstract base class for storage backends.
+    Structural interface for storage backends.
 
-    This interface defines the basic operations that any storage backend
-    must implement to be compatible with the CopilotKit runtime.
+    This protocol defines the basic operations that any storage backend
+    must implement to be compatible with the CopilotKit runtime. Backends
+    satisfy it structurally and do not need to inherit from it.
+
+    Backends may also provide the batch methods mget, mset, mdelete and
+    existing_keys. They are optional: stores go through the backend_*
+    helpers, which use them when present and otherwise fall back to one
+    call per key.
     """
 
-    @abc.abstractmethod
     async def get(self, key: str) -> bytes | None:
         """
         Get raw data by key.
@@ -167,9 +179,8 @@ class StorageBackend(abc.ABC):
         Raises:
             StorageError: If retrieval fails
         """
-        pass
+        ...
 
-    @abc.abstractmethod
     async def set(self, key: str, value: bytes, ttl_seconds: int | None = None) -> None:
         """
         Set raw data by key.
@@ -182,9 +193,8 @@ class StorageBackend(abc.ABC):
         Raises:
             StorageError: If storage fails
         """
-        pass
+        ...
 
-    @abc.abstractmethod
     async def delete(self, key: str) -> bool:
         """
         Delete data by key.
@@ -198,9 +208,8 @@ class StorageBackend(abc.ABC):
         Raises:
             StorageError: If deletion fails
         """
-        pass
+        ...
 
-    @abc.abstractmethod
     async def exists(self, key: str) -> bool:
         """
         Check if key exists.
@@ -214,9 +223,8 @@ class StorageBackend(abc.ABC):
         Raises:
             StorageError: If check fails
         """
-        pass
+        ...
 
-    @abc.abstractmethod
     async def list_keys(self, prefix: str = "") -> list[str]:
         """
         List all keys with optional prefix filter.
@@ -230,9 +238,8 @@ class StorageBackend(abc.ABC):
         Raises:
             StorageError: If listing fails
         """
-        pass
+        ...
 
-    @abc.abstractmethod
     async def health_check(self) -> bool:
         """
         Check if storage backend is healthy.
@@ -240,9 +247,8 @@ class StorageBackend(abc.ABC):
         Returns:
             True if healthy, False otherwise
         """
-        pass
+        ...
 
-    @abc.abstractmethod
     async def cleanup(self) -> None:
         """
         Cleanup storage backend resources.
@@ -250,7 +256,7 @@ class StorageBackend(abc.ABC):
         Raises:
             StorageError: If cleanup fails
         """
-        pass
+        ...
 
 
 class StateStore(abc.ABC):
@@ -270,6 +276,30 @@ class StateStore(abc.ABC):
         """
         self.backend = backend
 
+        # Default to the package's JSON codec, which encodes with orjson and
+        # decodes with msgspec when installed. Imported here rather than
+        # at module level because the package imports this module.
+        from . import STATE_CODECS
+
+        self._state_serializer: Callable[[StateData], bytes]
+        self._state_deserializer: Callable[[bytes], StateData]
+        self._state_serializer, self._state_deserializer = STATE_CODECS["json"]
+
+    def use_codec(
+        self,
+        serializer: Callable[[StateData], bytes],
+        deserializer: Callable[[bytes], StateData],
+    ) -> None:
+        """
+        Replace the default JSON encoding with a custom codec.
+
+        Args:
+            serializer: Callable encoding state data to bytes
+            deserializer: Callable decoding bytes back to state data
+        """
+        self._state_serializer = serializer
+        self._state_deserializer = deserializer
+
     @abc.abstractmethod
     async def save_agent_state(
         self,
@@ -409,6 +439,55 @@ class StateStore(abc.ABC):
         """
         pass
 
+    async def save_agent_states(
+        self,
+        states: list[tuple[ThreadId, AgentName, StateData]],
+        merge_with_existing: bool = True,
+    ) -> list[StoredState]:
+        """
+        Save several agent states.
+
+        The default saves each state in turn; stores should override it to
+        batch backend writes through backend_mset.
+
+        Args:
+            states: (thread_id, agent_name, state_data) tuples
+            merge_with_existing: Whether to merge with existing state
+
+        Returns:
+            Stored states, in order; states dropped by store limits are omitted
+
+        Raises:
+            StateStoreError: If save operation fails
+        """
+        return [
+            await self.save_agent_state(thread_id, agent_name, state_data, merge_with_existing)
+            for thread_id, agent_name, state_data in states
+        ]
+
+    async def load_agent_states(
+        self,
+        requests: list[tuple[ThreadId, AgentName]],
+    ) -> list[StoredState | None]:
+        """
+        Load several agent states.
+
+        The default loads each state in turn; stores should override it to
+        batch backend reads through StorageBackend.mget.
+
+        Args:
+            requests: (thread_id, agent_name) tuples
+
+        Returns:
+            Stored state or None for each request, in order
+
+        Raises:
+            StateStoreError: If load operation fails
+        """
+        return [
+            await self.load_agent_state(thread_id, agent_name) for thread_id, agent_name in requests
+        ]
+
     def generate_state_key(self, thread_id: ThreadId, agent_name: AgentName) -> StateKey:
         """
         Generate standardized state key.
@@ -448,8 +527,7 @@ class StateStore(abc.ABC):
             StateCorruptionError: If serialization fails
         """
         try:
-            json_str = json.dumps(state_data, default=str, ensure_ascii=False)
-            return json_str.encode("utf-8")
+            return self._state_serializer(state_data)
         except (TypeError, ValueError) as e:
             raise StateCorruptionError(
                 "serialization", f"Failed to serialize state data: {e}", {"error": str(e)}
@@ -469,9 +547,8 @@ class StateStore(abc.ABC):
             StateCorruptionError: If deserialization fails
         """
         try:
-            json_str = state_bytes.decode("utf-8")
-            return json.loads(json_str)
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return self._state_deserializer(state_bytes)
+        except ValueError as e:
             raise StateCorruptionError(
                 "deserialization", f"Failed to deserialize state data: {e}", {"error": str(e)}
             ) from e
@@ -540,6 +617,102 @@ class TransactionalStateStore(StateStore):
 
 
 # Utility functions
+async def backend_mget(backend: StorageBackend, keys: list[str]) -> list[bytes | None]:
+    """
+    Get raw data for several keys, batched when the backend supports it.
+
+    Args:
+        backend: Storage backend
+        keys: Storage keys
+
+    Returns:
+        Raw data bytes or None for each key, in order
+    """
+    mget: Callable[[list[str]], Awaitable[list[bytes | None]]] | None = getattr(
+        backend, "mget", None
+    )
+    if mget is not None:
+        return await mget(keys)
+    return [await backend.get(key) for key in keys]
+
+
+async def backend_mset(
+    backend: StorageBackend, items: dict[str, bytes], ttl_seconds: int | None = None
+) -> None:
+    """
+    Set raw data for several keys, batched when the backend supports it.
+
+    Args:
+        backend: Storage backend
+        items: Mapping of storage key to raw data bytes
+        ttl_seconds: Optional time-to-live in seconds
+    """
+    mset: Callable[[dict[str, bytes], int | None], Awaitable[None]] | None = getattr(
+        backend, "mset", None
+    )
+    if mset is not None:
+        await mset(items, ttl_seconds)
+        return
+    for key, value in items.items():
+        await backend.set(key, value, ttl_seconds)
+
+
+async def backend_mdelete(backend: StorageBackend, keys: list[str]) -> int:
+    """
+    Delete several keys, batched when the backend supports it.
+
+    Args:
+        backend: Storage backend
+        keys: Storage keys
+
+    Returns:
+        Number of keys that existed and were deleted
+    """
+    mdelete: Callable[[list[str]], Awaitable[int]] | None = getattr(backend, "mdelete", None)
+    if mdelete is not None:
+        return await mdelete(keys)
+
+    deleted = 0
+    for key in keys:
+        if await backend.delete(key):
+            deleted += 1
+    return deleted
+
+
+async def backend_existing_keys(backend: StorageBackend, keys: list[str]) -> list[str]:
+    """
+    Return the given keys that are stored, in order.
+
+    Backends with an existing_keys method can answer without reading the
+    values (and without counting the check as an access); others are
+    checked through mget.
+
+    Args:
+        backend: Storage backend
+        keys: Storage keys
+
+    Returns:
+        The keys that exist
+    """
+    existing_keys: Callable[[list[str]], Awaitable[list[str]]] | None = getattr(
+        backend, "existing_keys", None
+    )
+    if existing_keys is not None:
+        return await existing_keys(keys)
+
+    values = await backend_mget(backend, keys)
+    return [key for key, value in zip(keys, values, strict=True) if value is not None]
+
+
+# Allowed characters for thread IDs and agent names; matched with fullmatch so a
+# trailing newline is rejected too (re's "$" would accept it)
+_ID_PATTERN = re.compile(r"[a-zA-Z0-9\-_]+")
+
+# Maximum lengths for thread IDs and agent names
+_MAX_THREAD_ID_LENGTH = 255
+_MAX_AGENT_NAME_LENGTH = 100
+
+
 def validate_thread_id(thread_id: str) -> bool:
     """
     Validate thread ID format.
@@ -553,13 +726,11 @@ def validate_thread_id(thread_id: str) -> bool:
     if not thread_id or not isinstance(thread_id, str):
         return False
 
-    if len(thread_id) > 255 or len(thread_id) < 1:
+    if len(thread_id) > _MAX_THREAD_ID_LENGTH:
         return False
 
     # Basic format validation - alphanumeric, hyphens, underscores
-    import re
-
-    return bool(re.match(r"^[a-zA-Z0-9\-_]+$", thread_id))
+    return _ID_PATTERN.fullmatch(thread_id) is not None
 
 
 def validate_agent_name(agent_name: str) -> bool:
@@ -575,13 +746,11 @@ def validate_agent_name(agent_name: str) -> bool:
     if not agent_name or not isinstance(agent_name, str):
         return False
 
-    if len(agent_name) > 100 or len(agent_name) < 1:
+    if len(agent_name) > _MAX_AGENT_NAME_LENGTH:
         return False
 
     # Basic format validation - alphanumeric, hyphens, underscores
-    import re
-
-    return bool(re.match(r"^[a-zA-Z0-9\-_]+$", agent_name))
+    return _ID_PATTERN.fullmatch(agent_name) is not None
 
 
 # Export public API
@@ -604,6 +773,10 @@ __all__ = [
     "AgentName",
     "StateKey",
     # Utility functions
+    "backend_mget",
+    "backend_mset",
+    "backend_mdelete",
+    "backend_existing_keys",
     "validate_thread_id",
     "validate_agent_name",
 ]
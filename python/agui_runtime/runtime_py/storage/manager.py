@@ -12,6 +12,7 @@ import asyncio
 import contextlib
 import datetime
 import logging
+from collections import OrderedDict
 from enum import Enum
 from typing import Any
 
@@ -55,6 +56,8 @@ class StateStoreConfig:
         backup_enabled: bool = False,
         backup_interval_seconds: int = 3600,
         metrics_enabled: bool = True,
+        codec: str | None = None,
+        trust_pickle: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -73,6 +76,10 @@ class StateStoreConfig:
             backup_enabled: Whether to enable automatic backups
             backup_interval_seconds: Backup interval in seconds
             metrics_enabled: Whether to collect metrics
+            codec: State codec name (see STATE_CODECS); defaults to
+                msgpack-zstd when enable_compression is set and json otherwise
+            trust_pickle: Allow codecs in UNSAFE_STATE_CODECS; only safe when
+                every process sharing the store is trusted
             **kwargs: Additional backend-specific configuration
         """
         self.backend_type = backend_type
@@ -87,6 +94,8 @@ class StateStoreConfig:
         self.backup_enabled = backup_enabled
         self.backup_interval_seconds = backup_interval_seconds
         self.metrics_enabled = metrics_enabled
+        self.codec = codec
+        self.trust_pickle = trust_pickle
         self.extra_config = kwargs
 
     def to_dict(self) -> dict[str, Any]:
@@ -104,6 +113,8 @@ class StateStoreConfig:
             "backup_enabled": self.backup_enabled,
             "backup_interval_seconds": self.backup_interval_seconds,
             "metrics_enabled": self.metrics_enabled,
+            "codec": self.codec,
+            "trust_pickle": self.trust_pickle,
             **self.extra_config,
         }
 
@@ -124,6 +135,8 @@ class StateStoreConfig:
             backup_enabled=data.get("backup_enabled", False),
             backup_interval_seconds=data.get("backup_interval_seconds", 3600),
             metrics_enabled=data.get("metrics_enabled", True),
+            codec=data.get("codec"),
+            trust_pickle=data.get("trust_pickle", False),
             **{
                 k: v
                 for k, v in data.items()
@@ -141,6 +154,8 @@ class StateStoreConfig:
                     "backup_enabled",
                     "backup_interval_seconds",
                     "metrics_enabled",
+                    "codec",
+                    "trust_pickle",
                 ]
             },
         )
@@ -205,12 +220,30 @@ class StateStoreMetrics:
         }
 
 
+# Python type (or tuple of types) accepted by a schema field
+_SchemaType = type | tuple[type, ...]
+
+# Python types for the schema type names understood by StateValidator
+_SCHEMA_TYPES: dict[str, _SchemaType] = {
+    "string": str,
+    "integer": int,
+    "float": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+_MISSING = object()
+
+
 class StateValidator:
     """State data validation and schema checking."""
 
     def __init__(self) -> None:
         self.schemas: dict[str, dict[str, Any]] = {}
         self.required_fields: dict[str, list[str]] = {}
+        # Per-agent (field, python type, declared type) checks built at registration
+        self._compiled: dict[str, list[tuple[str, _SchemaType, Any]]] = {}
 
     def register_schema(
         self,
@@ -222,6 +255,19 @@ class StateValidator:
         self.schemas[agent_name] = schema
         self.required_fields[agent_name] = required_fields or []
 
+        compiled: list[tuple[str, _SchemaType, Any]] = []
+        for field, expected_type in schema.items():
+            py_type: _SchemaType
+            if isinstance(expected_type, type):
+                py_type = expected_type
+            elif expected_type in _SCHEMA_TYPES:
+                py_type = _SCHEMA_TYPES[expected_type]
+            else:
+                # Unknown type - allow any value
+                continue
+            compiled.append((field, py_type, expected_type))
+        self._compiled[agent_name] = compiled
+
     def validate_state(self, agent_name: str, state_data: StateData) -> bool:
         """
         Validate state data against registered schema.
@@ -236,50 +282,31 @@ class StateValidator:
         Raises:
             StorageError: If validation fails with details
         """
-        if agent_name not in self.schemas:
+        compiled = self._compiled.get(agent_name)
+        if compiled is None:
             # No schema registered - allow any data
             return True
 
-        schema = self.schemas[agent_name]
-        required = self.required_fields.get(agent_name, [])
-
         # Check required fields
-        missing_fields = [field for field in required if field not in state_data]
+        missing_fields = [
+            field for field in self.required_fields[agent_name] if field not in state_data
+        ]
         if missing_fields:
             raise StorageError(f"Missing required fields for agent {agent_name}: {missing_fields}")
 
         # Basic type checking
-        for field, expected_type in schema.items():
-            if field in state_data:
-                value = state_data[field]
-                if not self._check_type(value, expected_type):
-                    raise StorageError(
-                        f"Invalid type for field '{field}' in agent {agent_name}: "
-                        f"expected {expected_type}, got {type(value).__name__}"
-                    )
+        for field, py_type, expected_type in compiled:
+            value = state_data.get(field, _MISSING)
+            if value is _MISSING:
+                continue
+            if not isinstance(value, py_type):
+                raise StorageError(
+                    f"Invalid type for field '{field}' in agent {agent_name}: "
+                    f"expected {expected_type}, got {type(value).__name__}"
+                )
 
         return True
 
-    def _check_type(self, value: Any, expected_type: Any) -> bool:
-        """Check if value matches expected type."""
-        if expected_type == "string":
-            return isinstance(value, str)
-        elif expected_type == "integer":
-            return isinstance(value, int)
-        elif expected_type == "float":
-            return isinstance(value, int | float)
-        elif expected_type == "boolean":
-            return isinstance(value, bool)
-        elif expected_type == "array":
-            return isinstance(value, list)
-        elif expected_type == "object":
-            return isinstance(value, dict)
-        elif isinstance(expected_type, type):
-            return isinstance(value, expected_type)
-        else:
-            # Unknown type - allow it
-            return True
-
 
 class StateStoreManager:
     """
@@ -309,10 +336,12 @@ class StateStoreManager:
         self._store: StateStore | None = None
         self._metrics = StateStoreMetrics() if self.config.metrics_enabled else None
 
-        # Caching (simple in-memory cache for metadata)
-        self._metadata_cache: dict[str, StateMetadata] = {}
-        self._cache_expiry: dict[str, datetime.datetime] = {}
+        # Caching (bounded LRU of metadata and its expiry, oldest entry first)
+        self._metadata_cache: OrderedDict[str, tuple[StateMetadata, datetime.datetime]] = (
+            OrderedDict()
+        )
         self._cache_ttl_seconds = 300  # 5 minutes
+        self._cache_max_entries = 1024
 
         # Health and monitoring
         self._health_check_interval = 60  # 1 minute
@@ -369,7 +398,6 @@ class StateStoreManager:
 
             # Clear caches
             self._metadata_cache.clear()
-            self._cache_expiry.clear()
 
             self.logger.info("State store manager shutdown completed")
 
@@ -408,11 +436,7 @@ class StateStoreManager:
             )
 
             # Update cache
-            cache_key = f"{thread_id}:{agent_name}"
-            self._metadata_cache[cache_key] = stored_state.metadata
-            self._cache_expiry[cache_key] = datetime.datetime.utcnow() + datetime.timedelta(
-                seconds=self._cache_ttl_seconds
-            )
+            self._cache_metadata(f"{thread_id}:{agent_name}", stored_state.metadata)
 
             # Record metrics
             if self._metrics:
@@ -464,10 +488,7 @@ class StateStoreManager:
             # Update cache and metrics
             cache_key = f"{thread_id}:{agent_name}"
             if stored_state:
-                self._metadata_cache[cache_key] = stored_state.metadata
-                self._cache_expiry[cache_key] = datetime.datetime.utcnow() + datetime.timedelta(
-                    seconds=self._cache_ttl_seconds
-                )
+                self._cache_metadata(cache_key, stored_state.metadata)
 
                 if self._metrics:
                     self._metrics.cache_misses += 1
@@ -475,7 +496,6 @@ class StateStoreManager:
             else:
                 # Remove from cache if not found
                 self._metadata_cache.pop(cache_key, None)
-                self._cache_expiry.pop(cache_key, None)
 
             # Record metrics
             if self._metrics:
@@ -519,9 +539,7 @@ class StateStoreManager:
             deleted = await self._store.delete_agent_state(thread_id, agent_name)
 
             # Update cache
-            cache_key = f"{thread_id}:{agent_name}"
-            self._metadata_cache.pop(cache_key, None)
-            self._cache_expiry.pop(cache_key, None)
+            self._metadata_cache.pop(f"{thread_id}:{agent_name}", None)
 
             # Record metrics
             if self._metrics and deleted:
@@ -550,12 +568,17 @@ class StateStoreManager:
         """Get state metadata with caching."""
         # Check cache first
         cache_key = f"{thread_id}:{agent_name}"
-        if cache_key in self._metadata_cache:
-            expiry = self._cache_expiry.get(cache_key)
-            if expiry and datetime.datetime.utcnow() < expiry:
+        metadata: StateMetadata | None
+        entry = self._metadata_cache.get(cache_key)
+        if entry is not None:
+            metadata, expiry = entry
+            if datetime.datetime.utcnow() < expiry:
+                self._metadata_cache.move_to_end(cache_key)
                 if self._metrics:
                     self._metrics.record_cache_hit()
-                return self._metadata_cache[cache_key]
+                return metadata
+
+            del self._metadata_cache[cache_key]
 
         # Cache miss - record it
         if self._metrics:
@@ -563,7 +586,29 @@ class StateStoreManager:
 
         # Load from store
         await self._ensure_store()
-        return await self._store.get_state_metadata(thread_id, agent_name)
+        metadata = await self._store.get_state_metadata(thread_id, agent_name)
+        if metadata is not None:
+            self._cache_metadata(cache_key, metadata)
+
+        return metadata
+
+    def _cache_metadata(
+        self,
+        cache_key: str,
+        metadata: StateMetadata,
+        expiry: datetime.datetime | None = None,
+    ) -> None:
+        """Cache metadata as the most recent entry, evicting the least recent past capacity."""
+        if expiry is None:
+            expiry = datetime.datetime.utcnow() + datetime.timedelta(
+                seconds=self._cache_ttl_seconds
+            )
+
+        self._metadata_cache[cache_key] = (metadata, expiry)
+        self._metadata_cache.move_to_end(cache_key)
+
+        while len(self._metadata_cache) > self._cache_max_entries:
+            self._metadata_cache.popitem(last=False)
 
     async def list_thread_agents(self, thread_id: ThreadId) -> list[AgentName]:
         """List all agents with state in a thread."""
@@ -583,7 +628,6 @@ class StateStoreManager:
         keys_to_remove = [key for key in self._metadata_cache if key.startswith(f"{thread_id}:")]
         for key in keys_to_remove:
             self._metadata_cache.pop(key, None)
-            self._cache_expiry.pop(key, None)
 
         return await self._store.clear_thread_state(thread_id)
 
@@ -592,25 +636,112 @@ class StateStoreManager:
         states: list[tuple[ThreadId, AgentName, StateData]],
         merge_with_existing: bool = True,
     ) -> list[StoredState]:
-        """Bulk save multiple states for efficiency."""
-        results = []
-        for thread_id, agent_name, state_data in states:
-            stored_state = await self.save_agent_state(
-                thread_id, agent_name, state_data, merge_with_existing
+        """Bulk save multiple states in a single batched store write."""
+        start_time = datetime.datetime.utcnow()
+        operation = "bulk_save_states"
+
+        try:
+            # Validate inputs
+            for thread_id, agent_name, state_data in states:
+                if not validate_thread_id(thread_id):
+                    raise StorageError(f"Invalid thread ID: {thread_id}")
+
+                if not validate_agent_name(agent_name):
+                    raise StorageError(f"Invalid agent name: {agent_name}")
+
+                self.validator.validate_state(agent_name, state_data)
+
+            # Ensure store is initialized
+            store = await self._ensure_store()
+
+            # Perform the batched save operation
+            results = await store.save_agent_states(states, merge_with_existing)
+
+            # Update cache
+            cache_expiry = datetime.datetime.utcnow() + datetime.timedelta(
+                seconds=self._cache_ttl_seconds
             )
-            results.append(stored_state)
-        return results
+            # Results omit states the store dropped, so match them by state key
+            cache_keys = {
+                store.generate_state_key(thread_id, agent_name): f"{thread_id}:{agent_name}"
+                for thread_id, agent_name, _ in states
+            }
+            for stored_state in results:
+                self._cache_metadata(
+                    cache_keys[stored_state.state_key], stored_state.metadata, cache_expiry
+                )
+
+            # Record metrics
+            if self._metrics:
+                duration = (datetime.datetime.utcnow() - start_time).total_seconds()
+                self._metrics.record_operation(operation, duration, True)
+                self._metrics.total_states_stored += len(results)
+
+            return results
+
+        except Exception as e:
+            # Record error metrics
+            if self._metrics:
+                duration = (datetime.datetime.utcnow() - start_time).total_seconds()
+                self._metrics.record_operation(operation, duration, False)
+
+            self.logger.error(f"Failed to bulk save {len(states)} states: {e}")
+            raise
 
     async def bulk_load_states(
         self,
         requests: list[tuple[ThreadId, AgentName]],
     ) -> list[StoredState | None]:
-        """Bulk load multiple states for efficiency."""
-        results = []
-        for thread_id, agent_name in requests:
-            stored_state = await self.load_agent_state(thread_id, agent_name)
-            results.append(stored_state)
-        return results
+        """Bulk load multiple states in a single batched store read."""
+        start_time = datetime.datetime.utcnow()
+        operation = "bulk_load_states"
+
+        try:
+            # Validate inputs
+            for thread_id, agent_name in requests:
+                if not validate_thread_id(thread_id):
+                    raise StorageError(f"Invalid thread ID: {thread_id}")
+
+                if not validate_agent_name(agent_name):
+                    raise StorageError(f"Invalid agent name: {agent_name}")
+
+            # Ensure store is initialized
+            store = await self._ensure_store()
+
+            # Perform the batched load operation
+            results = await store.load_agent_states(requests)
+
+            # Update cache and metrics
+            cache_expiry = datetime.datetime.utcnow() + datetime.timedelta(
+                seconds=self._cache_ttl_seconds
+            )
+            for (thread_id, agent_name), stored_state in zip(requests, results, strict=True):
+                cache_key = f"{thread_id}:{agent_name}"
+                if stored_state:
+                    self._cache_metadata(cache_key, stored_state.metadata, cache_expiry)
+
+                    if self._metrics:
+                        self._metrics.cache_misses += 1
+                        self._metrics.total_states_loaded += 1
+                else:
+                    # Remove from cache if not found
+                    self._metadata_cache.pop(cache_key, None)
+
+            # Record metrics
+            if self._metrics:
+                duration = (datetime.datetime.utcnow() - start_time).total_seconds()
+                self._metrics.record_operation(operation, duration, True)
+
+            return results
+
+        except Exception as e:
+            # Record error metrics
+            if self._metrics:
+                duration = (datetime.datetime.utcnow() - start_time).total_seconds()
+                self._metrics.record_operation(operation, duration, False)
+
+            self.logger.error(f"Failed to bulk load {len(requests)} states: {e}")
+            raise
 
     async def health_check(self) -> bool:
         """Check if state store is healthy."""
@@ -648,10 +779,18 @@ class StateStoreManager:
     async def _create_store(self) -> StateStore:
         """Create storage backend based on configuration."""
         if self.config.backend_type == StorageBackendType.MEMORY:
-            return MemoryStateStore(
+            store = MemoryStateStore(
                 max_size_mb=self.config.max_size_mb,
                 default_ttl_seconds=self.config.default_ttl_seconds,
             )
+            codec_name = self.config.codec
+            if codec_name is None and self.config.enable_compression:
+                codec_name = "msgpack-zstd"
+            if codec_name is not None:
+                from . import get_state_codec
+
+                store.use_codec(*get_state_codec(codec_name, self.config.trust_pickle))
+            return store
         elif self.config.backend_type == StorageBackendType.REDIS:
             # TODO: Implement Redis backend
             raise NotImplementedError("Redis backend not yet implemented")
@@ -661,10 +800,13 @@ class StateStoreManager:
         else:
             raise StorageError(f"Unknown backend type: {self.config.backend_type}")
 
-    async def _ensure_store(self) -> None:
-        """Ensure store is initialized."""
+    async def _ensure_store(self) -> StateStore:
+        """Ensure store is initialized and return it."""
         if not self._store:
             await self.initialize()
+        if self._store is None:
+            raise StorageError("State store is not initialized")
+        return self._store
 
     async def _perform_health_check(self) -> None:
         """Perform comprehensive health check."""
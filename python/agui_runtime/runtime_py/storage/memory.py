@@ -12,25 +12,51 @@ import asyncio
 import contextlib
 import datetime
 import hashlib
+import heapq
 import logging
-from typing import Any
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+try:
+    import xxhash
+
+    _HAS_XXHASH = True
+except ImportError:  # pragma: no cover - xxhash is an optional speedup
+    _HAS_XXHASH = False
 
 from .base import (
     AgentName,
     StateData,
     StateMetadata,
-    StateNotFoundError,
     StateStore,
-    StorageBackend,
     StorageError,
     StoredState,
     ThreadId,
+    backend_existing_keys,
+    backend_mdelete,
+    backend_mget,
+    backend_mset,
     validate_agent_name,
     validate_thread_id,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _state_checksum(state_bytes: bytes) -> str:
+    """
+    Checksum serialized state for corruption detection.
 
-class MemoryStorageBackend(StorageBackend):
+    Uses xxhash's XXH3 when available and falls back to SHA-256. The
+    checksum is not a security boundary, so a non-cryptographic hash is enough.
+    """
+    if _HAS_XXHASH:
+        return xxhash.xxh3_64_hexdigest(state_bytes)
+    return hashlib.sha256(state_bytes).hexdigest()
+
+
+class MemoryStorageBackend:
     """
     In-memory storage backend implementation.
 
@@ -43,6 +69,8 @@ class MemoryStorageBackend(StorageBackend):
         max_size_mb: int = 100,
         default_ttl_seconds: int | None = None,
         cleanup_interval_seconds: int = 60,
+        on_set: Callable[[str], None] | None = None,
+        on_remove: Callable[[str], None] | None = None,
     ) -> None:
         """
         Initialize memory storage backend.
@@ -51,15 +79,24 @@ class MemoryStorageBackend(StorageBackend):
             max_size_mb: Maximum memory usage in megabytes
             default_ttl_seconds: Default TTL for stored items
             cleanup_interval_seconds: Interval for cleanup operations
+            on_set: Called with each key that is stored
+            on_remove: Called with each key that is deleted, expires or is evicted
         """
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.default_ttl_seconds = default_ttl_seconds
         self.cleanup_interval_seconds = cleanup_interval_seconds
+        self.on_set = on_set
+        self.on_remove = on_remove
 
         # Storage containers
         self._storage: dict[str, bytes] = {}
         self._metadata: dict[str, dict[str, Any]] = {}
-        self._access_times: dict[str, datetime.datetime] = {}
+        # Kept in recency order (least recently used first) for O(1) LRU eviction
+        self._access_times: OrderedDict[str, datetime.datetime] = OrderedDict()
+
+        # Min-heap of (expires_at, key) for keys with a TTL. Entries for keys
+        # since removed or re-set with another expiry are skipped when popped.
+        self._expiry_heap: list[tuple[datetime.datetime, str]] = []
 
         # Thread safety
         self._lock = asyncio.Lock()
@@ -85,51 +122,23 @@ class MemoryStorageBackend(StorageBackend):
     async def get(self, key: str) -> bytes | None:
         """Get raw data by key."""
         async with self._lock:
-            # Check if key exists
-            if key not in self._storage:
-                return None
-
-            # Check TTL
-            metadata = self._metadata.get(key, {})
-            expires_at = metadata.get("expires_at")
-            if expires_at and datetime.datetime.utcnow() > expires_at:
-                # Expired - remove it
-                await self._remove_key_unsafe(key)
-                return None
-
-            # Update access time
-            self._access_times[key] = datetime.datetime.utcnow()
-            self._access_count += 1
-
-            return self._storage[key]
+            return await self._get_unsafe(key)
 
     async def set(self, key: str, value: bytes, ttl_seconds: int | None = None) -> None:
         """Set raw data by key."""
         async with self._lock:
-            # Calculate expiration
-            expires_at = None
-            effective_ttl = ttl_seconds or self.default_ttl_seconds
-            if effective_ttl:
-                expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=effective_ttl)
-
-            # Check if we need to make space
-            value_size = len(value)
-            await self._ensure_space_unsafe(value_size, exclude_key=key)
-
-            # Store the data
-            old_size = len(self._storage.get(key, b""))
-            self._storage[key] = value
-            self._metadata[key] = {
-                "created_at": datetime.datetime.utcnow(),
-                "expires_at": expires_at,
-                "size": value_size,
-            }
-            self._access_times[key] = datetime.datetime.utcnow()
+            await self._set_unsafe(key, value, ttl_seconds)
 
-            # Update total size
-            self._total_size_bytes += value_size - old_size
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        """Get raw data for several keys under a single lock acquisition."""
+        async with self._lock:
+            return [await self._get_unsafe(key) for key in keys]
 
-            self.logger.debug(f"Stored {value_size} bytes for key: {key}")
+    async def mset(self, items: dict[str, bytes], ttl_seconds: int | None = None) -> None:
+        """Set raw data for several keys under a single lock acquisition."""
+        async with self._lock:
+            for key, value in items.items():
+                await self._set_unsafe(key, value, ttl_seconds)
 
     async def delete(self, key: str) -> bool:
         """Delete data by key."""
@@ -139,6 +148,19 @@ class MemoryStorageBackend(StorageBackend):
                 return True
             return False
 
+    async def mdelete(self, keys: list[str]) -> int:
+        """Delete several keys under a single lock acquisition."""
+        async with self._lock:
+            # Expired keys are not counted as deleted
+            await self._cleanup_expired_unsafe()
+
+            deleted = 0
+            for key in keys:
+                if key in self._storage:
+                    await self._remove_key_unsafe(key)
+                    deleted += 1
+            return deleted
+
     async def exists(self, key: str) -> bool:
         """Check if key exists."""
         async with self._lock:
@@ -154,6 +176,28 @@ class MemoryStorageBackend(StorageBackend):
 
             return True
 
+    async def existing_keys(self, keys: list[str]) -> list[str]:
+        """
+        Return the given keys that are stored and unexpired, in order.
+
+        Unlike get, this does not count as an access for LRU eviction.
+        """
+        async with self._lock:
+            now = datetime.datetime.utcnow()
+            present = []
+            for key in keys:
+                if key not in self._storage:
+                    continue
+
+                expires_at = self._metadata.get(key, {}).get("expires_at")
+                if expires_at and now > expires_at:
+                    await self._remove_key_unsafe(key)
+                    continue
+
+                present.append(key)
+
+            return present
+
     async def list_keys(self, prefix: str = "") -> list[str]:
         """List all keys with optional prefix filter."""
         async with self._lock:
@@ -166,6 +210,11 @@ class MemoryStorageBackend(StorageBackend):
             else:
                 return list(self._storage.keys())
 
+    async def purge_expired(self) -> None:
+        """Remove all expired keys."""
+        async with self._lock:
+            await self._cleanup_expired_unsafe()
+
     async def health_check(self) -> bool:
         """Check if storage backend is healthy."""
         try:
@@ -197,16 +246,73 @@ class MemoryStorageBackend(StorageBackend):
             self._storage.clear()
             self._metadata.clear()
             self._access_times.clear()
+            self._expiry_heap.clear()
             self._total_size_bytes = 0
 
         self.logger.info("Memory storage backend cleaned up")
 
+    async def _get_unsafe(self, key: str) -> bytes | None:
+        """Get key without acquiring lock (unsafe - lock must be held)."""
+        # Check if key exists
+        if key not in self._storage:
+            return None
+
+        # Check TTL
+        metadata = self._metadata.get(key, {})
+        expires_at = metadata.get("expires_at")
+        if expires_at and datetime.datetime.utcnow() > expires_at:
+            # Expired - remove it
+            await self._remove_key_unsafe(key)
+            return None
+
+        # Update access time
+        self._access_times[key] = datetime.datetime.utcnow()
+        self._access_times.move_to_end(key)
+        self._access_count += 1
+
+        return self._storage[key]
+
+    async def _set_unsafe(self, key: str, value: bytes, ttl_seconds: int | None = None) -> None:
+        """Set key without acquiring lock (unsafe - lock must be held)."""
+        # Calculate expiration
+        expires_at = None
+        effective_ttl = ttl_seconds or self.default_ttl_seconds
+        if effective_ttl:
+            expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=effective_ttl)
+
+        # Check if we need to make space
+        value_size = len(value)
+        await self._ensure_space_unsafe(value_size, exclude_key=key)
+
+        # Store the data
+        old_size = len(self._storage.get(key, b""))
+        self._storage[key] = value
+        self._metadata[key] = {
+            "created_at": datetime.datetime.utcnow(),
+            "expires_at": expires_at,
+            "size": value_size,
+        }
+        self._access_times[key] = datetime.datetime.utcnow()
+        self._access_times.move_to_end(key)
+        if expires_at:
+            self._push_expiry_unsafe(expires_at, key)
+
+        # Update total size
+        self._total_size_bytes += value_size - old_size
+
+        if self.on_set is not None:
+            self.on_set(key)
+
+        self.logger.debug(f"Stored {value_size} bytes for key: {key}")
+
     async def _remove_key_unsafe(self, key: str) -> None:
         """Remove key without acquiring lock (unsafe - lock must be held)."""
         if key in self._storage:
             size = len(self._storage[key])
             del self._storage[key]
             self._total_size_bytes -= size
+            if self.on_remove is not None:
+                self.on_remove(key)
 
         self._metadata.pop(key, None)
         self._access_times.pop(key, None)
@@ -227,40 +333,62 @@ class MemoryStorageBackend(StorageBackend):
         # Need to evict items - use LRU strategy
         space_needed = (current_usage + required_bytes) - self.max_size_bytes
 
-        # Sort keys by access time (oldest first)
-        keys_by_access = sorted(self._access_times.items(), key=lambda x: x[1])
+        # The key being written is about to become the most recent one
+        if exclude_key in self._access_times:
+            self._access_times.move_to_end(exclude_key)
 
+        # Evict from the least recently used end
         evicted_bytes = 0
-        for key, _ in keys_by_access:
+        while evicted_bytes < space_needed and self._access_times:
+            key = next(iter(self._access_times))
             if key == exclude_key:
+                break
+
+            if key not in self._storage:
+                del self._access_times[key]
                 continue
 
-            if key in self._storage:
-                size = len(self._storage[key])
-                await self._remove_key_unsafe(key)
-                evicted_bytes += size
-                self._eviction_count += 1
+            size = len(self._storage[key])
+            await self._remove_key_unsafe(key)
+            evicted_bytes += size
+            self._eviction_count += 1
 
-                self.logger.debug(f"Evicted key: {key} ({size} bytes)")
+            self.logger.debug(f"Evicted key: {key} ({size} bytes)")
 
-                if evicted_bytes >= space_needed:
-                    break
+    def _push_expiry_unsafe(self, expires_at: datetime.datetime, key: str) -> None:
+        """Track a key's expiry, compacting the heap once stale entries dominate."""
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+
+        if len(self._expiry_heap) > 2 * len(self._metadata) + 64:
+            self._rebuild_expiry_heap_unsafe()
+
+    def _rebuild_expiry_heap_unsafe(self) -> None:
+        """Rebuild the expiry heap from the live metadata."""
+        self._expiry_heap = [
+            (metadata["expires_at"], key)
+            for key, metadata in self._metadata.items()
+            if metadata.get("expires_at")
+        ]
+        heapq.heapify(self._expiry_heap)
 
     async def _cleanup_expired_unsafe(self) -> None:
         """Clean up expired keys without acquiring lock."""
         now = datetime.datetime.utcnow()
-        expired_keys = []
-
-        for key, metadata in self._metadata.items():
-            expires_at = metadata.get("expires_at")
-            if expires_at and now > expires_at:
-                expired_keys.append(key)
+        heap = self._expiry_heap
+        expired_count = 0
+
+        # Only the due entries at the front of the heap are visited
+        while heap and now > heap[0][0]:
+            expires_at, key = heapq.heappop(heap)
+            metadata = self._metadata.get(key)
+            if metadata is None or metadata.get("expires_at") != expires_at:
+                continue
 
-        for key in expired_keys:
             await self._remove_key_unsafe(key)
+            expired_count += 1
 
-        if expired_keys:
-            self.logger.debug(f"Cleaned up {len(expired_keys)} expired keys")
+        if expired_count:
+            self.logger.debug(f"Cleaned up {expired_count} expired keys")
 
     def get_stats(self) -> dict[str, Any]:
         """Get storage statistics."""
@@ -297,9 +425,15 @@ class MemoryStorageBackend(StorageBackend):
             # Import metadata
             self._metadata.update(data.get("metadata", {}))
 
-            # Import access times
-            for k, v in data.get("access_times", {}).items():
-                self._access_times[k] = datetime.datetime.fromisoformat(v)
+            # Import access times, restoring recency order
+            access_times = [
+                (k, datetime.datetime.fromisoformat(v))
+                for k, v in data.get("access_times", {}).items()
+            ]
+            access_times.sort(key=lambda item: item[1])
+            self._access_times.update(access_times)
+
+            self._rebuild_expiry_heap_unsafe()
 
             # Recalculate total size
             self._total_size_bytes = sum(len(v) for v in self._storage.values())
@@ -334,15 +468,26 @@ class MemoryStateStore(StateStore):
             max_size_mb=max_size_mb,
             default_ttl_seconds=default_ttl_seconds,
             cleanup_interval_seconds=cleanup_interval_seconds,
+            on_set=self._on_key_set,
+            on_remove=self._on_key_removed,
         )
 
         super().__init__(backend)
 
+        # Typed handle for the memory-only cleanup API the protocol lacks
+        self._memory_backend = backend
+
         self.max_states_per_thread = max_states_per_thread
         self.logger = logging.getLogger(f"{__name__}.MemoryStateStore")
 
+        # Reverse indexes of the state keys held by the backend, kept in step
+        # through its set/remove callbacks. Expiry is lazy, so listings still
+        # confirm candidates with the backend.
+        self._thread_agents: dict[ThreadId, set[AgentName]] = {}
+        self._agent_threads: dict[AgentName, set[ThreadId]] = {}
+
         # Cleanup task will be started lazily when first operation occurs
-        self.backend._cleanup_task = None
+        self._memory_backend._cleanup_task = None
         self._cleanup_started = False
 
         self.logger.info("Memory state store initialized")
@@ -360,70 +505,33 @@ class MemoryStateStore(StateStore):
         await self._ensure_cleanup_task()
 
         # Validate inputs
-        if not validate_thread_id(thread_id):
-            raise StorageError(f"Invalid thread ID: {thread_id}")
-
-        if not validate_agent_name(agent_name):
-            raise StorageError(f"Invalid agent name: {agent_name}")
-
-        if not isinstance(state_data, dict):
-            raise StorageError("State data must be a dictionary")
+        self._validate_save_inputs(thread_id, agent_name, state_data)
 
         try:
             # Generate state key
             state_key = self.generate_state_key(thread_id, agent_name)
 
-            # Merge with existing state if requested
-            final_state_data = state_data.copy()
+            # Merge with existing state if requested, reading the container
+            # directly since the inputs were validated above
             existing_state = None
-
             if merge_with_existing:
-                try:
-                    existing_state = await self.load_agent_state(thread_id, agent_name)
-                    if existing_state:
-                        # Deep merge the states
-                        merged_data = existing_state.data.copy()
-                        merged_data.update(final_state_data)
-                        final_state_data = merged_data
-                except StateNotFoundError:
-                    # No existing state to merge - that's fine
-                    pass
-
-            # Create metadata
-            now = datetime.datetime.utcnow()
-            metadata = StateMetadata(
-                created_at=existing_state.metadata.created_at if existing_state else now,
-                updated_at=now,
-                version=existing_state.metadata.version + 1 if existing_state else 1,
-                tags=tags or {},
-            )
-
-            # Serialize state
-            state_bytes = self.serialize_state(final_state_data)
-            metadata.size_bytes = len(state_bytes)
-
-            # Calculate checksum
-            metadata.checksum = hashlib.sha256(state_bytes).hexdigest()
+                raw_data = await self.backend.get(state_key)
+                if raw_data is not None:
+                    existing_state = self._unpack_container(state_key, raw_data)
 
             # Check thread state limits
-            await self._enforce_thread_limits(thread_id, exclude_agent=agent_name)
-
-            # Create stored state container
-            stored_state_data = {
-                "data": final_state_data,
-                "metadata": metadata.to_dict(),
-            }
+            await self._enforce_thread_limits(thread_id, [agent_name])
 
             # Store the complete state container
-            container_bytes = self.serialize_state(stored_state_data)
+            stored_state, container_bytes = self._pack_container(
+                state_key, state_data, existing_state, tags
+            )
             await self.backend.set(state_key, container_bytes)
 
-            # Create result
-            stored_state = StoredState(state_key, final_state_data, metadata)
-
             self.logger.info(
                 f"Saved state for agent '{agent_name}' in thread '{thread_id}' "
-                f"({metadata.size_bytes} bytes, version {metadata.version})"
+                f"({stored_state.metadata.size_bytes} bytes, "
+                f"version {stored_state.metadata.version})"
             )
 
             return stored_state
@@ -434,6 +542,81 @@ class MemoryStateStore(StateStore):
             )
             raise StorageError(f"Failed to save agent state: {e}") from e
 
+    async def save_agent_states(
+        self,
+        states: list[tuple[ThreadId, AgentName, StateData]],
+        merge_with_existing: bool = True,
+    ) -> list[StoredState]:
+        """
+        Save several agent states with one backend mget and one mset.
+
+        Thread limits apply as if the states were saved one by one: stored
+        states are evicted oldest first, and when a batch alone exceeds a
+        thread's limit only its last-written agents are kept. States that are
+        not written are left out of the result.
+        """
+        await self._ensure_cleanup_task()
+
+        for thread_id, agent_name, state_data in states:
+            self._validate_save_inputs(thread_id, agent_name, state_data)
+
+        try:
+            state_keys = [self.generate_state_key(t, a) for t, a, _ in states]
+
+            # Distinct agents per thread, ordered by their last write in the batch
+            batch_agents: dict[ThreadId, dict[AgentName, None]] = {}
+            for thread_id, agent_name, _ in states:
+                thread_agents = batch_agents.setdefault(thread_id, {})
+                thread_agents.pop(agent_name, None)
+                thread_agents[agent_name] = None
+
+            # Make room in each thread. Agents the rest of the batch would evict
+            # again are not written, and any state they already had is dropped.
+            skipped_keys: set[str] = set()
+            for thread_id, thread_agents in batch_agents.items():
+                overflow = await self._enforce_thread_limits(thread_id, list(thread_agents))
+                for agent_name in list(thread_agents)[:overflow]:
+                    skipped_keys.add(self.generate_state_key(thread_id, agent_name))
+                    await self.delete_agent_state(thread_id, agent_name)
+
+            # Fetch every existing container in one call
+            raw_states: list[bytes | None] = (
+                await backend_mget(self.backend, state_keys)
+                if merge_with_existing
+                else [None] * len(state_keys)
+            )
+
+            pending: dict[str, StoredState] = {}
+            items: dict[str, bytes] = {}
+            results = []
+            for (_, _, state_data), state_key, raw_data in zip(
+                states, state_keys, raw_states, strict=True
+            ):
+                existing_state = None
+                if merge_with_existing:
+                    # Repeated keys merge onto the earlier entry of the same batch
+                    existing_state = pending.get(state_key)
+                    if existing_state is None and raw_data is not None:
+                        existing_state = self._unpack_container(state_key, raw_data)
+
+                stored_state, container_bytes = self._pack_container(
+                    state_key, state_data, existing_state, None
+                )
+                pending[state_key] = stored_state
+                if state_key not in skipped_keys:
+                    items[state_key] = container_bytes
+                    results.append(stored_state)
+
+            await backend_mset(self.backend, items)
+
+            self.logger.info(f"Saved {len(results)} agent states in one batch")
+
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Failed to save {len(states)} agent states: {e}")
+            raise StorageError(f"Failed to save agent states: {e}") from e
+
     async def load_agent_state(
         self,
         thread_id: ThreadId,
@@ -459,20 +642,12 @@ class MemoryStateStore(StateStore):
             if raw_data is None:
                 return None
 
-            # Deserialize container
-            container_data = self.deserialize_state(raw_data)
-
-            # Extract components
-            state_data = container_data["data"]
-            metadata_dict = container_data["metadata"]
-            metadata = StateMetadata.from_dict(metadata_dict)
-
-            # Create stored state
-            stored_state = StoredState(state_key, state_data, metadata)
+            stored_state = self._unpack_container(state_key, raw_data)
 
             self.logger.debug(
                 f"Loaded state for agent '{agent_name}' in thread '{thread_id}' "
-                f"({metadata.size_bytes} bytes, version {metadata.version})"
+                f"({stored_state.metadata.size_bytes} bytes, "
+                f"version {stored_state.metadata.version})"
             )
 
             return stored_state
@@ -483,6 +658,90 @@ class MemoryStateStore(StateStore):
             )
             raise StorageError(f"Failed to load agent state: {e}") from e
 
+    async def load_agent_states(
+        self,
+        requests: list[tuple[ThreadId, AgentName]],
+    ) -> list[StoredState | None]:
+        """Load several agent states with one backend mget."""
+        await self._ensure_cleanup_task()
+
+        for thread_id, agent_name in requests:
+            if not validate_thread_id(thread_id):
+                raise StorageError(f"Invalid thread ID: {thread_id}")
+            if not validate_agent_name(agent_name):
+                raise StorageError(f"Invalid agent name: {agent_name}")
+
+        try:
+            state_keys = [self.generate_state_key(t, a) for t, a in requests]
+            raw_states = await backend_mget(self.backend, state_keys)
+            return [
+                self._unpack_container(state_key, raw_data) if raw_data is not None else None
+                for state_key, raw_data in zip(state_keys, raw_states, strict=True)
+            ]
+
+        except Exception as e:
+            self.logger.error(f"Failed to load {len(requests)} agent states: {e}")
+            raise StorageError(f"Failed to load agent states: {e}") from e
+
+    def _validate_save_inputs(
+        self, thread_id: ThreadId, agent_name: AgentName, state_data: StateData
+    ) -> None:
+        """Validate the arguments of a save operation."""
+        if not validate_thread_id(thread_id):
+            raise StorageError(f"Invalid thread ID: {thread_id}")
+
+        if not validate_agent_name(agent_name):
+            raise StorageError(f"Invalid agent name: {agent_name}")
+
+        if not isinstance(state_data, dict):
+            raise StorageError("State data must be a dictionary")
+
+    def _pack_container(
+        self,
+        state_key: str,
+        state_data: StateData,
+        existing_state: StoredState | None,
+        tags: dict[str, str] | None,
+    ) -> tuple[StoredState, bytes]:
+        """Merge state onto the existing state and serialize the stored container."""
+        # Shallow merge onto the existing state, building a single new dict
+        final_state_data = existing_state.data | state_data if existing_state else state_data.copy()
+
+        # Create metadata
+        now = datetime.datetime.utcnow()
+        metadata = StateMetadata(
+            created_at=existing_state.metadata.created_at if existing_state else now,
+            updated_at=now,
+            version=existing_state.metadata.version + 1 if existing_state else 1,
+            tags=tags or {},
+        )
+
+        # Serialize state
+        state_bytes = self.serialize_state(final_state_data)
+        metadata.size_bytes = len(state_bytes)
+
+        # Calculate checksum
+        metadata.checksum = _state_checksum(state_bytes)
+
+        # Create stored state container
+        stored_state_data = {
+            "data": final_state_data,
+            "metadata": metadata.to_dict(),
+        }
+
+        container_bytes = self.serialize_state(stored_state_data)
+        return StoredState(state_key, final_state_data, metadata), container_bytes
+
+    def _unpack_container(self, state_key: str, raw_data: bytes) -> StoredState:
+        """Deserialize a stored container into a StoredState."""
+        container_data = self.deserialize_state(raw_data)
+
+        # Extract components
+        state_data = container_data["data"]
+        metadata = StateMetadata.from_dict(container_data["metadata"])
+
+        return StoredState(state_key, state_data, metadata)
+
     async def delete_agent_state(
         self,
         thread_id: ThreadId,
@@ -520,21 +779,18 @@ class MemoryStateStore(StateStore):
             raise StorageError(f"Invalid thread ID: {thread_id}")
 
         try:
-            # Get thread prefix
-            thread_prefix = f"copilotkit:state:{thread_id}:"
-
-            # List all keys with thread prefix
-            keys = await self.backend.list_keys(thread_prefix)
+            candidates = sorted(self._thread_agents.get(thread_id, ()))
+            state_keys = [self.generate_state_key(thread_id, a) for a in candidates]
+            present = set(await backend_existing_keys(self.backend, state_keys))
 
-            # Extract agent names
             agents = []
-            for key in keys:
-                if key.startswith(thread_prefix):
-                    agent_name = key[len(thread_prefix) :]
-                    if validate_agent_name(agent_name):
-                        agents.append(agent_name)
+            for agent_name, state_key in zip(candidates, state_keys, strict=True):
+                if state_key in present:
+                    agents.append(agent_name)
+                else:
+                    self._index_discard(thread_id, agent_name)
 
-            return sorted(agents)
+            return agents
 
         except Exception as e:
             self.logger.error(f"Failed to list agents for thread '{thread_id}': {e}")
@@ -546,24 +802,18 @@ class MemoryStateStore(StateStore):
             raise StorageError(f"Invalid agent name: {agent_name}")
 
         try:
-            # Get all state keys
-            keys = await self.backend.list_keys("copilotkit:state:")
+            candidates = sorted(self._agent_threads.get(agent_name, ()))
+            state_keys = [self.generate_state_key(t, agent_name) for t in candidates]
+            present = set(await backend_existing_keys(self.backend, state_keys))
 
-            # Extract thread IDs for this agent
             threads = []
-            agent_suffix = f":{agent_name}"
-
-            for key in keys:
-                if key.endswith(agent_suffix) and key.startswith("copilotkit:state:"):
-                    # Extract thread ID: copilotkit:state:{thread_id}:{agent_name}
-                    prefix_len = len("copilotkit:state:")
-                    suffix_len = len(agent_suffix)
-                    thread_id = key[prefix_len:-suffix_len]
-
-                    if validate_thread_id(thread_id):
-                        threads.append(thread_id)
+            for thread_id, state_key in zip(candidates, state_keys, strict=True):
+                if state_key in present:
+                    threads.append(thread_id)
+                else:
+                    self._index_discard(thread_id, agent_name)
 
-            return sorted(threads)
+            return threads
 
         except Exception as e:
             self.logger.error(f"Failed to list threads for agent '{agent_name}': {e}")
@@ -575,14 +825,16 @@ class MemoryStateStore(StateStore):
             raise StorageError(f"Invalid thread ID: {thread_id}")
 
         try:
-            # Get all agents in thread
-            agents = await self.list_thread_agents(thread_id)
-
-            # Delete each agent's state
-            deleted_count = 0
+            # Take the thread's agents out of the reverse indexes
+            agents = list(self._thread_agents.get(thread_id, ()))
             for agent_name in agents:
-                if await self.delete_agent_state(thread_id, agent_name):
-                    deleted_count += 1
+                self._index_discard(thread_id, agent_name)
+
+            # Delete every state of the thread in one backend call
+            deleted_count = await backend_mdelete(
+                self.backend,
+                [self.generate_state_key(thread_id, agent_name) for agent_name in agents],
+            )
 
             self.logger.info(f"Cleared {deleted_count} agent states from thread '{thread_id}'")
 
@@ -615,17 +867,22 @@ class MemoryStateStore(StateStore):
             )
             raise StorageError(f"Failed to get state metadata: {e}") from e
 
-    async def _enforce_thread_limits(self, thread_id: ThreadId, exclude_agent: str = "") -> None:
-        """Enforce maximum states per thread limit."""
-        agents = await self.list_thread_agents(thread_id)
+    async def _enforce_thread_limits(
+        self, thread_id: ThreadId, incoming_agents: list[AgentName]
+    ) -> int:
+        """
+        Evict a thread's oldest states to make room for the incoming agents.
 
-        # Filter out the agent we're about to save/update
-        if exclude_agent:
-            agents = [a for a in agents if a != exclude_agent]
+        Returns how many incoming agents would still exceed the limit once
+        every other state in the thread has been evicted.
+        """
+        incoming = set(incoming_agents)
+        agents = [a for a in await self.list_thread_agents(thread_id) if a not in incoming]
 
-        if len(agents) >= self.max_states_per_thread:
+        overflow = len(agents) + len(incoming) - self.max_states_per_thread
+        if overflow > 0:
             # Need to remove oldest states
-            states_to_remove = len(agents) - self.max_states_per_thread + 1
+            states_to_remove = min(overflow, len(agents))
 
             # Load metadata for all agents to find oldest
             agent_metadata = []
@@ -646,22 +903,26 @@ class MemoryStateStore(StateStore):
                     f"(thread limit: {self.max_states_per_thread})"
                 )
 
+        return max(overflow - len(agents), 0)
+
     async def _ensure_cleanup_task(self) -> None:
         """Ensure the periodic cleanup task is started (lazy initialization)."""
-        if not self._cleanup_started and self.backend._cleanup_task is None:
+        backend = self._memory_backend
+        if not self._cleanup_started and backend._cleanup_task is None:
             try:
-                async def cleanup_loop():
-                    while not getattr(self.backend, "_shutdown", False):
+
+                async def cleanup_loop() -> None:
+                    while not backend._shutdown:
                         try:
-                            await asyncio.sleep(self.backend.cleanup_interval_seconds)
-                            # The cleanup happens automatically in the backend
+                            await asyncio.sleep(backend.cleanup_interval_seconds)
+                            await backend.purge_expired()
                             self.logger.debug("Periodic cleanup completed")
                         except asyncio.CancelledError:
                             break
                         except Exception as e:
                             self.logger.error(f"Error in cleanup task: {e}")
 
-                self.backend._cleanup_task = asyncio.create_task(cleanup_loop())
+                backend._cleanup_task = asyncio.create_task(cleanup_loop())
                 self._cleanup_started = True
                 self.logger.debug("Cleanup task started")
             except RuntimeError:
@@ -700,3 +961,50 @@ class MemoryStateStore(StateStore):
     async def import_states(self, data: dict[str, Any]) -> None:
         """Import states from backup/testing."""
         await self.backend.import_data(data)
+
+        # Rebuild the reverse indexes from the imported keys
+        self._thread_agents.clear()
+        self._agent_threads.clear()
+        for state_key in await self.backend.list_keys("copilotkit:state:"):
+            self._on_key_set(state_key)
+
+    def _on_key_set(self, key: str) -> None:
+        """Index a state key the backend has stored."""
+        parsed = self._parse_state_key(key)
+        if parsed is not None:
+            self._index_add(*parsed)
+
+    def _on_key_removed(self, key: str) -> None:
+        """Unindex a state key the backend has deleted, expired or evicted."""
+        parsed = self._parse_state_key(key)
+        if parsed is not None:
+            self._index_discard(*parsed)
+
+    @staticmethod
+    def _parse_state_key(key: str) -> tuple[ThreadId, AgentName] | None:
+        """Split a state key into its thread ID and agent name."""
+        if not key.startswith("copilotkit:state:"):
+            return None
+        thread_id, _, agent_name = key[len("copilotkit:state:") :].rpartition(":")
+        if validate_thread_id(thread_id) and validate_agent_name(agent_name):
+            return thread_id, agent_name
+        return None
+
+    def _index_add(self, thread_id: ThreadId, agent_name: AgentName) -> None:
+        """Record a stored state in the reverse indexes."""
+        self._thread_agents.setdefault(thread_id, set()).add(agent_name)
+        self._agent_threads.setdefault(agent_name, set()).add(thread_id)
+
+    def _index_discard(self, thread_id: ThreadId, agent_name: AgentName) -> None:
+        """Drop a state from the reverse indexes, removing emptied entries."""
+        agents = self._thread_agents.get(thread_id)
+        if agents is not None:
+            agents.discard(agent_name)
+            if not agents:
+                del self._thread_agents[thread_id]
+
+        threads = self._agent_threads.get(agent_name)
+        if threads is not None:
+            threads.discard(thread_id)
+            if not threads:
+                del self._agent_threads[agent_name]
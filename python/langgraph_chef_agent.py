@@ -32,30 +32,19 @@ HOW TO RUN THIS AGENT:
    - suggest_recipe_by_cuisine("Italian", "vegetarian")
    - get_cooking_advice("How to make perfect risotto?")
    - run_chef_agent("Any quick dinner ideas?")
+   - await arun_chef_agent("Any quick dinner ideas?")  # from async code
 """
 
+import functools
 import os
+import uuid
 from typing import Annotated, TypedDict
 
-from dotenv import load_dotenv
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.graph import END, START, StateGraph
 from langgraph.graph.message import add_messages
 
-
-class ChefState(TypedDict):
-    """The state of the chef advisor agent."""
-
-    messages: Annotated[list[BaseMessage], add_messages]
-
-
-def chef_advisor(state: ChefState):
-    """Chef advisor node that provides recipe suggestions and cooking advice."""
-
-    # System prompt for the chef advisor
-    system_prompt = """You are a professional chef advisor with extensive culinary knowledge. 
+# System prompt for the chef advisor
+SYSTEM_PROMPT = """You are a professional chef advisor with extensive culinary knowledge. 
     Your role is to:
     - Suggest delicious recipes based on ingredients, dietary preferences, or cuisine types
     - Provide cooking tips and techniques
@@ -67,15 +56,64 @@ def chef_advisor(state: ChefState):
     Include ingredient lists, step-by-step instructions, and helpful tips when suggesting recipes.
     Consider dietary restrictions and preferences when making recommendations."""
 
-    # Initialize Gemini model
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-1.5-flash",
-        temperature=0.8,  # Slightly higher for more creative recipe suggestions
-        google_api_key=os.getenv("GOOGLE_API_KEY"),
+_SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
+# Gemini model settings
+CHEF_MODEL = "gemini-1.5-flash"
+CHEF_TEMPERATURE = 0.8  # Slightly higher for more creative recipe suggestions
+
+# Connection pool for async Gemini calls, shared by every request in the process
+CHEF_HTTP_MAX_CONNECTIONS = 100
+CHEF_HTTP_MAX_KEEPALIVE = 20
+CHEF_HTTP_TIMEOUT_SECONDS = 120.0
+
+
+class ChefState(TypedDict):
+    """The state of the chef advisor agent."""
+
+    messages: Annotated[list[BaseMessage], add_messages]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_http_client():
+    """Create the pooled async HTTP client used for every Gemini request."""
+    import httpx
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=CHEF_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=CHEF_HTTP_MAX_KEEPALIVE,
+        ),
+        timeout=CHEF_HTTP_TIMEOUT_SECONDS,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_llm(model: str, temperature: float):
+    """Create the Gemini chat model once and reuse it across graph invocations."""
+    # Imported lazily: the Gemini client pulls in a large dependency tree
+    from google.genai import Client
+    from google.genai.types import HttpOptions
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    api_key = os.getenv("GOOGLE_API_KEY")
+    llm = ChatGoogleGenerativeAI(model=model, temperature=temperature, google_api_key=api_key)
+
+    # ChatGoogleGenerativeAI always builds its own SDK client, so replace it
+    # with one whose async calls go through the shared connection pool
+    llm.client = Client(
+        api_key=api_key, http_options=HttpOptions(httpx_async_client=_get_http_client())
     )
+    return llm
+
+
+def chef_advisor(state: ChefState):
+    """Chef advisor node that provides recipe suggestions and cooking advice."""
+
+    llm = _get_llm(CHEF_MODEL, CHEF_TEMPERATURE)
 
     # Prepare messages with system prompt
-    messages = [SystemMessage(content=system_prompt)] + state["messages"]
+    messages = [_SYSTEM_MESSAGE] + state["messages"]
 
     # Get the response from Gemini
     response = llm.invoke(messages)
@@ -84,19 +122,47 @@ def chef_advisor(state: ChefState):
     return {"messages": [response]}
 
 
-# Create the graph
-chef_graph_builder = StateGraph(ChefState)
+async def achef_advisor(state: ChefState):
+    """Async chef advisor node, awaiting Gemini instead of holding a thread."""
+
+    llm = _get_llm(CHEF_MODEL, CHEF_TEMPERATURE)
+
+    messages = [_SYSTEM_MESSAGE] + state["messages"]
+    response = await llm.ainvoke(messages)
+
+    return {"messages": [response]}
+
+
+@functools.lru_cache(maxsize=2)
+def _get_graph(checkpointed: bool = True):
+    """Build and compile the chef graph on first use.
+
+    The checkpointed graph keeps conversations by thread_id in memory; one-shot
+    calls use the graph without a checkpointer so they leave nothing behind.
+    """
+    from langchain_core.runnables import RunnableLambda
+    from langgraph.checkpoint.memory import MemorySaver
+    from langgraph.graph import END, START, StateGraph
+
+    # Create the graph
+    chef_graph_builder = StateGraph(ChefState)
+
+    # Add nodes; invoke runs the sync node and ainvoke awaits the async one
+    chef_graph_builder.add_node("chef_advisor", RunnableLambda(chef_advisor, afunc=achef_advisor))
 
-# Add nodes
-chef_graph_builder.add_node("chef_advisor", chef_advisor)
+    # Add edges
+    chef_graph_builder.add_edge(START, "chef_advisor")
+    chef_graph_builder.add_edge("chef_advisor", END)
 
-# Add edges
-chef_graph_builder.add_edge(START, "chef_advisor")
-chef_graph_builder.add_edge("chef_advisor", END)
+    # Compile the graph
+    return chef_graph_builder.compile(checkpointer=MemorySaver() if checkpointed else None)
 
-checkpointer = MemorySaver()
-# Compile the graph
-graph = chef_graph_builder.compile(checkpointer=checkpointer)
+
+def __getattr__(name: str):
+    """Expose the compiled graph as a lazily built module attribute."""
+    if name == "graph":
+        return _get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Helper functions for common recipe requests
@@ -107,7 +173,7 @@ def suggest_recipe_by_ingredients(ingredients: list[str]):
 
     initial_state = {"messages": [HumanMessage(content=user_input)]}
 
-    result = graph.invoke(initial_state)
+    result = _get_graph(checkpointed=False).invoke(initial_state)
     return result["messages"][-1].content
 
 
@@ -120,7 +186,7 @@ def suggest_recipe_by_cuisine(cuisine_type: str, dietary_restrictions: str = Non
 
     initial_state = {"messages": [HumanMessage(content=user_input)]}
 
-    result = graph.invoke(initial_state)
+    result = _get_graph(checkpointed=False).invoke(initial_state)
     return result["messages"][-1].content
 
 
@@ -128,7 +194,7 @@ def get_cooking_advice(question: str):
     """Get general cooking advice or tips."""
     initial_state = {"messages": [HumanMessage(content=question)]}
 
-    result = graph.invoke(initial_state)
+    result = _get_graph(checkpointed=False).invoke(initial_state)
     return result["messages"][-1].content
 
 
@@ -136,7 +202,23 @@ def run_chef_agent(user_input: str):
     """Run the chef advisor agent with user input."""
     initial_state = {"messages": [HumanMessage(content=user_input)]}
 
-    result = graph.invoke(initial_state)
+    result = _get_graph(checkpointed=False).invoke(initial_state)
+    return result["messages"][-1].content
+
+
+async def arun_chef_agent(user_input: str, thread_id: str | None = None):
+    """Run the chef advisor agent without blocking the event loop.
+
+    Passing the same thread_id across calls continues that conversation.
+    Without one the call is a one-shot exchange and is not checkpointed.
+    """
+    initial_state = {"messages": [HumanMessage(content=user_input)]}
+
+    if thread_id is None:
+        result = await _get_graph(checkpointed=False).ainvoke(initial_state)
+    else:
+        config = {"configurable": {"thread_id": thread_id}}
+        result = await _get_graph().ainvoke(initial_state, config=config)
     return result["messages"][-1].content
 
 
@@ -154,24 +236,9 @@ def interactive_chef_chat():
         print("Please set it with: export GOOGLE_API_KEY='your-api-key'")
         return
 
-    conversation_history = []
-
-    # Add system message to conversation history
-    system_prompt = """You are a professional chef advisor with extensive culinary knowledge. 
-    Your role is to:
-    - Suggest delicious recipes based on ingredients, dietary preferences, or cuisine types
-    - Provide cooking tips and techniques
-    - Recommend ingredient substitutions
-    - Offer meal planning advice
-    - Share cooking time estimates and difficulty levels
-    
-    Always be helpful, creative, and provide practical cooking advice. 
-    Include ingredient lists, step-by-step instructions, and helpful tips when suggesting recipes.
-    Consider dietary restrictions and preferences when making recommendations."""
-
-    from langchain_core.messages import SystemMessage
-
-    conversation_history.append(SystemMessage(content=system_prompt))
+    # The checkpointer accumulates the conversation under this thread id, so each
+    # turn only sends the new message (chef_advisor prepends the system prompt)
+    session_config = {"configurable": {"thread_id": f"interactive-{uuid.uuid4().hex}"}}
 
     print("\n👨‍🍳 Chef: Hello! I'm your personal chef advisor. What can I help you cook today?")
 
@@ -191,24 +258,18 @@ def interactive_chef_chat():
                 print("Please ask me about recipes, cooking tips, or type 'quit' to exit.")
                 continue
 
-            # Add user message to history
-            conversation_history.append(HumanMessage(content=user_input))
-
-            # Prepare state with conversation history
-            initial_state = {"messages": conversation_history.copy()}
+            # Send only the new user message
+            turn_state = {"messages": [HumanMessage(content=user_input)]}
 
             print("\n👨‍🍳 Chef: ", end="", flush=True)
 
             # Get response from chef agent
-            result = graph.invoke(initial_state)
+            result = _get_graph().invoke(turn_state, config=session_config)
             chef_response = result["messages"][-1]
 
             # Print the response
             print(chef_response.content)
 
-            # Add chef response to history
-            conversation_history.append(chef_response)
-
         except KeyboardInterrupt:
             print("\n\n👋 Chat interrupted. Happy cooking!")
             break
@@ -245,6 +306,8 @@ def run_test_examples():
 
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+
     load_dotenv()
     # Check if user wants to run test examples
     import sys
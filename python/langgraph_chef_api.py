@@ -1,8 +1,10 @@
 """Demo"""
 
+import importlib.util
 import os
 
 from dotenv import load_dotenv
+from pydantic import BaseModel
 
 load_dotenv()
 
@@ -12,7 +14,7 @@ from fastapi import FastAPI
 
 from agui_runtime.runtime_py import CopilotRuntime
 from agui_runtime.runtime_py.core.provider import AgentProvider
-from langgraph_chef_agent import graph
+from langgraph_chef_agent import arun_chef_agent
 
 app = FastAPI()
 runtime = CopilotRuntime()
@@ -28,10 +30,32 @@ def health():
     return {"status": "ok"}
 
 
+class ChefRequest(BaseModel):
+    """Chef advisor chat request."""
+
+    message: str
+    thread_id: str | None = None
+
+
+@app.post("/chef")
+async def chef(request: ChefRequest):
+    """Ask the chef advisor; awaits the model call so the worker stays free."""
+    response = await arun_chef_agent(request.message, request.thread_id)
+    return {"response": response}
+
+
 def main():
     """Run the uvicorn server."""
     port = int(os.getenv("PORT", "8000"))
-    uvicorn.run("langgraph_chef_api:app", host="0.0.0.0", port=port)
+    uvicorn.run(
+        "langgraph_chef_api:app",
+        host="0.0.0.0",
+        port=port,
+        # C event loop and HTTP parser from uvicorn[standard], when installed
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        http="httptools" if importlib.util.find_spec("httptools") else "auto",
+        workers=int(os.getenv("WORKERS", "1")),
+    )
 
 
 if __name__ == "__main__":
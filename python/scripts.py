@@ -15,11 +15,28 @@ Usage:
 """
 
 import argparse
+import contextlib
+import fnmatch
+import importlib.util
 import os
+import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Type checking command shared by check-types and check
+TYPE_CHECK_CMD = ["mypy", "copilotkit/"]
+
+# Cache directories removed anywhere in the tree by clean_build
+CACHE_DIR_NAMES = frozenset({"__pycache__", ".pytest_cache"})
+
+# Top-level build artifacts removed by clean_build, compiled into one pattern
+BUILD_ARTIFACT_PATTERN = re.compile(
+    "|".join(fnmatch.translate(pattern) for pattern in ("htmlcov", "*.egg-info", "build", "dist"))
+)
+
 
 def run_command(cmd: list[str], check: bool = True, cwd: Path | None = None) -> int:
     """
@@ -56,6 +73,7 @@ def dev_server():
             "0.0.0.0",
             "--port",
             "8000",
+            *uvicorn_speed_options(),
         ]
     )
 
@@ -65,6 +83,49 @@ def start_server():
     return run_command(["python", "-m", "agui_runtime.runtime_py.cli"])
 
 
+def uvicorn_speed_options() -> list[str]:
+    """
+    Build uvicorn options selecting the C event loop and HTTP parser.
+
+    uvloop and httptools ship with uvicorn[standard]; each is only
+    requested when installed so the server still starts without them.
+
+    Returns:
+        Extra uvicorn command-line options
+    """
+    options = []
+
+    if importlib.util.find_spec("uvloop") is not None:
+        options.extend(["--loop", "uvloop"])
+
+    if importlib.util.find_spec("httptools") is not None:
+        options.extend(["--http", "httptools"])
+
+    return options
+
+
+def pytest_speed_options() -> list[str]:
+    """
+    Build pytest options that shorten the test cycle.
+
+    Tests are distributed across all cores with pytest-xdist when it is
+    installed, keeping each file on a single worker so module-level
+    fixtures are still shared. The cache provider is disabled on CI.
+
+    Returns:
+        Extra pytest command-line options
+    """
+    options = ["--import-mode=importlib"]
+
+    if importlib.util.find_spec("xdist") is not None:
+        options.extend(["-n", "auto", "--dist=loadfile"])
+
+    if os.getenv("CI"):
+        options.extend(["-p", "no:cacheprovider"])
+
+    return options
+
+
 def run_tests(category: str | None = None):
     """
     Run tests.
@@ -72,7 +133,7 @@ def run_tests(category: str | None = None):
     Args:
         category: Test category (unit, integration, e2e) or None for all
     """
-    cmd = ["pytest"]
+    cmd = ["pytest", *pytest_speed_options()]
 
     if category:
         if category == "unit":
@@ -101,44 +162,92 @@ def run_tests_with_coverage():
     )
 
 
-def run_lint(fix: bool = False):
+def run_commands_parallel(cmds: list[list[str]], cwd: Path | None = None) -> list[int]:
     """
-    Run linting tools.
+    Run independent commands concurrently.
+
+    Output of each command is captured and printed once it finishes so
+    results from different tools don't interleave.
+
+    Args:
+        cmds: Commands to run
+        cwd: Working directory for the commands
+
+    Returns:
+        Exit codes in the same order as the commands
+    """
+
+    def run_captured(cmd: list[str]) -> tuple[int, str]:
+        process = subprocess.Popen(
+            cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+        output, _ = process.communicate()
+        return process.returncode, output
+
+    for cmd in cmds:
+        print(f"Running: {' '.join(cmd)}")
+
+    return_codes = [0] * len(cmds)
+    with ThreadPoolExecutor(max_workers=len(cmds)) as executor:
+        futures = {executor.submit(run_captured, cmd): index for index, cmd in enumerate(cmds)}
+        for future in as_completed(futures):
+            index = futures[future]
+            return_code, output = future.result()
+            return_codes[index] = return_code
+            print(f"\nFinished: {' '.join(cmds[index])} (exit code {return_code})")
+            print(output, end="")
+
+    return return_codes
+
+
+def lint_commands(fix: bool = False) -> list[list[str]]:
+    """
+    Build the linting commands.
 
     Args:
         fix: Whether to automatically fix issues
+
+    Returns:
+        ruff and black commands
     """
-    # Run ruff
     ruff_cmd = ["ruff", "check", "."]
     if fix:
         ruff_cmd.append("--fix")
 
-    ruff_result = run_command(ruff_cmd, check=False)
-
-    # Run black
     black_cmd = ["black", "."]
     if not fix:
         black_cmd.append("--check")
 
-    black_result = run_command(black_cmd, check=False)
+    return [ruff_cmd, black_cmd]
+
 
-    return max(ruff_result, black_result)
+def run_lint(fix: bool = False):
+    """
+    Run linting tools.
+
+    Args:
+        fix: Whether to automatically fix issues
+    """
+    cmds = lint_commands(fix)
+
+    # Fixers rewrite the same files, so they must not run concurrently
+    if fix:
+        return max(run_command(cmd, check=False) for cmd in cmds)
+
+    return max(run_commands_parallel(cmds))
 
 
 def run_type_check():
     """Run type checking with mypy."""
-    return run_command(["mypy", "copilotkit/"], check=False)
+    return run_command(TYPE_CHECK_CMD, check=False)
 
 
 def run_all_checks():
     """Run all code quality checks."""
-    print("Running linting...")
-    lint_result = run_lint()
+    print("Running linting and type checking...")
+    results = run_commands_parallel([*lint_commands(), TYPE_CHECK_CMD])
 
-    print("\nRunning type checking...")
-    type_result = run_type_check()
-
-    if lint_result == 0 and type_result == 0:
+    if max(results) == 0:
         print("\n✅ All checks passed!")
         return 0
     else:
@@ -151,45 +260,60 @@ def format_code():
     return run_command(["black", "."])
 
 
+def _collect_cache_entries(path: str, dir_paths: list[str], file_paths: list[str]) -> None:
+    """
+    Recursively collect cache directories and compiled files under a path.
+
+    Cache directories are not descended into since they are removed whole.
+    Directories that cannot be read are skipped, as os.walk does.
+
+    Args:
+        path: Directory to scan
+        dir_paths: List receiving cache directory paths
+        file_paths: List receiving cache file paths
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in CACHE_DIR_NAMES:
+                        dir_paths.append(entry.path)
+                    else:
+                        _collect_cache_entries(entry.path, dir_paths, file_paths)
+                elif entry.name.endswith(".pyc") or entry.name == ".coverage":
+                    file_paths.append(entry.path)
+    except OSError:
+        return
+
+
 def clean_build():
     """Clean build artifacts and cache files."""
-    import shutil
-
-    # Directories to clean
-    clean_dirs = [
-        "__pycache__",
-        ".pytest_cache",
-        "htmlcov",
-        ".coverage",
-        "*.egg-info",
-        "build",
-        "dist",
-    ]
-
-    # Find and remove cache directories
-    for root, dirs, files in os.walk("."):
-        for dir_name in dirs:
-            if dir_name in ["__pycache__", ".pytest_cache"]:
-                dir_path = Path(root) / dir_name
-                print(f"Removing: {dir_path}")
-                shutil.rmtree(dir_path, ignore_errors=True)
-
-        # Remove files
-        for file_name in files:
-            if file_name.endswith(".pyc") or file_name == ".coverage":
-                file_path = Path(root) / file_name
-                print(f"Removing: {file_path}")
-                file_path.unlink(missing_ok=True)
+    # Collect everything first so nothing is deleted while the tree is being scanned
+    dir_paths: list[str] = []
+    file_paths: list[str] = []
+    _collect_cache_entries(".", dir_paths, file_paths)
+
+    # Remove deepest directories first
+    for dir_path in sorted(dir_paths, key=lambda p: p.count(os.sep), reverse=True):
+        print(f"Removing: {dir_path}")
+        shutil.rmtree(dir_path, ignore_errors=True)
+
+    for file_path in file_paths:
+        print(f"Removing: {file_path}")
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(file_path)
 
     # Remove build directories
-    for pattern in ["htmlcov", "*.egg-info", "build", "dist"]:
-        for path in Path(".").glob(pattern):
-            if path.is_dir():
-                print(f"Removing directory: {path}")
-                shutil.rmtree(path, ignore_errors=True)
+    with os.scandir(".") as entries:
+        for entry in entries:
+            if not BUILD_ARTIFACT_PATTERN.match(entry.name):
+                continue
+            if entry.is_dir():
+                print(f"Removing directory: {entry.path}")
+                shutil.rmtree(entry.path, ignore_errors=True)
             else:
-                print(f"Removing file: {path}")
-                path.unlink(missing_ok=True)
+                print(f"Removing file: {entry.path}")
+                Path(entry.path).unlink(missing_ok=True)
 
     print("✅ Cleanup completed!")
     return 0
@@ -207,24 +331,39 @@ def update_deps():
 
 def show_schema():
     """Show GraphQL schema."""
-    return run_command(
-        [
-            "python",
-            "-c",
-            "from agui_runtime.runtime_py.graphql.schema import get_schema_sdl; print(get_schema_sdl())",
-        ]
-    )
+    try:
+        from agui_runtime.runtime_py.graphql.schema import get_schema_sdl
+    except ImportError:
+        # Not importable from this interpreter; fall back to the project's python
+        return run_command(
+            [
+                "python",
+                "-c",
+                "from agui_runtime.runtime_py.graphql.schema import get_schema_sdl; print(get_schema_sdl())",
+            ]
+        )
+
+    print(get_schema_sdl())
+    return 0
 
 
 def show_info():
     """Show runtime information."""
-    return run_command(
-        [
-            "python",
-            "-c",
-            "from agui_runtime.runtime_py.core import CopilotRuntime; runtime = CopilotRuntime(); print(repr(runtime))",
-        ]
-    )
+    try:
+        from agui_runtime.runtime_py.core import CopilotRuntime
+    except ImportError:
+        # Not importable from this interpreter; fall back to the project's python
+        return run_command(
+            [
+                "python",
+                "-c",
+                "from agui_runtime.runtime_py.core import CopilotRuntime; runtime = CopilotRuntime(); print(repr(runtime))",
+            ]
+        )
+
+    runtime = CopilotRuntime()
+    print(repr(runtime))
+    return 0
 
 
 def main():
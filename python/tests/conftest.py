@@ -0,0 +1,48 @@
+"""
+Session-wide pytest configuration for the AGUI Runtime test suite.
+
+Provides opt-in profiling of a test run:
+
+    pytest --profile=profile.html tests/integration
+
+pyinstrument is not a test dependency; install it separately to use the
+option. It samples the main thread, which is where the async tests drive the
+ASGI app through httpx, so awaits inside resolvers and middleware show up in
+the report. Run without -n, since each xdist worker would profile separately.
+"""
+
+import pytest
+
+_PROFILER_KEY = pytest.StashKey[object]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--profile",
+        metavar="PATH",
+        default=None,
+        help="profile the test session with pyinstrument and write an HTML report to PATH",
+    )
+
+
+def pytest_sessionstart(session):
+    if not session.config.getoption("--profile"):
+        return
+
+    try:
+        from pyinstrument import Profiler
+    except ImportError as e:
+        raise pytest.UsageError("--profile requires pyinstrument (pip install pyinstrument)") from e
+
+    profiler = Profiler(async_mode="enabled")
+    profiler.start()
+    session.config.stash[_PROFILER_KEY] = profiler
+
+
+def pytest_sessionfinish(session):
+    profiler = session.config.stash.get(_PROFILER_KEY, None)
+    if profiler is None:
+        return
+
+    profiler.stop()
+    profiler.write_html(session.config.getoption("--profile"))
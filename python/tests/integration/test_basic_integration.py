@@ -3,37 +3,201 @@ Basic Integration Tests for Phase 1 - CopilotRuntime and FastAPI Integration.
 
 Tests the complete integration of CopilotRuntime with FastAPI applications,
 including GraphQL schema mounting, middleware stack, and basic API functionality.
+
+Apps are mounted once in fixtures and tests leave them unchanged (tests that
+register providers go through mutable_runtime, which restores them),
+so the tests are independent and safe to run in parallel under pytest-xdist.
+The HTTP clients (httpx, TestClient) are imported inside the fixtures so that
+collecting this module doesn't pay for them.
 """
 
+import asyncio
+import time
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, Mock
+from fastapi.middleware.cors import CORSMiddleware
 import json
 
 from agui_runtime.runtime_py.core.runtime import CopilotRuntime
 from agui_runtime.runtime_py.core.types import RuntimeConfig, AgentDescriptor
 from agui_runtime.runtime_py.core.provider import AgentProvider
+from agui_runtime.runtime_py.graphql.schema import get_schema_sdl
+
+try:
+    import orjson
+except ImportError:  # serialization extra not installed
+    orjson = None
+
+
+# Queries are module constants so every request sends the identical document,
+# which the schema's parser and validation caches key on
+AVAILABLE_AGENTS_QUERY = """
+{
+    availableAgents {
+        agents {
+            name
+            description
+        }
+    }
+}
+"""
+
+RUNTIME_INFO_QUERY = """
+{
+    runtimeInfo {
+        version
+        providers
+        agentsCount
+    }
+}
+"""
+
+INVALID_QUERY = "invalid query syntax {"
+
+# Aliased root fields let one request cover both smoke checks
+COMBINED_QUERY = """
+{
+    a: availableAgents {
+        agents {
+            name
+        }
+    }
+    r: runtimeInfo {
+        version
+        providers
+        agentsCount
+    }
+}
+"""
+
+# The end-to-end workflow reads everything it needs in one named operation,
+# then writes state with a second request
+WORKFLOW_QUERY = """
+query Combined {
+    runtimeInfo {
+        version
+        providers
+        agentsCount
+    }
+    availableAgents {
+        agents {
+            name
+            description
+        }
+    }
+}
+"""
+
+SAVE_STATE_MUTATION = """
+mutation SaveState($data: SaveAgentStateInput!) {
+    saveAgentState(data: $data) {
+        threadId
+        agentName
+        success
+        errorMessage
+    }
+}
+"""
+
+WORKFLOW_THREAD_ID = "workflow-thread"
+
+
+def _graphql_operation(query, variables=None):
+    """Build one GraphQL operation payload."""
+    operation = {"query": query}
+    if variables is not None:
+        operation["variables"] = variables
+    return operation
+
+
+def _encode_json(payload):
+    """Encode a request body compactly."""
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _graphql_body(query, variables=None):
+    """Encode a GraphQL request body once, at import time."""
+    return _encode_json(_graphql_operation(query, variables))
+
+
+def _graphql_batch_body(*operations):
+    """Encode a batched (JSON array) GraphQL request body once, at import time."""
+    return _encode_json(list(operations))
+
+
+# Fixed request bodies are pre-serialized so tests don't re-encode them per request
+JSON_HEADERS = {"content-type": "application/json"}
+TYPENAME_BODY = _graphql_body("{ __typename }")
+HELLO_BODY = _graphql_body("{ hello }")
+AVAILABLE_AGENTS_BODY = _graphql_body(AVAILABLE_AGENTS_QUERY)
+RUNTIME_INFO_BODY = _graphql_body(RUNTIME_INFO_QUERY)
+INVALID_BODY = _graphql_body(INVALID_QUERY)
+COMBINED_BODY = _graphql_body(COMBINED_QUERY)
+# The reads and the mutation travel together as one batched request
+WORKFLOW_BATCH_BODY = _graphql_batch_body(
+    _graphql_operation(WORKFLOW_QUERY),
+    _graphql_operation(
+        SAVE_STATE_MUTATION,
+        {
+            "data": {
+                "threadId": WORKFLOW_THREAD_ID,
+                "agentName": "test-agent",
+                "stateData": json.dumps({"step": 1}),
+            }
+        },
+    ),
+)
+
+# Agent descriptors are immutable test data, built once for the module
+TEST_AGENT = AgentDescriptor(
+    name="test-agent",
+    description="A test agent for integration testing",
+    provider="mock-provider",
+)
+SECOND_TEST_AGENT = AgentDescriptor(
+    name="agent-2", description="Second test agent", provider="mock-provider-2"
+)
+
+# Runtime configs are never mutated by the runtime, so each is validated once
+# and shared by every runtime built from it
+MOUNTED_CONFIG = RuntimeConfig(
+    debug=True,
+    cors_origins=["http://localhost:3000"],
+    middleware_stack_enabled=True,
+)
+DEBUG_CONFIG = RuntimeConfig(debug=True)
+DEBUG_CORS_CONFIG = RuntimeConfig(debug=True, cors_origins=["*"])
+PRODUCTION_CONFIG = RuntimeConfig(debug=False, cors_origins=["https://example.com"])
+
+
+class _EmptyAsyncIterator:
+    """Async iterator that is exhausted from the start."""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+# Shared by every run; it holds no state, so one instance serves all callers
+_EMPTY_EVENTS = _EmptyAsyncIterator()
 
 
 class MockAgentProvider(AgentProvider):
     """Mock provider for testing purposes."""
 
+    # Shared by every instance; tests that need other agents assign their own tuple
+    _agents = (TEST_AGENT,)
+
     def __init__(self):
         self._name = "mock-provider"
-        self._agents = [
-            AgentDescriptor(
-                name="test-agent",
-                description="A test agent for integration testing",
-                provider="mock-provider",
-            )
-        ]
 
     @property
     def name(self) -> str:
         return self._name
 
-    async def list_agents(self) -> list[AgentDescriptor]:
+    async def list_agents(self) -> tuple[AgentDescriptor, ...]:
         return self._agents
 
     async def initialize(self) -> None:
@@ -44,130 +208,244 @@ class MockAgentProvider(AgentProvider):
 
     async def execute_run(self, messages, context):
         """Mock execute_run method for testing."""
+        return _EMPTY_EVENTS
 
-        # Return empty async iterator for testing
-        async def empty_iterator():
-            yield
 
-        return empty_iterator()
+# Raised for every failing call; the traceback is cleared on each raise so
+# frames from earlier tests don't pile up on the shared instance
+_PROVIDER_ERROR = RuntimeError("Provider error")
 
 
-class TestBasicIntegration:
-    """Basic integration tests for CopilotRuntime and FastAPI."""
+class FailingProvider(MockAgentProvider):
+    """Provider whose agent listing always fails."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.config = RuntimeConfig(
-            debug=True,
-            cors_allow_origins=["http://localhost:3000"],
-            middleware_stack_enabled=True,
-        )
-        self.runtime = CopilotRuntime(config=self.config)
-        self.mock_provider = MockAgentProvider()
+    def __init__(self):
+        self._name = "failing-provider"
 
-    def test_runtime_fastapi_integration(self):
-        """Test complete runtime integration with FastAPI."""
-        app = FastAPI()
+    async def list_agents(self) -> tuple[AgentDescriptor, ...]:
+        raise _PROVIDER_ERROR.with_traceback(None)
 
-        # Add mock provider
-        self.runtime.add_provider(self.mock_provider)
 
-        # Mount runtime to FastAPI
-        self.runtime.mount_to_fastapi(app, path="/api/copilotkit")
+# Stateless, so one instance serves every test that needs a failing provider
+FAILING_PROVIDER = FailingProvider()
 
-        # Verify mounting was successful
-        assert self.runtime._mounted_app is app
-        assert self.runtime._mount_path == "/api/copilotkit"
 
-        # Test with client
-        client = TestClient(app)
+def _json(response):
+    """Decode a response body, with orjson when the serialization extra is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _test_client(app):
+    """Wrap app in a TestClient, importing httpx only once a test needs a client."""
+    from fastapi.testclient import TestClient
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def mounted_client():
+    """Runtime with the mock provider, mounted once and shared by the session."""
+    runtime = CopilotRuntime(config=MOUNTED_CONFIG)
+    runtime.add_provider(MockAgentProvider())
+
+    app = FastAPI()
+    runtime.mount_to_fastapi(app, path="/api/copilotkit")
+
+    # Entering the client runs the app's lifespan once for the whole session
+    with _test_client(app) as client:
+        yield runtime, client
+
+
+@pytest.fixture
+def mutable_runtime(mounted_client):
+    """The shared runtime, with its providers restored after the test."""
+    runtime, _ = mounted_client
+    snapshot = {name: runtime.get_provider(name) for name in runtime.list_providers()}
+    try:
+        yield runtime
+    finally:
+        for name in runtime.list_providers():
+            if snapshot.get(name) is not runtime.get_provider(name):
+                runtime.remove_provider(name)
+        for name, provider in snapshot.items():
+            if name not in runtime.list_providers():
+                runtime.add_provider(provider)
+
+
+@pytest.fixture
+async def async_client(mounted_client):
+    """In-process async client for the shared app, bypassing TestClient's thread bridge."""
+    import httpx
+
+    _, client = mounted_client
+    transport = httpx.ASGITransport(app=client.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest.fixture(
+    scope="module",
+    params=[DEBUG_CORS_CONFIG, PRODUCTION_CONFIG, MOUNTED_CONFIG],
+    ids=["debug", "production", "middleware"],
+)
+def configured_client(request):
+    """Client for a runtime fully mounted with each configuration, built once per config."""
+    runtime = CopilotRuntime(config=request.param)
+
+    app = FastAPI()
+    runtime.mount_to_fastapi(app, path="/api/copilotkit")
+
+    with _test_client(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="module", params=["/custom/runtime/path"])
+def custom_path_client(request):
+    """Client for a runtime mounted at each custom path, with that path."""
+    runtime = CopilotRuntime()
+
+    app = FastAPI()
+    runtime.mount_to_fastapi(app, path=request.param, minimal=True)
+
+    with _test_client(app) as client:
+        yield request.param, client
+
+
+class TestBasicIntegration:
+    """Basic integration tests for CopilotRuntime and FastAPI."""
+
+    def test_runtime_fastapi_integration(self, mounted_client):
+        """Test complete runtime integration with FastAPI."""
+        runtime, client = mounted_client
+
+        # Verify mounting was successful
+        assert runtime._mounted_app is client.app
+        assert runtime._mount_path == "/api/copilotkit"
 
         # Test health endpoint
         response = client.get("/api/copilotkit/health")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["status"] == "healthy"
 
-    def test_graphql_endpoint_availability(self):
+    @pytest.mark.asyncio
+    async def test_graphql_endpoint_availability(self, async_client):
         """Test GraphQL endpoint is properly mounted."""
-        app = FastAPI()
-        self.runtime.add_provider(self.mock_provider)
-        self.runtime.mount_to_fastapi(app, path="/api/copilotkit")
-
-        client = TestClient(app)
-
         # Test GraphQL endpoint responds (even if query fails, endpoint should exist)
-        response = client.post("/api/copilotkit/graphql", json={"query": "{ __typename }"})
+        response = await async_client.post(
+            "/api/copilotkit/graphql", content=TYPENAME_BODY, headers=JSON_HEADERS
+        )
         # Should get a response (not 404), even if it's an error
         assert response.status_code != 404
 
-    def test_available_agents_query(self):
-        """Test availableAgents GraphQL query."""
-        app = FastAPI()
-        self.runtime.add_provider(self.mock_provider)
-        self.runtime.mount_to_fastapi(app, path="/api/copilotkit")
-
-        client = TestClient(app)
+    @pytest.mark.asyncio
+    async def test_graphql_smoke(self, async_client):
+        """Test both root queries resolve in a single multi-field request."""
+        response = await async_client.post(
+            "/api/copilotkit/graphql", content=COMBINED_BODY, headers=JSON_HEADERS
+        )
 
-        # Test availableAgents query
-        query = """
-        {
-            availableAgents {
-                agents {
-                    name
-                    description
-                }
-            }
-        }
-        """
+        assert response.status_code == 200
+        payload = _json(response)
+        assert "errors" not in payload
+        data = payload["data"]
+        assert [agent["name"] for agent in data["a"]["agents"]] == [TEST_AGENT.name]
+        assert data["r"]["providers"] == ["mock-provider"]
+        assert data["r"]["agentsCount"] == 1
 
-        response = client.post("/api/copilotkit/graphql", json={"query": query})
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "body, expected_field",
+        [
+            (AVAILABLE_AGENTS_BODY, "availableAgents"),
+            (RUNTIME_INFO_BODY, "runtimeInfo"),
+            (INVALID_BODY, None),
+        ],
+        ids=["available_agents", "runtime_info", "invalid_syntax"],
+    )
+    async def test_graphql_queries(self, async_client, body, expected_field):
+        """Test GraphQL queries, including graceful handling of invalid syntax."""
+        response = await async_client.post(
+            "/api/copilotkit/graphql", content=body, headers=JSON_HEADERS
+        )
 
         # Should not be 404 or 500
         assert response.status_code in [200, 400, 422]  # 400 for GraphQL errors, 422 for validation errors
 
         if response.status_code == 200:
-            data = response.json()
+            data = _json(response)
             # If successful, should have the expected structure
-            if "data" in data and data["data"] is not None:
-                assert "availableAgents" in data["data"]
+            if expected_field and "data" in data and data["data"] is not None:
+                assert expected_field in data["data"]
+            # GraphQL errors should be in errors field
+            if "errors" in data:
+                assert isinstance(data["errors"], list)
 
-    def test_runtime_info_query(self):
-        """Test runtime info query."""
-        app = FastAPI()
-        self.runtime.add_provider(self.mock_provider)
-        self.runtime.mount_to_fastapi(app, path="/api/copilotkit")
+    @pytest.mark.asyncio
+    async def test_concurrent_graphql_requests(self, async_client, record_property):
+        """Test concurrent GraphQL requests on one event loop all succeed."""
+        start = time.perf_counter_ns()
+        responses = await asyncio.gather(
+            *(
+                async_client.post(
+                    "/api/copilotkit/graphql", content=RUNTIME_INFO_BODY, headers=JSON_HEADERS
+                )
+                for _ in range(10)
+            )
+        )
+        # Reported (e.g. in JUnit XML) for trend tracking rather than asserted,
+        # so slow CI machines don't turn it into a flaky failure
+        record_property("elapsed_ms", (time.perf_counter_ns() - start) / 1e6)
 
-        client = TestClient(app)
+        assert [response.status_code for response in responses] == [200] * 10
+        assert all(_json(response)["data"]["runtimeInfo"] for response in responses)
 
-        # Test runtimeInfo query
-        query = """
-        {
-            runtimeInfo {
-                version
-                providers
-                agentsCount
-            }
-        }
-        """
+    @pytest.mark.asyncio
+    async def test_complete_graphql_workflow(self, async_client):
+        """Test health, then combined reads and a state-saving mutation in one batch."""
+        health = await async_client.get("/api/copilotkit/health")
+        assert health.status_code == 200
+
+        # One POST carries both operations; results come back in request order
+        response = await async_client.post(
+            "/api/copilotkit/graphql", content=WORKFLOW_BATCH_BODY, headers=JSON_HEADERS
+        )
+        assert response.status_code == 200
+        reads, write = _json(response)
 
-        response = client.post("/api/copilotkit/graphql", json={"query": query})
+        data = reads["data"]
+        assert data["runtimeInfo"]["agentsCount"] == len(data["availableAgents"]["agents"])
+        assert data["availableAgents"]["agents"][0]["name"] == TEST_AGENT.name
 
-        # Should not be 404 or 500
-        assert response.status_code in [200, 400, 422]  # 400 for GraphQL errors, 422 for validation errors
+        saved = write["data"]["saveAgentState"]
+        assert saved["threadId"] == WORKFLOW_THREAD_ID
+        assert saved["success"] is True, saved["errorMessage"]
 
-        if response.status_code == 200:
-            data = response.json()
-            # If successful, should have the expected structure
-            if "data" in data and data["data"] is not None:
-                assert "runtimeInfo" in data["data"]
+    def test_graphql_schema_introspection(self, mounted_client):
+        """Test the schema endpoint serves the cached SDL."""
+        _, client = mounted_client
 
-    def test_cors_middleware_integration(self):
-        """Test CORS middleware is properly configured."""
-        app = FastAPI()
-        self.runtime.mount_to_fastapi(app, path="/api/copilotkit")
+        first = client.get("/api/copilotkit/graphql/schema")
+        second = client.get("/api/copilotkit/graphql/schema")
+
+        assert first.status_code == 200
+        assert _json(first) == {"schema": get_schema_sdl(), "format": "SDL"}
+        assert second.content == first.content
+
+    def test_cors_middleware_integration(self, mounted_client):
+        """Test CORS middleware is configured with the runtime's origins."""
+        runtime, client = mounted_client
 
-        client = TestClient(app)
+        cors_middleware = [m for m in client.app.user_middleware if m.cls is CORSMiddleware]
+        assert len(cors_middleware) == 1
+        assert cors_middleware[0].kwargs["allow_origins"] == runtime.config.cors_origins
+
+    @pytest.mark.slow
+    def test_cors_preflight_smoke(self, mounted_client):
+        """Test an end-to-end OPTIONS request is handled."""
+        _, client = mounted_client
 
         # Test preflight request
         response = client.options(
@@ -177,49 +455,41 @@ class TestBasicIntegration:
         # CORS should be handled
         assert response.status_code in [200, 204, 405]  # Various acceptable CORS responses
 
-    def test_multiple_providers_integration(self):
+    def test_multiple_providers_integration(self, mutable_runtime):
         """Test runtime with multiple providers."""
         # Create second mock provider
         provider2 = MockAgentProvider()
         provider2._name = "mock-provider-2"
-        provider2._agents = [
-            AgentDescriptor(
-                name="agent-2", description="Second test agent", provider="mock-provider-2"
-            )
-        ]
+        provider2._agents = (SECOND_TEST_AGENT,)
 
-        app = FastAPI()
-
-        # Add both providers
-        self.runtime.add_provider(self.mock_provider)
-        self.runtime.add_provider(provider2)
-
-        # Mount runtime
-        self.runtime.mount_to_fastapi(app, path="/api/copilotkit")
+        mutable_runtime.add_provider(provider2)
 
         # Verify both providers are registered
-        assert len(self.runtime.list_providers()) == 2
-        assert "mock-provider" in self.runtime.list_providers()
-        assert "mock-provider-2" in self.runtime.list_providers()
+        assert len(mutable_runtime.list_providers()) == 2
+        assert "mock-provider" in mutable_runtime.list_providers()
+        assert "mock-provider-2" in mutable_runtime.list_providers()
 
-    def test_error_handling_integration(self):
-        """Test error handling in integration scenario."""
-        app = FastAPI()
-        self.runtime.mount_to_fastapi(app, path="/api/copilotkit")
+    @pytest.mark.asyncio
+    async def test_error_resilience(self, mutable_runtime, async_client):
+        """Test a failing provider doesn't break agent discovery for the others."""
+        mutable_runtime.add_provider(FAILING_PROVIDER)
 
-        client = TestClient(app)
+        agents = await mutable_runtime.discover_agents(refresh_cache=True)
+        assert [agent.name for agent in agents] == [TEST_AGENT.name]
 
-        # Test invalid GraphQL query
-        response = client.post("/api/copilotkit/graphql", json={"query": "invalid query syntax {"})
+        response = await async_client.post(
+            "/api/copilotkit/graphql", content=AVAILABLE_AGENTS_BODY, headers=JSON_HEADERS
+        )
+        assert response.status_code == 200
+        names = [agent["name"] for agent in _json(response)["data"]["availableAgents"]["agents"]]
+        assert names == [TEST_AGENT.name]
 
-        # Should handle error gracefully
-        assert response.status_code in [200, 400, 422]
+    @pytest.mark.asyncio
+    async def test_mock_provider_run_yields_no_events(self):
+        """Test the mock provider's run stream is empty."""
+        events = await MockAgentProvider().execute_run([], None)
 
-        if response.status_code == 200:
-            data = response.json()
-            # GraphQL errors should be in errors field
-            if "errors" in data:
-                assert isinstance(data["errors"], list)
+        assert [event async for event in events] == []
 
 
 class TestRuntimeLifecycle:
@@ -227,8 +497,7 @@ class TestRuntimeLifecycle:
 
     def test_runtime_startup_shutdown(self):
         """Test runtime startup and shutdown cycle."""
-        config = RuntimeConfig(debug=True)
-        runtime = CopilotRuntime(config=config)
+        runtime = CopilotRuntime(config=DEBUG_CONFIG)
         mock_provider = MockAgentProvider()
 
         runtime.add_provider(mock_provider)
@@ -243,9 +512,7 @@ class TestRuntimeLifecycle:
     @pytest.mark.asyncio
     async def test_async_runtime_context(self):
         """Test runtime async context manager."""
-        config = RuntimeConfig(debug=True)
-
-        async with CopilotRuntime(config=config) as runtime:
+        async with CopilotRuntime(config=DEBUG_CONFIG) as runtime:
             mock_provider = MockAgentProvider()
             runtime.add_provider(mock_provider)
 
@@ -259,44 +526,20 @@ class TestRuntimeLifecycle:
 class TestConfigurationIntegration:
     """Test various configuration scenarios."""
 
-    def test_debug_mode_integration(self):
-        """Test runtime behavior in debug mode."""
-        config = RuntimeConfig(debug=True, cors_allow_origins=["*"])
-        runtime = CopilotRuntime(config=config)
-
-        app = FastAPI()
-        runtime.mount_to_fastapi(app, path="/api/copilotkit")
-
-        client = TestClient(app)
-
-        # Debug mode should be reflected in responses
-        response = client.get("/api/copilotkit/health")
+    def test_mode_integration(self, configured_client):
+        """Test every configuration serves health and GraphQL."""
+        response = configured_client.get("/api/copilotkit/health")
         assert response.status_code == 200
 
-    def test_production_mode_integration(self):
-        """Test runtime behavior in production mode."""
-        config = RuntimeConfig(debug=False, cors_allow_origins=["https://example.com"])
-        runtime = CopilotRuntime(config=config)
-
-        app = FastAPI()
-        runtime.mount_to_fastapi(app, path="/api/copilotkit")
-
-        client = TestClient(app)
-
-        # Production mode should still work
-        response = client.get("/api/copilotkit/health")
+        response = configured_client.post(
+            "/api/copilotkit/graphql", content=HELLO_BODY, headers=JSON_HEADERS
+        )
         assert response.status_code == 200
+        assert _json(response)["data"]["hello"]
 
-    def test_custom_mount_path_integration(self):
+    def test_custom_mount_path_integration(self, custom_path_client):
         """Test runtime with custom mount path."""
-        runtime = CopilotRuntime()
-        app = FastAPI()
-
-        # Mount at custom path
-        custom_path = "/custom/runtime/path"
-        runtime.mount_to_fastapi(app, path=custom_path)
-
-        client = TestClient(app)
+        custom_path, client = custom_path_client
 
         # Health endpoint should be at custom path
         response = client.get(f"{custom_path}/health")
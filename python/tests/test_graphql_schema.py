@@ -5,26 +5,120 @@ This module tests all GraphQL types, resolvers, context handling, and error
 management implemented in Phase 2 of the CopilotKit Python Runtime port.
 """
 
+import asyncio
 import datetime
 import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 from typing import Any, Dict
 
-import strawberry
-
-from agui_runtime.runtime_py.core.runtime import CopilotRuntime
-from agui_runtime.runtime_py.core.types import RuntimeConfig, AgentDescriptor
-from agui_runtime.runtime_py.graphql.schema import schema
+from strawberry.extensions import ParserCache, ValidationCache
+
+from agui_runtime.runtime_py.core.types import AgentDescriptor, RuntimeContext
+from agui_runtime.runtime_py.graphql.schema import (
+    LoadAgentStateInput,
+    LoadAgentStateResponse,
+    MessageRole,
+    MessageStatus,
+    SaveAgentStateInput,
+    SaveAgentStateResponse,
+    StreamingConfigInput,
+    get_schema_sdl,
+    schema,
+    validate_schema_compatibility,
+)
 from agui_runtime.runtime_py.graphql.context import GraphQLExecutionContext, create_graphql_context
-from agui_runtime.runtime_py.graphql.errors import CopilotKitError, CopilotErrorCode
-from agui_runtime.runtime_py.storage import (
-    StateStoreManager,
-    StateStoreConfig,
-    StorageBackendType,
-    StoredState,
-    StateMetadata,
+from agui_runtime.runtime_py.graphql.errors import (
+    CopilotErrorCode,
+    CopilotKitError,
+    map_exception_to_error,
 )
+from agui_runtime.runtime_py.storage import StateMetadata, StoredState
+from agui_runtime.runtime_py.storage.base import StorageError
+
+
+# Wire values the enums must keep for TypeScript compatibility
+MESSAGE_ROLE_VALUES = frozenset({"user", "assistant", "system", "tool", "developer"})
+MESSAGE_STATUS_VALUES = frozenset({"pending", "inProgress", "completed", "failed", "cancelled"})
+
+AVAILABLE_AGENTS_QUERY = """
+query {
+    availableAgents {
+        agents {
+            name
+            description
+            version
+            capabilities
+        }
+    }
+}
+"""
+
+LOAD_AGENT_STATE_QUERY = """
+query LoadAgentState($data: LoadAgentStateInput!) {
+    loadAgentState(data: $data) {
+        threadId
+        agentName
+        stateData
+        stateFound
+        lastUpdated
+        errorMessage
+    }
+}
+"""
+
+GENERATE_RESPONSE_MUTATION = """
+mutation GenerateResponse($data: GenerateCopilotResponseInput!) {
+    generateCopilotResponse(data: $data) {
+        threadId
+        messages {
+            __typename
+            ... on Message {
+                id
+                role
+                content
+                status
+            }
+        }
+        status
+        errorMessage
+    }
+}
+"""
+
+SAVE_AGENT_STATE_MUTATION = """
+mutation SaveAgentState($data: SaveAgentStateInput!) {
+    saveAgentState(data: $data) {
+        threadId
+        agentName
+        success
+        stateKey
+        savedAt
+        errorMessage
+    }
+}
+"""
+
+# Save then generate in one request, as the workflow test's first two steps
+WORKFLOW_MUTATION = """
+mutation Workflow($save: SaveAgentStateInput!, $generate: GenerateCopilotResponseInput!) {
+    saveResult: saveAgentState(data: $save) {
+        success
+        stateKey
+    }
+    generateResult: generateCopilotResponse(data: $generate) {
+        threadId
+        status
+    }
+}
+"""
+
+# Fixed state payloads, encoded once at import
+SAVE_STATE = {"counter": 10, "status": "active"}
+SAVE_STATE_JSON = json.dumps(SAVE_STATE)
+
+WORKFLOW_STATE = {"workflow_step": "started", "data": {"user_input": "Hello"}}
+WORKFLOW_STATE_JSON = json.dumps(WORKFLOW_STATE)
 
 
 class TestGraphQLTestClient:
@@ -50,59 +144,86 @@ class TestGraphQLTestClient:
         )
 
 
-@pytest.fixture
-async def mock_runtime():
-    """Create a mock CopilotRuntime for testing."""
-    runtime = AsyncMock(spec=CopilotRuntime)
-
-    # Mock agent discovery
-    test_agents = [
-        AgentDescriptor(
-            name="test-agent-1",
-            description="Test agent 1",
-            version="1.0.0",
-            capabilities=["chat", "search"],
-        ),
-        AgentDescriptor(
-            name="test-agent-2",
-            description="Test agent 2",
-            version="2.0.0",
-            capabilities=["analysis"],
-        ),
-    ]
-    runtime.discover_agents.return_value = test_agents
-    runtime.list_providers.return_value = ["langgraph", "openai"]
-
-    # Mock state management
-    test_state_metadata = StateMetadata(
-        created_at=datetime.datetime.utcnow(),
-        updated_at=datetime.datetime.utcnow(),
+# Canned runtime data, built once at import and shared by every test
+TEST_TIMESTAMP = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+TEST_AGENTS = [
+    AgentDescriptor(
+        name="test-agent-1",
+        description="Test agent 1",
+        version="1.0.0",
+        capabilities=["chat", "search"],
+    ),
+    AgentDescriptor(
+        name="test-agent-2",
+        description="Test agent 2",
+        version="2.0.0",
+        capabilities=["analysis"],
+    ),
+]
+
+TEST_STORED_STATE = StoredState(
+    state_key="test:thread:agent",
+    data={"test_key": "test_value", "counter": 42},
+    metadata=StateMetadata(
+        created_at=TEST_TIMESTAMP,
+        updated_at=TEST_TIMESTAMP,
         version=1,
         size_bytes=256,
         checksum="test-checksum",
-    )
+    ),
+)
 
-    test_stored_state = StoredState(
-        state_key="test:thread:agent",
-        data={"test_key": "test_value", "counter": 42},
-        metadata=test_state_metadata,
-    )
+TEST_REQUEST_CONTEXT = RuntimeContext(thread_id="test-thread-123", user_id="test-user")
 
-    runtime.load_agent_state.return_value = test_stored_state
-    runtime.save_agent_state.return_value = test_stored_state
-    runtime.delete_agent_state.return_value = True
-    runtime.clear_thread_state.return_value = 2
 
-    # Mock request context management
-    runtime.create_request_context.return_value = MagicMock()
-    runtime.complete_request_context.return_value = None
+class _FakeRuntime:
+    """
+    Lightweight stand-in for CopilotRuntime.
 
-    # Mock state store manager
-    mock_state_store = AsyncMock(spec=StateStoreManager)
+    Exposes only the methods the resolvers call, as plain AsyncMocks;
+    AsyncMock(spec=CopilotRuntime) introspects every runtime attribute.
+    """
 
-    runtime._state_store_manager = mock_state_store
+    def __init__(self):
+        self.reset()
 
-    return runtime
+    def reset(self):
+        """Restore the canned return values and drop recorded calls."""
+        # Mock agent discovery
+        self.discover_agents = AsyncMock(return_value=TEST_AGENTS)
+        self.list_providers = AsyncMock(return_value=["langgraph", "openai"])
+
+        # Mock state management
+        self.load_agent_state = AsyncMock(return_value=TEST_STORED_STATE)
+        self.load_agent_states = AsyncMock(side_effect=self._load_each)
+        self.save_agent_state = AsyncMock(return_value=TEST_STORED_STATE)
+        self.delete_agent_state = AsyncMock(return_value=True)
+        self.clear_thread_state = AsyncMock(return_value=2)
+
+        # Mock request context management
+        self.create_request_context = AsyncMock(return_value=TEST_REQUEST_CONTEXT)
+        self.complete_request_context = AsyncMock(return_value=None)
+
+        # Mock state store manager
+        self._state_store_manager = AsyncMock()
+
+    async def _load_each(self, requests):
+        """Serve batched loads through load_agent_state, like the store default."""
+        return [await self.load_agent_state(thread_id, agent) for thread_id, agent in requests]
+
+
+@pytest.fixture(scope="module")
+def mock_runtime():
+    """Create a fake CopilotRuntime, shared by the module (see reset_mock_runtime)."""
+    return _FakeRuntime()
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_runtime(mock_runtime):
+    """Clear call records and per-test overrides (side effects, return values)."""
+    yield
+    mock_runtime.reset()
 
 
 @pytest.fixture
@@ -132,115 +253,127 @@ class TestGraphQLSchema:
 
     def test_schema_introspection(self):
         """Test GraphQL schema introspection."""
-        from agui_runtime.runtime_py.graphql.schema import get_schema_sdl
-
         sdl = get_schema_sdl()
         assert sdl is not None
         assert "type Query" in sdl
         assert "type Mutation" in sdl
         assert "availableAgents" in sdl
         assert "generateCopilotResponse" in sdl
+        # Printed once and reused
+        assert get_schema_sdl() is sdl
 
     def test_schema_compatibility_validation(self):
         """Test schema compatibility validation."""
-        from agui_runtime.runtime_py.graphql.schema import validate_schema_compatibility
-
         # This should pass for now (placeholder implementation)
         assert validate_schema_compatibility() is True
 
+    @pytest.mark.asyncio
+    async def test_document_caching(self, graphql_client):
+        """Test repeated query documents are parsed and validated once."""
+        parser_cache = next(e for e in schema.extensions if isinstance(e, ParserCache))
+        validation_cache = next(e for e in schema.extensions if isinstance(e, ValidationCache))
+        query = "query CacheProbe { availableAgents { agents { name } } }"
+
+        await graphql_client.query(query)
+        parse_hits = parser_cache.cached_parse_document.cache_info().hits
+        validate_hits = validation_cache.cached_validate_document.cache_info().hits
+
+        result = await graphql_client.query(query)
+
+        assert result.errors is None
+        assert parser_cache.cached_parse_document.cache_info().hits == parse_hits + 1
+        assert validation_cache.cached_validate_document.cache_info().hits == validate_hits + 1
+
 
 class TestGraphQLTypes:
     """Test GraphQL type definitions and serialization."""
 
     def test_message_role_enum(self):
         """Test MessageRole enum values."""
-        from agui_runtime.runtime_py.graphql.schema import MessageRole
-
-        expected_values = {"user", "assistant", "system", "tool", "developer"}
-        actual_values = {role.value for role in MessageRole}
-        assert actual_values == expected_values
+        assert frozenset(role.value for role in MessageRole) == MESSAGE_ROLE_VALUES
 
     def test_message_status_enum(self):
         """Test MessageStatus enum values."""
-        from agui_runtime.runtime_py.graphql.schema import MessageStatus
-
-        expected_values = {"pending", "inProgress", "completed", "failed", "cancelled"}
-        actual_values = {status.value for status in MessageStatus}
-        assert actual_values == expected_values
-
-    def test_input_types_creation(self):
-        """Test that all input types can be created with valid data."""
-        from agui_runtime.runtime_py.graphql.schema import (
-            LoadAgentStateInput,
-            SaveAgentStateInput,
-            MetadataInput,
-            StreamingConfigInput,
-            GenerateCopilotResponseInput,
-            MessageInput,
-            AgentSessionInput,
-        )
-
-        # Test LoadAgentStateInput
-        load_input = LoadAgentStateInput(
-            thread_id="test-thread-123",
-            agent_name="test-agent",
-            state_key="test-key",
-            include_history=True,
-        )
-        assert load_input.thread_id == "test-thread-123"
-        assert load_input.agent_name == "test-agent"
-        assert load_input.include_history is True
-
-        # Test SaveAgentStateInput
-        save_input = SaveAgentStateInput(
-            thread_id="test-thread-123",
-            agent_name="test-agent",
-            state_data='{"test": "data"}',
-            merge_with_existing=True,
-        )
-        assert save_input.thread_id == "test-thread-123"
-        assert save_input.state_data == '{"test": "data"}'
-
-        # Test StreamingConfigInput
-        streaming_input = StreamingConfigInput(
-            enabled=True,
-            buffer_size=2048,
-            flush_interval_ms=50,
-        )
-        assert streaming_input.enabled is True
-        assert streaming_input.buffer_size == 2048
-
-    def test_output_types_creation(self):
-        """Test that all output types can be created with valid data."""
-        from agui_runtime.runtime_py.graphql.schema import (
-            LoadAgentStateResponse,
-            SaveAgentStateResponse,
-            AgentExecutionResponse,
-            MessageStatus,
-        )
-
-        now = datetime.datetime.utcnow()
+        assert frozenset(status.value for status in MessageStatus) == MESSAGE_STATUS_VALUES
+
+    @pytest.mark.parametrize(
+        ("input_type", "kwargs", "expected"),
+        [
+            pytest.param(
+                LoadAgentStateInput,
+                {
+                    "thread_id": "test-thread-123",
+                    "agent_name": "test-agent",
+                    "state_key": "test-key",
+                    "include_history": True,
+                },
+                {
+                    "thread_id": "test-thread-123",
+                    "agent_name": "test-agent",
+                    "include_history": True,
+                },
+                id="LoadAgentStateInput",
+            ),
+            pytest.param(
+                SaveAgentStateInput,
+                {
+                    "thread_id": "test-thread-123",
+                    "agent_name": "test-agent",
+                    "state_data": '{"test": "data"}',
+                    "merge_with_existing": True,
+                },
+                {"thread_id": "test-thread-123", "state_data": '{"test": "data"}'},
+                id="SaveAgentStateInput",
+            ),
+            pytest.param(
+                StreamingConfigInput,
+                {"enabled": True, "buffer_size": 2048, "flush_interval_ms": 50},
+                {"enabled": True, "buffer_size": 2048},
+                id="StreamingConfigInput",
+            ),
+        ],
+    )
+    def test_input_types_creation(self, input_type, kwargs, expected):
+        """Test that each input type can be created with valid data."""
+        instance = input_type(**kwargs)
+
+        for field, value in expected.items():
+            assert getattr(instance, field) == value
+
+    @pytest.mark.parametrize(
+        ("output_type", "kwargs", "expected"),
+        [
+            pytest.param(
+                LoadAgentStateResponse,
+                {
+                    "thread_id": "test-thread-123",
+                    "agent_name": "test-agent",
+                    "state_data": '{"loaded": true}',
+                    "state_found": True,
+                    "last_updated": TEST_TIMESTAMP,
+                },
+                {"state_found": True, "state_data": '{"loaded": true}'},
+                id="LoadAgentStateResponse",
+            ),
+            pytest.param(
+                SaveAgentStateResponse,
+                {
+                    "thread_id": "test-thread-123",
+                    "agent_name": "test-agent",
+                    "success": True,
+                    "saved_at": TEST_TIMESTAMP,
+                },
+                {"success": True, "saved_at": TEST_TIMESTAMP},
+                id="SaveAgentStateResponse",
+            ),
+        ],
+    )
+    def test_output_types_creation(self, output_type, kwargs, expected):
+        """Test that each output type can be created with valid data."""
+        instance = output_type(**kwargs)
 
-        # Test LoadAgentStateResponse
-        load_response = LoadAgentStateResponse(
-            thread_id="test-thread-123",
-            agent_name="test-agent",
-            state_data='{"loaded": true}',
-            state_found=True,
-            last_updated=now,
-        )
-        assert load_response.state_found is True
-        assert load_response.state_data == '{"loaded": true}'
-
-        # Test SaveAgentStateResponse
-        save_response = SaveAgentStateResponse(
-            thread_id="test-thread-123",
-            agent_name="test-agent",
-            success=True,
-            saved_at=now,
-        )
-        assert save_response.success is True
-        assert save_response.saved_at == now
+        for field, value in expected.items():
+            assert getattr(instance, field) == value
 
 
 class TestGraphQLQueries:
@@ -249,20 +382,7 @@ class TestGraphQLQueries:
     @pytest.mark.asyncio
     async def test_available_agents_query(self, graphql_client, mock_runtime):
         """Test availableAgents query resolver."""
-        query = """
-        query {
-            availableAgents {
-                agents {
-                    name
-                    description
-                    version
-                    capabilities
-                }
-            }
-        }
-        """
-
-        result = await graphql_client.query(query)
+        result = await graphql_client.query(AVAILABLE_AGENTS_QUERY)
 
         assert result.errors is None
         assert "availableAgents" in result.data
@@ -279,19 +399,6 @@ class TestGraphQLQueries:
     @pytest.mark.asyncio
     async def test_load_agent_state_query(self, graphql_client, mock_runtime):
         """Test loadAgentState query resolver."""
-        query = """
-        query LoadAgentState($data: LoadAgentStateInput!) {
-            loadAgentState(data: $data) {
-                threadId
-                agentName
-                stateData
-                stateFound
-                lastUpdated
-                errorMessage
-            }
-        }
-        """
-
         variables = {
             "data": {
                 "threadId": "test-thread-123",
@@ -300,7 +407,7 @@ class TestGraphQLQueries:
             }
         }
 
-        result = await graphql_client.query(query, variables=variables)
+        result = await graphql_client.query(LOAD_AGENT_STATE_QUERY, variables=variables)
 
         assert result.errors is None
         state_data = result.data["loadAgentState"]
@@ -321,17 +428,6 @@ class TestGraphQLQueries:
         # Configure mock to return None (state not found)
         mock_runtime.load_agent_state.return_value = None
 
-        query = """
-        query LoadAgentState($data: LoadAgentStateInput!) {
-            loadAgentState(data: $data) {
-                threadId
-                agentName
-                stateFound
-                errorMessage
-            }
-        }
-        """
-
         variables = {
             "data": {
                 "threadId": "nonexistent-thread",
@@ -339,7 +435,7 @@ class TestGraphQLQueries:
             }
         }
 
-        result = await graphql_client.query(query, variables=variables)
+        result = await graphql_client.query(LOAD_AGENT_STATE_QUERY, variables=variables)
 
         assert result.errors is None
         state_data = result.data["loadAgentState"]
@@ -354,25 +450,6 @@ class TestGraphQLMutations:
     @pytest.mark.asyncio
     async def test_generate_copilot_response_mutation(self, graphql_client, mock_runtime):
         """Test generateCopilotResponse mutation resolver."""
-        mutation = """
-        mutation GenerateResponse($data: GenerateCopilotResponseInput!) {
-            generateCopilotResponse(data: $data) {
-                threadId
-                messages {
-                    __typename
-                    ... on Message {
-                        id
-                        role
-                        content
-                        status
-                    }
-                }
-                status
-                errorMessage
-            }
-        }
-        """
-
         variables = {
             "data": {
                 "messages": [
@@ -390,7 +467,7 @@ class TestGraphQLMutations:
             }
         }
 
-        result = await graphql_client.query(mutation, variables=variables)
+        result = await graphql_client.query(GENERATE_RESPONSE_MUTATION, variables=variables)
 
         assert result.errors is None
         response_data = result.data["generateCopilotResponse"]
@@ -408,30 +485,16 @@ class TestGraphQLMutations:
     @pytest.mark.asyncio
     async def test_save_agent_state_mutation(self, graphql_client, mock_runtime):
         """Test saveAgentState mutation resolver."""
-        mutation = """
-        mutation SaveAgentState($data: SaveAgentStateInput!) {
-            saveAgentState(data: $data) {
-                threadId
-                agentName
-                success
-                stateKey
-                savedAt
-                errorMessage
-            }
-        }
-        """
-
-        test_state = {"counter": 10, "status": "active"}
         variables = {
             "data": {
                 "threadId": "test-thread-123",
                 "agentName": "test-agent",
-                "stateData": json.dumps(test_state),
+                "stateData": SAVE_STATE_JSON,
                 "mergeWithExisting": True,
             }
         }
 
-        result = await graphql_client.query(mutation, variables=variables)
+        result = await graphql_client.query(SAVE_AGENT_STATE_MUTATION, variables=variables)
 
         assert result.errors is None
         save_data = result.data["saveAgentState"]
@@ -446,24 +509,13 @@ class TestGraphQLMutations:
         mock_runtime.save_agent_state.assert_called_once_with(
             "test-thread-123",
             "test-agent",
-            test_state,
+            SAVE_STATE,
             True
         )
 
     @pytest.mark.asyncio
     async def test_save_agent_state_invalid_json(self, graphql_client, mock_runtime):
         """Test saveAgentState mutation with invalid JSON."""
-        mutation = """
-        mutation SaveAgentState($data: SaveAgentStateInput!) {
-            saveAgentState(data: $data) {
-                threadId
-                agentName
-                success
-                errorMessage
-            }
-        }
-        """
-
         variables = {
             "data": {
                 "threadId": "test-thread-123",
@@ -473,7 +525,7 @@ class TestGraphQLMutations:
             }
         }
 
-        result = await graphql_client.query(mutation, variables=variables)
+        result = await graphql_client.query(SAVE_AGENT_STATE_MUTATION, variables=variables)
 
         assert result.errors is None
         save_data = result.data["saveAgentState"]
@@ -481,6 +533,26 @@ class TestGraphQLMutations:
         assert save_data["success"] is False
         assert "Invalid JSON" in save_data["errorMessage"] or "Failed to save state" in save_data["errorMessage"]
 
+    @pytest.mark.asyncio
+    async def test_save_agent_state_non_object_json(self, graphql_client, mock_runtime):
+        """Test saveAgentState mutation rejects JSON that is not an object."""
+        variables = {
+            "data": {
+                "threadId": "test-thread-123",
+                "agentName": "test-agent",
+                "stateData": "[1, 2, 3]",
+            }
+        }
+
+        result = await graphql_client.query(SAVE_AGENT_STATE_MUTATION, variables=variables)
+
+        assert result.errors is None
+        save_data = result.data["saveAgentState"]
+
+        assert save_data["success"] is False
+        assert "Invalid JSON" in save_data["errorMessage"]
+        mock_runtime.save_agent_state.assert_not_called()
+
 
 class TestGraphQLContext:
     """Test GraphQL execution context functionality."""
@@ -499,9 +571,9 @@ class TestGraphQLContext:
         assert context.is_authenticated is True
         assert len(context.correlation_id) > 0
 
-    def test_context_operation_logging(self, mock_runtime):
+    def test_context_operation_logging(self, graphql_context):
         """Test context operation logging."""
-        context = create_graphql_context(runtime=mock_runtime)
+        context = graphql_context
 
         context.log_operation("test_operation", "query", {"test": "data"})
 
@@ -511,9 +583,9 @@ class TestGraphQLContext:
         assert logged_op["operation_type"] == "query"
         assert logged_op["details"]["test"] == "data"
 
-    def test_context_performance_timing(self, mock_runtime):
+    def test_context_performance_timing(self, graphql_context):
         """Test context performance timing."""
-        context = create_graphql_context(runtime=mock_runtime)
+        context = graphql_context
 
         context.start_performance_timer("test_operation")
         duration = context.end_performance_timer("test_operation")
@@ -521,9 +593,9 @@ class TestGraphQLContext:
         assert duration >= 0.0
         assert "test_operation_duration" in context.performance_metrics
 
-    def test_context_metadata_management(self, mock_runtime):
+    def test_context_metadata_management(self, graphql_context):
         """Test context metadata management."""
-        context = create_graphql_context(runtime=mock_runtime)
+        context = graphql_context
 
         context.add_request_metadata("test_key", "test_value")
         value = context.get_request_metadata("test_key")
@@ -556,18 +628,7 @@ class TestGraphQLErrorHandling:
         # Configure mock to raise an exception
         mock_runtime.discover_agents.side_effect = Exception("Provider connection failed")
 
-        query = """
-        query {
-            availableAgents {
-                agents {
-                    name
-                    description
-                }
-            }
-        }
-        """
-
-        result = await graphql_client.query(query)
+        result = await graphql_client.query(AVAILABLE_AGENTS_QUERY)
 
         # Should return empty agents list instead of failing
         assert result.errors is None
@@ -578,20 +639,8 @@ class TestGraphQLErrorHandling:
     async def test_runtime_error_handling(self, graphql_client, mock_runtime):
         """Test runtime error handling in state operations."""
         # Configure mock to raise a state store error
-        from agui_runtime.runtime_py.storage.base import StorageError
         mock_runtime.load_agent_state.side_effect = StorageError("State store unavailable")
 
-        query = """
-        query LoadAgentState($data: LoadAgentStateInput!) {
-            loadAgentState(data: $data) {
-                threadId
-                agentName
-                stateFound
-                errorMessage
-            }
-        }
-        """
-
         variables = {
             "data": {
                 "threadId": "test-thread",
@@ -599,7 +648,7 @@ class TestGraphQLErrorHandling:
             }
         }
 
-        result = await graphql_client.query(query, variables=variables)
+        result = await graphql_client.query(LOAD_AGENT_STATE_QUERY, variables=variables)
 
         # Should handle the error gracefully
         assert result.errors is None
@@ -625,8 +674,6 @@ class TestGraphQLErrorHandling:
 
     def test_exception_mapping(self):
         """Test exception mapping to CopilotKitError."""
-        from agui_runtime.runtime_py.graphql.errors import map_exception_to_error
-
         # Test ValueError mapping
         value_error = ValueError("Invalid input value")
         mapped_error = map_exception_to_error(value_error, correlation_id="test-123")
@@ -642,71 +689,85 @@ class TestGraphQLErrorHandling:
         assert mapped_same is copilot_error
 
 
+class TestGraphQLBatching:
+    """Test per-request batching of runtime calls."""
+
+    @pytest.mark.asyncio
+    async def test_load_agent_state_fields_batched(self, graphql_client, mock_runtime):
+        """Test aliased loadAgentState fields share one runtime.load_agent_states call."""
+        aliases = [f"s{i}" for i in range(5)]
+        fields = "\n".join(
+            f'{alias}: loadAgentState(data: {{threadId: "thread-{alias}", agentName: "test-agent"}}) '
+            "{ stateFound }"
+            for alias in aliases
+        )
+
+        result = await graphql_client.query(f"query {{ {fields} }}")
+
+        assert result.errors is None
+        assert all(result.data[alias]["stateFound"] is True for alias in aliases)
+
+        mock_runtime.load_agent_states.assert_awaited_once_with(
+            [(f"thread-{alias}", "test-agent") for alias in aliases]
+        )
+
+    @pytest.mark.asyncio
+    async def test_load_agent_state_invalid_key_fails_alone(self, graphql_client, mock_runtime):
+        """Test an invalid key in a batch errors only its own loadAgentState field."""
+        result = await graphql_client.query(
+            """
+            query {
+                good: loadAgentState(data: {threadId: "thread-1", agentName: "test-agent"}) {
+                    stateFound
+                    errorMessage
+                }
+                bad: loadAgentState(data: {threadId: "bad thread!", agentName: "test-agent"}) {
+                    stateFound
+                    errorMessage
+                }
+            }
+            """
+        )
+
+        assert result.errors is None
+        assert result.data["good"] == {"stateFound": True, "errorMessage": None}
+        assert result.data["bad"]["stateFound"] is False
+        assert result.data["bad"]["errorMessage"]
+
+        mock_runtime.load_agent_states.assert_awaited_once_with([("thread-1", "test-agent")])
+
+
 class TestGraphQLIntegration:
     """Test end-to-end GraphQL integration scenarios."""
 
     @pytest.mark.asyncio
     async def test_complete_agent_workflow(self, graphql_client, mock_runtime):
         """Test a complete agent workflow: save state, generate response, load state."""
-        # Step 1: Save initial state
-        save_mutation = """
-        mutation SaveState($data: SaveAgentStateInput!) {
-            saveAgentState(data: $data) {
-                success
-                stateKey
-            }
-        }
-        """
-
-        initial_state = {"workflow_step": "started", "data": {"user_input": "Hello"}}
-        save_variables = {
-            "data": {
+        # Steps 1 and 2: save initial state, then generate a response. Mutation
+        # fields run serially, so one document keeps the order.
+        workflow_variables = {
+            "save": {
                 "threadId": "workflow-thread",
                 "agentName": "workflow-agent",
-                "stateData": json.dumps(initial_state),
-            }
-        }
-
-        save_result = await graphql_client.query(save_mutation, variables=save_variables)
-        assert save_result.errors is None
-        assert save_result.data["saveAgentState"]["success"] is True
-
-        # Step 2: Generate response
-        response_mutation = """
-        mutation GenerateResponse($data: GenerateCopilotResponseInput!) {
-            generateCopilotResponse(data: $data) {
-                threadId
-                status
-            }
-        }
-        """
-
-        response_variables = {
-            "data": {
+                "stateData": WORKFLOW_STATE_JSON,
+            },
+            "generate": {
                 "messages": [{"role": "USER", "content": "Process my request"}],
                 "agentSession": {
                     "threadId": "workflow-thread",
                     "agentName": "workflow-agent",
                 },
-            }
+            },
         }
 
-        response_result = await graphql_client.query(
-            response_mutation, variables=response_variables
+        workflow_result = await graphql_client.query(
+            WORKFLOW_MUTATION, variables=workflow_variables
         )
-        assert response_result.errors is None
-        assert response_result.data["generateCopilotResponse"]["status"] == "SUCCESS"
+        assert workflow_result.errors is None
+        assert workflow_result.data["saveResult"]["success"] is True
+        assert workflow_result.data["generateResult"]["status"] == "SUCCESS"
 
         # Step 3: Load state (verify it still exists)
-        load_query = """
-        query LoadState($data: LoadAgentStateInput!) {
-            loadAgentState(data: $data) {
-                stateFound
-                stateData
-            }
-        }
-        """
-
         load_variables = {
             "data": {
                 "threadId": "workflow-thread",
@@ -714,7 +775,7 @@ class TestGraphQLIntegration:
             }
         }
 
-        load_result = await graphql_client.query(load_query, variables=load_variables)
+        load_result = await graphql_client.query(LOAD_AGENT_STATE_QUERY, variables=load_variables)
         assert load_result.errors is None
         assert load_result.data["loadAgentState"]["stateFound"] is True
 
@@ -726,42 +787,58 @@ class TestGraphQLIntegration:
         mock_runtime.load_agent_state.assert_called()
 
     @pytest.mark.asyncio
-    async def test_concurrent_requests_handling(self, mock_runtime):
+    @pytest.mark.parametrize("client_count", [2, 16])
+    async def test_concurrent_requests_handling(self, mock_runtime, client_count):
         """Test handling of concurrent GraphQL requests."""
-        import asyncio
-
         # Create multiple clients with different contexts
-        context1 = create_graphql_context(runtime=mock_runtime, user_id="user1")
-        context2 = create_graphql_context(runtime=mock_runtime, user_id="user2")
-
-        client1 = TestGraphQLTestClient(schema, context1)
-        client2 = TestGraphQLTestClient(schema, context2)
-
-        # Execute concurrent queries
-        query = """
-        query {
-            availableAgents {
-                agents {
-                    name
-                }
-            }
-        }
-        """
-
+        clients = [
+            TestGraphQLTestClient(
+                schema, create_graphql_context(runtime=mock_runtime, user_id=f"user{i}")
+            )
+            for i in range(client_count)
+        ]
+
+        # Execute concurrent queries; any exception propagates out of gather
         results = await asyncio.gather(
-            client1.query(query),
-            client2.query(query),
-            return_exceptions=True,
+            *(client.query(AVAILABLE_AGENTS_QUERY) for client in clients)
         )
 
-        # Both requests should succeed
+        # All requests should succeed
         for result in results:
-            assert not isinstance(result, Exception)
             assert result.errors is None
             assert "availableAgents" in result.data
 
-        # Runtime should have been called twice
-        assert mock_runtime.discover_agents.call_count == 2
+        # Runtime should have been called once per request
+        assert mock_runtime.discover_agents.call_count == client_count
+
+    @pytest.mark.asyncio
+    async def test_concurrent_mixed_operations(self, graphql_client, mock_runtime):
+        """Test independent queries and mutations running concurrently on one context."""
+        load_variables = {"data": {"threadId": "test-thread-123", "agentName": "test-agent"}}
+        save_variables = {
+            "data": {
+                "threadId": "test-thread-123",
+                "agentName": "test-agent",
+                "stateData": SAVE_STATE_JSON,
+            }
+        }
+
+        agents_result, load_result, save_result = await asyncio.gather(
+            graphql_client.query(AVAILABLE_AGENTS_QUERY),
+            graphql_client.query(LOAD_AGENT_STATE_QUERY, variables=load_variables),
+            graphql_client.query(SAVE_AGENT_STATE_MUTATION, variables=save_variables),
+        )
+
+        assert agents_result.errors is None
+        assert len(agents_result.data["availableAgents"]["agents"]) == 2
+        assert load_result.errors is None
+        assert load_result.data["loadAgentState"]["stateFound"] is True
+        assert save_result.errors is None
+        assert save_result.data["saveAgentState"]["success"] is True
+
+        mock_runtime.discover_agents.assert_called_once()
+        mock_runtime.load_agent_state.assert_called_once_with("test-thread-123", "test-agent")
+        mock_runtime.save_agent_state.assert_called_once()
 
 
 if __name__ == "__main__":
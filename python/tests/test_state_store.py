@@ -8,10 +8,12 @@ memory backend implementation, state store manager, validation, and error handli
 import asyncio
 import datetime
 import json
+import math
+import pickle
 import pytest
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 from agui_runtime.runtime_py.storage import (
     StateStore,
@@ -34,10 +36,41 @@ from agui_runtime.runtime_py.storage import (
     validate_agent_name,
     serialize_state,
     deserialize_state,
+    serialize_state_bytes,
+    deserialize_state_bytes,
+    serialize_state_msgpack,
+    deserialize_state_msgpack,
+    serialize_state_compressed,
+    deserialize_state_compressed,
+    serialize_state_pickle,
+    deserialize_state_pickle,
+    serialize_state_pickle_frame,
+    deserialize_state_pickle_frame,
     generate_state_key,
+    generate_thread_key,
     create_storage_backend,
     create_state_store_manager,
 )
+from agui_runtime.runtime_py.storage.base import (
+    backend_existing_keys,
+    backend_mdelete,
+    backend_mget,
+    backend_mset,
+)
+
+
+class ZeroCopyByteArray(bytearray):
+    """bytearray that pickles out-of-band, like a contiguous numpy array."""
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self)._reconstruct, (pickle.PickleBuffer(self),), None
+        return type(self)._reconstruct, (bytearray(self),)
+
+    @classmethod
+    def _reconstruct(cls, obj):
+        with memoryview(obj) as m:
+            return cls(m)
 
 
 @pytest.fixture
@@ -126,6 +159,46 @@ class TestStorageBackend:
         exists_after_delete = await memory_backend.exists(test_key)
         assert exists_after_delete is False
 
+    @pytest.mark.asyncio
+    async def test_backend_batch_operations(self, memory_backend):
+        """Test mget/mset batch operations."""
+        await memory_backend.mset({"batch_a": b"value_a", "batch_b": b"value_b"})
+
+        values = await memory_backend.mget(["batch_a", "missing", "batch_b"])
+        assert values == [b"value_a", None, b"value_b"]
+
+        assert await memory_backend.mdelete(["batch_a", "missing"]) == 1
+        assert await memory_backend.mget(["batch_a", "batch_b"]) == [None, b"value_b"]
+
+        # Batch writes honor TTL like single writes
+        await memory_backend.mset({"batch_ttl": b"value"}, ttl_seconds=1)
+        await asyncio.sleep(1.1)
+        assert await memory_backend.mget(["batch_ttl"]) == [None]
+
+    @pytest.mark.asyncio
+    async def test_backend_batch_helpers_fallback(self):
+        """Test batch helpers on a backend without the optional batch methods."""
+
+        class MinimalBackend:
+            def __init__(self):
+                self.data = {}
+
+            async def get(self, key):
+                return self.data.get(key)
+
+            async def set(self, key, value, ttl_seconds=None):
+                self.data[key] = value
+
+            async def delete(self, key):
+                return self.data.pop(key, None) is not None
+
+        backend = MinimalBackend()
+        await backend_mset(backend, {"a": b"1", "b": b"2"})
+        assert await backend_mget(backend, ["a", "missing", "b"]) == [b"1", None, b"2"]
+        assert await backend_existing_keys(backend, ["a", "missing", "b"]) == ["a", "b"]
+        assert await backend_mdelete(backend, ["a", "missing"]) == 1
+        assert backend.data == {"b": b"2"}
+
     @pytest.mark.asyncio
     async def test_backend_ttl_expiration(self, memory_backend):
         """Test TTL expiration functionality."""
@@ -146,6 +219,20 @@ class TestStorageBackend:
         retrieved = await memory_backend.get(test_key)
         assert retrieved is None
 
+    @pytest.mark.asyncio
+    async def test_backend_ttl_reset_and_purge(self, memory_backend):
+        """Test re-setting a key replaces its expiry and purge drops due keys."""
+        await memory_backend.set("short_key", b"value", ttl_seconds=1)
+        await memory_backend.set("reset_key", b"value", ttl_seconds=1)
+        await memory_backend.set("reset_key", b"value", ttl_seconds=60)
+
+        await asyncio.sleep(1.1)
+        await memory_backend.purge_expired()
+
+        # Stale expiry entries for the re-set key are ignored
+        assert memory_backend.get_stats()["total_keys"] == 1
+        assert await memory_backend.get("reset_key") == b"value"
+
     @pytest.mark.asyncio
     async def test_backend_list_keys(self, memory_backend):
         """Test key listing with prefix filtering."""
@@ -195,6 +282,28 @@ class TestStorageBackend:
         finally:
             await small_backend.cleanup()
 
+    @pytest.mark.asyncio
+    async def test_backend_lru_eviction_order(self):
+        """Test that eviction removes the least recently used key first."""
+        small_backend = MemoryStorageBackend(max_size_mb=1)
+        value = b"x" * (400 * 1024)
+
+        try:
+            await small_backend.set("first", value)
+            await small_backend.set("second", value)
+
+            # Reading "first" makes "second" the least recently used key
+            assert await small_backend.get("first") == value
+            await small_backend.set("third", value)
+
+            assert await small_backend.exists("first")
+            assert not await small_backend.exists("second")
+            assert await small_backend.exists("third")
+            assert small_backend.get_stats()["eviction_count"] == 1
+
+        finally:
+            await small_backend.cleanup()
+
     @pytest.mark.asyncio
     async def test_backend_health_check(self, memory_backend):
         """Test backend health check functionality."""
@@ -345,6 +454,48 @@ class TestStateStore:
         assert set(agent_threads) == set(threads)
         assert agent_threads == sorted(threads)  # Should be sorted
 
+    @pytest.mark.asyncio
+    async def test_list_index_pruning_and_import(self, memory_state_store, sample_state_data):
+        """Test that listings drop states the backend lost and survive an import."""
+        for thread in ["thread1", "thread2"]:
+            await memory_state_store.save_agent_state(thread, "indexed_agent", sample_state_data)
+
+        # Remove a key behind the store's back, as TTL expiry or eviction would
+        await memory_state_store.backend.delete(
+            memory_state_store.generate_state_key("thread1", "indexed_agent")
+        )
+
+        assert await memory_state_store.list_agent_threads("indexed_agent") == ["thread2"]
+        assert await memory_state_store.list_thread_agents("thread1") == []
+
+        exported = await memory_state_store.export_states()
+        restored = MemoryStateStore(max_size_mb=10, default_ttl_seconds=3600)
+        try:
+            await restored.import_states(exported)
+            assert await restored.list_agent_threads("indexed_agent") == ["thread2"]
+            assert await restored.list_thread_agents("thread2") == ["indexed_agent"]
+        finally:
+            await restored.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_index_follows_backend_expiry(self, sample_state_data):
+        """Test that expired keys leave the reverse indexes and direct writes join them."""
+        store = MemoryStateStore(max_size_mb=10, default_ttl_seconds=1)
+        try:
+            await store.save_agent_state("ttl_thread", "ttl_agent", sample_state_data)
+            assert store._thread_agents == {"ttl_thread": {"ttl_agent"}}
+
+            await asyncio.sleep(1.1)
+            await store._memory_backend.purge_expired()
+
+            assert store._thread_agents == {}
+            assert store._agent_threads == {}
+
+            await store.backend.set(store.generate_state_key("raw_thread", "raw_agent"), b"{}")
+            assert await store.list_thread_agents("raw_thread") == ["raw_agent"]
+        finally:
+            await store.cleanup()
+
     @pytest.mark.asyncio
     async def test_clear_thread_state(self, memory_state_store, sample_state_data):
         """Test clearing all state for a thread."""
@@ -422,6 +573,27 @@ class TestStateStore:
         finally:
             await limited_store.cleanup()
 
+    @pytest.mark.asyncio
+    async def test_thread_state_limits_batch(self):
+        """Test that a batch save respects thread limits like sequential saves."""
+        limited_store = MemoryStateStore(max_states_per_thread=2)
+
+        try:
+            thread_id = "limited_batch_thread"
+            await limited_store.save_agent_state(thread_id, "agent0", {"id": 0})
+
+            results = await limited_store.save_agent_states(
+                [(thread_id, f"agent{i}", {"id": i}) for i in range(5)]
+            )
+
+            # Only the last two written are saved and returned
+            assert [result.data for result in results] == [{"id": 3}, {"id": 4}]
+            assert await limited_store.list_thread_agents(thread_id) == ["agent3", "agent4"]
+            assert await limited_store.load_agent_state(thread_id, "agent0") is None
+
+        finally:
+            await limited_store.cleanup()
+
 
 class TestStateStoreManager:
     """Test StateStoreManager functionality."""
@@ -446,6 +618,68 @@ class TestStateStoreManager:
         # Cleanup
         await manager.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_manager_compression(self, sample_state_data):
+        """Test enable_compression stores states with the compressed codec."""
+        manager = StateStoreManager(
+            config=StateStoreConfig(backend_type=StorageBackendType.MEMORY, enable_compression=True)
+        )
+        await manager.initialize()
+        try:
+            await manager.save_agent_state("zstd_thread", "zstd_agent", sample_state_data)
+
+            state_key = manager._store.generate_state_key("zstd_thread", "zstd_agent")
+            raw = await manager._store.backend.get(state_key)
+            assert raw[0] in (0x00, 0x01)
+
+            loaded = await manager.load_agent_state("zstd_thread", "zstd_agent")
+            assert loaded.data == sample_state_data
+        finally:
+            await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_manager_pickle_codec(self):
+        """Test the pickle codec stores states with out-of-band buffers."""
+        manager = StateStoreManager(
+            config=StateStoreConfig(
+                backend_type=StorageBackendType.MEMORY, codec="pickle", trust_pickle=True
+            )
+        )
+        await manager.initialize()
+        try:
+            state_data = {"step": "embed", "tensor": ZeroCopyByteArray(b"\x00\x01" * 1024)}
+            await manager.save_agent_state("pickle_thread", "pickle_agent", state_data)
+
+            state_key = manager._store.generate_state_key("pickle_thread", "pickle_agent")
+            raw = await manager._store.backend.get(state_key)
+            assert int.from_bytes(raw[:4], "big") == 1  # One out-of-band buffer
+
+            loaded = await manager.load_agent_state("pickle_thread", "pickle_agent")
+            assert loaded.data == state_data
+        finally:
+            await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_manager_pickle_codec_requires_trust(self):
+        """Test the pickle codec is rejected unless trust_pickle is set."""
+        manager = StateStoreManager(
+            config=StateStoreConfig(backend_type=StorageBackendType.MEMORY, codec="pickle")
+        )
+        with pytest.raises(StorageError, match="requires trust_pickle=True"):
+            await manager.initialize()
+
+        trusted_only = StateStoreManager(
+            config=StateStoreConfig(backend_type=StorageBackendType.MEMORY, trust_pickle=True)
+        )
+        await trusted_only.initialize()
+        try:
+            await trusted_only.save_agent_state("json_thread", "json_agent", {"step": 1})
+            state_key = trusted_only._store.generate_state_key("json_thread", "json_agent")
+            raw = await trusted_only._store.backend.get(state_key)
+            assert json.loads(raw)["data"] == {"step": 1}
+        finally:
+            await trusted_only.shutdown()
+
     @pytest.mark.asyncio
     async def test_manager_state_operations(self, state_store_manager, sample_state_data):
         """Test state operations through manager."""
@@ -544,6 +778,23 @@ class TestStateStoreManager:
         metrics = state_store_manager.get_metrics()
         assert metrics["cache_hits"] >= 1 or metrics["cache_misses"] >= 1
 
+    @pytest.mark.asyncio
+    async def test_manager_cache_bounded(self, state_store_manager, sample_state_data):
+        """Test that the metadata cache evicts its least recently used entry."""
+        state_store_manager._cache_max_entries = 2
+        for agent_name in ["agent1", "agent2", "agent3"]:
+            await state_store_manager.save_agent_state(
+                "bounded_thread", agent_name, sample_state_data
+            )
+
+        # agent1 was evicted, agent3 is still cached
+        await state_store_manager.get_state_metadata("bounded_thread", "agent1")
+        await state_store_manager.get_state_metadata("bounded_thread", "agent3")
+
+        metrics = state_store_manager.get_metrics()
+        assert metrics["cache_misses"] == 1
+        assert metrics["cache_hits"] == 1
+
     @pytest.mark.asyncio
     async def test_manager_bulk_operations(self, state_store_manager):
         """Test bulk state operations."""
@@ -563,6 +814,55 @@ class TestStateStoreManager:
         assert len(loaded_states) == 2
         assert all(state is not None for state in loaded_states)
 
+    @pytest.mark.asyncio
+    async def test_manager_bulk_save_skips_dropped_states(self, state_store_manager):
+        """Test states dropped by the thread limit are not returned or cached."""
+        state_store_manager._store.max_states_per_thread = 2
+
+        stored_states = await state_store_manager.bulk_save_states(
+            [("dropped_thread", f"agent{i}", {"id": i}) for i in range(3)]
+        )
+
+        assert [state.data for state in stored_states] == [{"id": 1}, {"id": 2}]
+        assert "dropped_thread:agent0" not in state_store_manager._metadata_cache
+        assert await state_store_manager.get_state_metadata("dropped_thread", "agent0") is None
+        assert await state_store_manager.get_state_metadata("dropped_thread", "agent2") is not None
+
+    @pytest.mark.asyncio
+    async def test_manager_bulk_operations_batch_backend(self, state_store_manager):
+        """Test bulk operations hit the backend with one batched call."""
+        await state_store_manager.save_agent_state("batch_thread", "agent1", {"step": 1})
+
+        backend = state_store_manager._store.backend
+        with (
+            patch.object(backend, "mget", wraps=backend.mget) as mget,
+            patch.object(backend, "mset", wraps=backend.mset) as mset,
+            patch.object(backend, "set", wraps=backend.set) as single_set,
+        ):
+            stored_states = await state_store_manager.bulk_save_states(
+                [
+                    ("batch_thread", "agent1", {"done": True}),
+                    ("batch_thread", "agent2", {"step": 1}),
+                    ("batch_thread", "agent2", {"step": 2}),
+                ]
+            )
+            assert mget.await_count == 1
+            assert mset.await_count == 1
+            single_set.assert_not_awaited()
+
+            loaded = await state_store_manager.bulk_load_states(
+                [("batch_thread", "agent1"), ("batch_thread", "agent2"), ("batch_thread", "none")]
+            )
+            assert mget.await_count == 2
+
+        # Existing and repeated keys merge like sequential saves
+        assert stored_states[0].data == {"step": 1, "done": True}
+        assert stored_states[0].metadata.version == 2
+        assert stored_states[2].metadata.version == 2
+        assert loaded[0].data == {"step": 1, "done": True}
+        assert loaded[1].data == {"step": 2}
+        assert loaded[2] is None
+
 
 class TestStateValidation:
     """Test state validation functionality."""
@@ -575,7 +875,7 @@ class TestStateValidation:
             assert validate_thread_id(thread_id) is True
 
         # Invalid thread IDs
-        invalid_ids = ["", None, "a" * 256, "thread with spaces", "thread@invalid"]
+        invalid_ids = ["", None, "a" * 256, "thread with spaces", "thread@invalid", "thread\n"]
         for thread_id in invalid_ids:
             assert validate_thread_id(thread_id) is False
 
@@ -587,7 +887,7 @@ class TestStateValidation:
             assert validate_agent_name(name) is True
 
         # Invalid agent names
-        invalid_names = ["", None, "a" * 101, "agent with spaces", "agent@invalid"]
+        invalid_names = ["", None, "a" * 101, "agent with spaces", "agent@invalid", "agent\n"]
         for name in invalid_names:
             assert validate_agent_name(name) is False
 
@@ -646,6 +946,16 @@ class TestErrorHandling:
         with pytest.raises(StorageError):
             await memory_state_store.save_agent_state("thread", "agent", invalid_state)
 
+    @pytest.mark.asyncio
+    async def test_default_codec_round_trip(self, memory_state_store, sample_state_data):
+        """Test stores default to the package JSON codec and flag corrupt bytes."""
+        encoded = memory_state_store.serialize_state(sample_state_data)
+        assert encoded == serialize_state_bytes(sample_state_data)
+        assert memory_state_store.deserialize_state(encoded) == deserialize_state_bytes(encoded)
+
+        with pytest.raises(StateCorruptionError):
+            memory_state_store.deserialize_state(b"not json {")
+
     def test_error_types(self):
         """Test different error types."""
         # StorageError
@@ -679,6 +989,148 @@ class TestUtilityFunctions:
         deserialized = deserialize_state(serialized)
         assert deserialized == test_data
 
+    def test_state_bytes_serialization(self):
+        """Test bytes-level state serialization utilities."""
+        test_data = {"key": "välue", "number": 42, "nested": {"a": [1, 2, 3]}}
+
+        serialized = serialize_state_bytes(test_data)
+        assert isinstance(serialized, bytes)
+        assert deserialize_state_bytes(serialized) == test_data
+
+        # String form must stay compatible with the bytes form
+        assert deserialize_state(serialize_state(test_data)) == test_data
+
+        # Invalid payloads keep the ValueError contract
+        with pytest.raises(ValueError, match="Invalid state JSON"):
+            deserialize_state_bytes(b"{not json")
+        with pytest.raises(ValueError, match="Invalid state JSON"):
+            deserialize_state("{not json")
+
+        # Only JSON objects are valid state
+        with pytest.raises(ValueError, match="Invalid state JSON"):
+            deserialize_state_bytes(b"[1, 2, 3]")
+
+    def test_state_bytes_serialization_matches_stdlib(self):
+        """Test the fast encoder keeps every value the stdlib encoder keeps."""
+        test_data = {
+            "big": 2**70,
+            "nan": float("nan"),
+            "inf": [float("inf"), float("-inf")],
+            "none": None,
+            "when": datetime.datetime(2024, 1, 2, 3, 4, 5),
+        }
+
+        decoded = json.loads(serialize_state_bytes(test_data))
+        assert decoded["big"] == 2**70
+        assert math.isnan(decoded["nan"])
+        assert decoded["inf"] == [float("inf"), float("-inf")]
+        assert decoded["none"] is None
+        assert decoded["when"] == str(test_data["when"])
+
+    @pytest.mark.parametrize("has_msgspec", [True, False])
+    def test_state_bytes_deserialization_fallbacks(self, monkeypatch, has_msgspec):
+        """Test the msgspec and stdlib decode paths keep the same contract."""
+        from agui_runtime.runtime_py import storage
+
+        monkeypatch.setattr(storage, "_HAS_MSGSPEC", has_msgspec and storage._HAS_MSGSPEC)
+
+        assert deserialize_state_bytes(b'{"key": [1, 2]}') == {"key": [1, 2]}
+        assert math.isnan(deserialize_state_bytes(b'{"nan": NaN}')["nan"])
+        assert deserialize_state_bytes(b'{"big": 1180591620717411303424}') == {"big": 2**70}
+        with pytest.raises(ValueError, match="Invalid state JSON"):
+            deserialize_state_bytes(b"{not json")
+        with pytest.raises(ValueError, match="expected object, got list"):
+            deserialize_state_bytes(b"[1, 2, 3]")
+
+    @pytest.mark.parametrize(
+        "state_data",
+        [
+            {"nan": float("nan"), "inf": [float("inf"), float("-inf")]},
+            {"big": 2**70, "negative": -(2**80)},
+            {"when": datetime.datetime(2024, 1, 2, 3, 4, 5), "text": "välue", "none": None},
+            {"nested": {"a": [1, 2.5, True, {"b": None}]}},
+        ],
+        ids=["non_finite", "wide_ints", "datetime", "nested"],
+    )
+    def test_default_codec_reads_stdlib_payloads(self, state_data):
+        """Test the default store codec round-trips payloads written by stdlib json."""
+        store = MemoryStateStore()
+        stdlib_bytes = json.dumps(state_data, default=str, ensure_ascii=False).encode("utf-8")
+
+        # Compare as stdlib text so NaN compares equal to itself
+        expected = json.dumps(json.loads(stdlib_bytes), sort_keys=True)
+        decoded = store.deserialize_state(stdlib_bytes)
+        assert json.dumps(decoded, sort_keys=True) == expected
+
+        reencoded = store.serialize_state(decoded)
+        assert json.dumps(store.deserialize_state(reencoded), sort_keys=True) == expected
+
+    @pytest.mark.parametrize("has_xxhash", [True, False])
+    def test_state_checksum(self, monkeypatch, has_xxhash):
+        """Test state checksums are stable and differ for different payloads."""
+        from agui_runtime.runtime_py.storage import memory
+
+        monkeypatch.setattr(memory, "_HAS_XXHASH", has_xxhash and memory._HAS_XXHASH)
+
+        checksum = memory._state_checksum(b'{"key": 1}')
+        assert checksum == memory._state_checksum(b'{"key": 1}')
+        assert checksum != memory._state_checksum(b'{"key": 2}')
+
+    def test_state_msgpack_serialization(self):
+        """Test length-prefixed MessagePack state serialization."""
+        test_data = {"key": "value", "number": 42, "nested": {"a": [1, 2, 3]}}
+
+        frame = serialize_state_msgpack(test_data)
+        assert isinstance(frame, bytes)
+        assert int.from_bytes(frame[:4], "big") == len(frame) - 4
+        assert deserialize_state_msgpack(frame) == test_data
+
+        # Truncated frames are rejected
+        with pytest.raises(ValueError, match="Invalid state msgpack"):
+            deserialize_state_msgpack(frame[:-1])
+        with pytest.raises(ValueError, match="Invalid state msgpack"):
+            deserialize_state_msgpack(b"\x00")
+
+    def test_state_compressed_serialization(self):
+        """Test zstd-compressed msgpack serialization of small and large states."""
+        small_state = {"key": "value"}
+        large_state = {"history": ["the same message again"] * 1000}
+
+        small_blob = serialize_state_compressed(small_state)
+        assert small_blob[0] == 0x00  # Stored raw below the threshold
+        assert deserialize_state_compressed(small_blob) == small_state
+
+        large_blob = serialize_state_compressed(large_state)
+        assert large_blob[0] == 0x01  # Compressed above the threshold
+        assert len(large_blob) < len(serialize_state_msgpack(large_state))
+        assert deserialize_state_compressed(large_blob) == large_state
+
+        with pytest.raises(ValueError, match="unknown flag"):
+            deserialize_state_compressed(b"\x7f" + small_blob[1:])
+        with pytest.raises(ValueError, match="Invalid compressed state"):
+            deserialize_state_compressed(b"\x01not zstd")
+
+    def test_state_pickle_serialization(self):
+        """Test pickle protocol 5 serialization with out-of-band buffers."""
+        tensor = ZeroCopyByteArray(bytes(range(256)) * 64)
+        test_data = {"key": "value", "tensor": tensor}
+
+        main, buffers = serialize_state_pickle(test_data)
+        assert len(buffers) == 1
+        assert buffers[0].nbytes == len(tensor)
+        assert len(main) < len(tensor)  # Large field stays out of the main stream
+        assert deserialize_state_pickle(main, buffers) == test_data
+
+        frame = serialize_state_pickle_frame(test_data)
+        assert deserialize_state_pickle_frame(frame) == test_data
+
+        with pytest.raises(ValueError, match="Invalid state pickle"):
+            deserialize_state_pickle(main)  # Missing out-of-band buffers
+        with pytest.raises(ValueError, match="Invalid state pickle"):
+            deserialize_state_pickle_frame(frame[:10])
+        with pytest.raises(ValueError, match="expected dict"):
+            deserialize_state_pickle(serialize_state_pickle([1, 2])[0])
+
     def test_key_generation(self):
         """Test key generation utilities."""
         thread_id = "test_thread"
@@ -689,6 +1141,9 @@ class TestUtilityFunctions:
         expected_state_key = f"copilotkit:state:{thread_id}:{agent_name}"
         assert state_key == expected_state_key
 
+        # Thread key
+        assert generate_thread_key(thread_id) == f"copilotkit:thread:{thread_id}"
+
     def test_storage_backend_creation(self):
         """Test storage backend factory functions."""
         # Create memory backend
@@ -699,6 +1154,68 @@ class TestUtilityFunctions:
         with pytest.raises(ValueError, match="not available"):
             create_storage_backend("nonexistent")
 
+        # Invalid codec
+        with pytest.raises(ValueError, match="codec 'bogus' not available"):
+            create_storage_backend("memory", codec="bogus")
+
+        # Pickle must be explicitly trusted
+        with pytest.raises(ValueError, match="requires trust_pickle=True"):
+            create_storage_backend("memory", codec="pickle")
+        assert isinstance(
+            create_storage_backend("memory", codec="pickle", trust_pickle=True), MemoryStateStore
+        )
+
+    def test_storage_backend_import_failure(self, monkeypatch):
+        """Test unresolvable backends raise ImportError and are not cached."""
+        from agui_runtime.runtime_py import storage
+
+        broken_path = "agui_runtime.runtime_py.storage.memory:DoesNotExist"
+        monkeypatch.setitem(storage.STORAGE_BACKENDS, "broken", broken_path)
+
+        with pytest.raises(ImportError, match="Failed to import storage backend 'broken'"):
+            create_storage_backend("broken")
+        assert broken_path not in storage._BACKEND_CACHE
+
+        # Successful lookups are cached by import path
+        create_storage_backend("memory", max_size_mb=1)
+        assert storage._BACKEND_CACHE[storage.STORAGE_BACKENDS["memory"]] is MemoryStateStore
+
+    @pytest.mark.asyncio
+    async def test_storage_backend_msgpack_codec(self, sample_state_data):
+        """Test a store created with the msgpack codec round-trips state."""
+        store = create_storage_backend("memory", codec="msgpack", max_size_mb=5)
+        try:
+            await store.save_agent_state("codec_thread", "codec_agent", sample_state_data)
+
+            raw = await store.backend.get(store.generate_state_key("codec_thread", "codec_agent"))
+            assert int.from_bytes(raw[:4], "big") == len(raw) - 4
+
+            loaded = await store.load_agent_state("codec_thread", "codec_agent")
+            assert loaded is not None
+            assert loaded.data == sample_state_data
+        finally:
+            await store.cleanup()
+
+    def test_lazy_exports(self, monkeypatch):
+        """Test PEP 562 lazy exports resolve on first access and are cached."""
+        from agui_runtime.runtime_py import storage
+
+        monkeypatch.setitem(
+            storage._LAZY_EXPORTS,
+            "LazyMemoryStateStore",
+            "agui_runtime.runtime_py.storage.memory:MemoryStateStore",
+        )
+        monkeypatch.delitem(vars(storage), "LazyMemoryStateStore", raising=False)
+
+        assert "LazyMemoryStateStore" in dir(storage)
+        assert storage.LazyMemoryStateStore is MemoryStateStore
+        assert vars(storage)["LazyMemoryStateStore"] is MemoryStateStore
+
+        monkeypatch.delitem(vars(storage), "LazyMemoryStateStore")
+
+        with pytest.raises(AttributeError, match="has no attribute 'DoesNotExist'"):
+            _ = storage.DoesNotExist
+
     def test_state_store_manager_creation(self):
         """Test state store manager factory."""
         # Create with memory backend
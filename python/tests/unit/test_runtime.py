@@ -259,6 +259,20 @@ class TestCopilotRuntime:
         with pytest.raises(RuntimeError, match="Failed to discover agents"):
             await runtime.discover_agents()
 
+    @pytest.mark.asyncio
+    async def test_discover_agents_partial_provider_error(self, mock_agent):
+        """Test a failing provider doesn't hide agents from the others."""
+        runtime = CopilotRuntime()
+
+        error_provider = MockProvider("error_provider")
+        error_provider.list_agents = AsyncMock(side_effect=Exception("Provider error"))
+        runtime.add_provider(error_provider)
+        runtime.add_provider(MockProvider("provider1", [mock_agent]))
+
+        agents = await runtime.discover_agents()
+
+        assert [agent.name for agent in agents] == ["test_agent"]
+
     @pytest.mark.asyncio
     async def test_discover_agents_multiple_providers(self, mock_agent):
         """Test agent discovery with multiple providers."""
@@ -290,6 +304,21 @@ class TestCopilotRuntime:
         assert runtime._mounted_app == app
         assert runtime._mount_path == "/api/test"
 
+    def test_mount_to_fastapi_minimal(self, mock_provider):
+        """Test minimal mounting registers only the health endpoint."""
+        runtime = CopilotRuntime()
+        runtime.add_provider(mock_provider)
+        app = FastAPI()
+
+        runtime.mount_to_fastapi(app, path="/api/test", minimal=True)
+
+        paths = {route.path for route in app.routes}
+        assert "/api/test/health" in paths
+        assert "/api/test/info" not in paths
+        assert "/api/test/graphql" not in paths
+        assert app.user_middleware == []
+        assert runtime._mounted_app == app
+
     def test_mount_to_fastapi_already_mounted(self, mock_provider):
         """Test mounting to FastAPI when already mounted raises error."""
         runtime = CopilotRuntime()
@@ -313,6 +342,13 @@ class TestCopilotRuntime:
         assert runtime._mounted_app == app
         assert runtime._mount_path == "/api/copilotkit"
 
+    def test_standalone_app_created_once(self):
+        """Test the standalone app factory reuses the app built at import."""
+        from agui_runtime.runtime_py.app import main
+
+        assert main.create_app() is main.app
+        assert main.runtime._mounted_app is main.app
+
     @pytest.mark.asyncio
     async def test_start_runtime(self, mock_provider):
         """Test runtime startup."""
@@ -345,6 +381,20 @@ class TestCopilotRuntime:
 
         assert mock_provider.cleaned_up is True
 
+    @pytest.mark.asyncio
+    async def test_load_agent_states(self):
+        """Test several agent states load through one batched call."""
+        async with CopilotRuntime() as runtime:
+            await runtime.save_agent_state("batch-thread", "agent1", {"step": 1})
+            await runtime.save_agent_state("batch-thread", "agent2", {"step": 2})
+
+            loaded = await runtime.load_agent_states(
+                [("batch-thread", "agent1"), ("batch-thread", "agent2"), ("batch-thread", "none")]
+            )
+
+        assert [state.data for state in loaded[:2]] == [{"step": 1}, {"step": 2}]
+        assert loaded[2] is None
+
     def test_repr(self, mock_provider):
         """Test string representation of runtime."""
         runtime = CopilotRuntime()
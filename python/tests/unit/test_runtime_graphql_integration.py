@@ -18,6 +18,7 @@ from agui_runtime.runtime_py.app.runtime_mount import (
     GraphQLContext,
     get_graphql_context,
     create_graphql_router,
+    get_playground_html,
     mount_graphql_to_fastapi,
     setup_graphql_middleware,
 )
@@ -215,6 +216,22 @@ class TestGraphQLRouterCreation:
             kwargs = mock_router_class.call_args[1]
             assert kwargs["graphql_ide"] is None
 
+    def test_routers_share_compiled_schema(self):
+        """Test routers for different runtimes reuse the module-level schema."""
+        router_a = create_graphql_router(CopilotRuntime(), "/graphql", True)
+        router_b = create_graphql_router(CopilotRuntime(), "/graphql", False)
+
+        assert router_a.schema is schema
+        assert router_b.schema is schema
+
+    def test_playground_html_cached_per_path(self):
+        """Test the playground page is rendered once per endpoint path."""
+        html = get_playground_html("/cached-graphql")
+
+        assert "endpoint: '/cached-graphql'" in html
+        assert get_playground_html("/cached-graphql") is html
+        assert get_playground_html("/other-graphql") is not html
+
 
 class TestGraphQLMounting:
     """Test GraphQL mounting to FastAPI applications."""